@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+from fastapi.testclient import TestClient
+from app.main import app
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.processing.data_manager import load_dataset
+
+
+def payloads(n_rows: int) -> tuple:
+    """The same records as a row-object body and as a columnar body."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_dataset(file_name=config.app_config_.training_data_file)
+    records = data[config.model_config_.features].head(n_rows).astype(object)
+    columns = {name: records[name].tolist() for name in records.columns}
+    return {"inputs": records.to_dict(orient="records")}, {"inputs": columns}
+
+
+def measure(client: TestClient, body: dict, repeats: int) -> np.ndarray:
+    """Posts the body to /predict repeatedly and returns the per-request latencies in milliseconds."""
+    latencies = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        response = client.post("/api/v1/predict", json=body)
+        latencies[i] = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/predict latency and throughput for row and columnar request bodies.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000], help="Rows per request")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed requests per size and body format")
+    args = parser.parse_args()
+
+    with TestClient(app) as client, contextlib.redirect_stdout(io.StringIO()) as log:
+        results = []
+        for n_rows in args.sizes:
+            rows, columns = payloads(n_rows)
+
+            # Both formats must return the same list of predictions before they are timed
+            expected = client.post("/api/v1/predict", json=rows).json()["predictions"]
+            assert len(expected) == n_rows
+            assert client.post("/api/v1/predict", json=columns).json()["predictions"] == expected
+
+            for name, body in (("rows", rows), ("columnar", columns)):
+                latencies = measure(client, body, args.repeats)
+                results.append((n_rows, name, np.percentile(latencies, 50), n_rows / np.median(latencies) * 1000))
+
+    print(f"{'rows':>8}  {'body':<10}{'p50 ms':>10}{'rows/s':>12}")
+    for n_rows, name, p50, throughput in results:
+        print(f"{n_rows:>8}  {name:<10}{p50:>10.2f}{throughput:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import argparse
+import json
+import time
+import msgpack
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app import schemas
+from app.serialization import MsgpackResponse, NumpyORJSONResponse, _columnar_frame, input_frame
+
+# One policy record, repeated to the benchmark's batch size
+record = {
+    "id": 1,
+    "Gender": "Male",
+    "Age": 44,
+    "Driving_License": 1,
+    "Region_Code": 28.0,
+    "Previously_Insured": 0,
+    "Vehicle_Age": "> 2 Years",
+    "Vehicle_Damage": "Yes",
+    "Annual_Premium": 40454.0,
+    "Policy_Sales_Channel": 26.0,
+    "Vintage": 217,
+}
+
+
+def measure(func, repeats: int) -> float:
+    """Median latency of func in milliseconds."""
+    func()
+    latencies = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        func()
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return float(np.median(latencies))
+
+
+def previous_decode(body: bytes) -> pd.DataFrame:
+    """Request decoding before the fast path: stdlib JSON, Pydantic per record, jsonable_encoder, DataFrame."""
+    input_data = schemas.MultipleDataInputs.model_validate(json.loads(body))
+    return pd.DataFrame(jsonable_encoder(input_data.inputs))
+
+
+def previous_encode(results: dict) -> bytes:
+    """Response encoding before the fast path: arrays to lists, response model, jsonable_encoder, stdlib JSON."""
+    content = {**results, "probabilities": results["probabilities"].tolist(), "predictions": results["predictions"].tolist()}
+    return JSONResponse(jsonable_encoder(schemas.ProbabilityResults(**content))).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Request decoding and response encoding cost of the API body formats.")
+    parser.add_argument("--rows", type=int, default=1000, help="Records per request")
+    parser.add_argument("--repeats", type=int, default=200, help="Timed calls per codec")
+    args = parser.parse_args()
+
+    rows = [dict(record, id=i) for i in range(args.rows)]
+    columns = {name: [row[name] for row in rows] for name in record}
+    rng = np.random.default_rng(0)
+    results = {
+        "errors": None,
+        "version": "0.0.1",
+        "threshold": 0.5,
+        "probabilities": rng.random(args.rows),
+        "predictions": rng.integers(0, 2, args.rows),
+        "top_k": None,
+    }
+
+    # Every decoder must produce the same frame before it is timed
+    json_rows = json.dumps({"inputs": rows}).encode()
+    json_columns = orjson.dumps({"inputs": columns})
+    msgpack_columns = msgpack.packb({"inputs": columns})
+    expected = previous_decode(json_rows)
+    pd.testing.assert_frame_equal(_columnar_frame(orjson.loads(json_columns)["inputs"])[expected.columns], expected, check_dtype=False)
+
+    decoders = {
+        "previous: json + pydantic rows": lambda: previous_decode(json_rows),
+        "pydantic rows + from_records": lambda: input_frame(schemas.MultipleDataInputs.model_validate(orjson.loads(json_rows))),
+        "orjson columnar": lambda: _columnar_frame(orjson.loads(json_columns)["inputs"]),
+        "msgpack columnar": lambda: _columnar_frame(msgpack.unpackb(msgpack_columns)["inputs"]),
+    }
+    encoders = {
+        "previous: jsonable_encoder + json": lambda: previous_encode(results),
+        "orjson numpy": lambda: NumpyORJSONResponse(results).body,
+        "msgpack": lambda: MsgpackResponse(results).body,
+    }
+
+    print(f"{args.rows} rows per request")
+    print(f"{'decode request':<40}{'p50 ms':>10}")
+    for name, func in decoders.items():
+        print(f"{name:<40}{measure(func, args.repeats):>10.3f}")
+    print(f"{'encode response':<40}{'p50 ms':>10}{'bytes':>10}")
+    for name, func in encoders.items():
+        print(f"{name:<40}{measure(func, args.repeats):>10.3f}{len(func()):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and this directory (for synthetic) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(parent))
+import argparse
+import os
+import subprocess
+import time
+import httpx
+import orjson
+from synthetic import synthetic_policies
+
+
+def wait_for_server(url: str, timeout: float = 60.0) -> None:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            if httpx.get(f"{url}/api/v1/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError("The API did not start")
+
+
+def post_stream(url: str, lines: list, chunk_lines: int) -> tuple:
+    """Streams the NDJSON lines in chunks; returns seconds to the first result line, to the last one, and the lines received."""
+    def body():
+        for i in range(0, len(lines), chunk_lines):
+            yield b"".join(lines[i:i + chunk_lines])
+
+    start = time.perf_counter()
+    first, received = None, 0
+    with httpx.stream("POST", f"{url}/api/v1/predict/stream", content=body(), timeout=300,
+                      headers={"content-type": "application/x-ndjson"}) as response:
+        for line in response.iter_lines():
+            if line:
+                first = first or time.perf_counter() - start
+                received += 1
+    return first, time.perf_counter() - start, received
+
+
+def post_columnar(url: str, records) -> float:
+    body = {"inputs": {name: records[name].tolist() for name in records.columns}}
+    start = time.perf_counter()
+    response = httpx.post(f"{url}/api/v1/predict", content=orjson.dumps(body), timeout=300, headers={"content-type": "application/json"})
+    assert response.status_code == 200, response.text
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time to first and last prediction: NDJSON /predict/stream vs one /predict document.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Records per request")
+    parser.add_argument("--chunk-lines", type=int, default=1000, help="NDJSON lines per request body chunk")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    # A real server, so the request and response bodies are actually streamed
+    url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=root / "vehicleinsurance_api",
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(root), os.environ.get("PYTHONPATH")]))},
+    )
+    try:
+        wait_for_server(url)
+        print(f"{'rows':>8}  {'request':<22}{'first s':>10}{'last s':>10}")
+        for n_rows in args.rows:
+            records = synthetic_policies(n_rows).astype(object)
+            lines = [orjson.dumps(record) + b"\n" for record in records.to_dict(orient="records")]
+            first, last, received = post_stream(url, lines, args.chunk_lines)
+            assert received == n_rows
+            print(f"{n_rows:>8}  {'/predict/stream':<22}{first:>10.3f}{last:>10.3f}")
+            last = post_columnar(url, records)
+            print(f"{n_rows:>8}  {'/predict (columnar)':<22}{last:>10.3f}{last:>10.3f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
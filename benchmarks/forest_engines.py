@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from vehicleinsurance_model.config.core import DATASET_DIR, config
+from vehicleinsurance_model.registry import model_registry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Forest scoring time per batch size: sklearn vs the flat-array engines.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 10_000, 50_000], help="Rows per call")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed calls per engine and batch size")
+    args = parser.parse_args()
+
+    # Preprocess the training file once; only the forest evaluation is timed
+    data = pd.read_csv(DATASET_DIR / config.app_config_.training_data_file)[config.model_config_.features]
+    fused_pipe = model_registry.get_fused_pipeline()
+    X = fused_pipe.transform(data.head(max(args.batch_sizes)))
+    forest, flat_forest = model_registry.get_pipeline().steps[-1][1], model_registry.get_flat_forest()
+
+    engines = {"sklearn": lambda batch: forest.predict_proba(pd.DataFrame(batch, columns=fused_pipe.feature_names))}
+    for engine in ("numpy", "numba"):
+        try:
+            flat_forest.predict_proba(X[:1], engine=engine)  # Also compiles the Numba kernel
+        except ImportError:
+            continue
+        engines[engine] = lambda batch, engine=engine: flat_forest.predict_proba(batch, engine=engine)
+
+    print(f"{'rows':>8}" + "".join(f"{engine + ' ms':>14}" for engine in engines))
+    for batch_size in args.batch_sizes:
+        batch = X[:batch_size]
+        expected = engines["sklearn"](batch)
+        timings = []
+        for name, engine in engines.items():
+            assert np.array_equal(engine(batch), expected), f"{name} differs from sklearn"
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                engine(batch)
+            timings.append((time.perf_counter() - start) / args.repeats * 1000)
+        print(f"{batch_size:>8}" + "".join(f"{ms:>14.3f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
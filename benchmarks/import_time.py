@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import argparse
+import subprocess
+
+
+def import_time_ms(module: str) -> tuple:
+    """
+    Imports module in a fresh interpreter with -X importtime.
+    Returns the cumulative import time in milliseconds and the time of each of its direct imports.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, capture_output=True, text=True, check=True,
+    )
+
+    # Lines look like "import time:   self [us] | cumulative | imported package", nested imports
+    # are indented by two spaces per level and listed before the module that imported them
+    children, total_us = [], None
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == module:
+                total_us = int(cumulative)
+                break
+            children = []  # Direct imports of an unrelated top-level module
+        elif depth == 1:
+            children.append((name.strip(), int(cumulative) / 1000))
+
+    if total_us is None:
+        raise RuntimeError(f"{module} was not imported")
+    return total_us / 1000, sorted(children, key=lambda child: child[1], reverse=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold import time of the model package, checked against a budget.")
+    parser.add_argument("--module", default="vehicleinsurance_model.predict", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Fail when the import takes longer")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest direct imports to list")
+    args = parser.parse_args()
+
+    total_ms, children = import_time_ms(args.module)
+    print(f"{'import':<50}{'ms':>10}")
+    for name, ms in children[:args.top]:
+        print(f"{name:<50}{ms:>10.1f}")
+    print(f"\nimport {args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    if total_ms > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
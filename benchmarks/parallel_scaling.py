@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+import pandas as pd
+from vehicleinsurance_model.config.core import DATASET_DIR, config
+from vehicleinsurance_model.parallel import make_prediction_parallel, score_file_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parallel scoring throughput for 1/2/4/8 worker processes.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Number of rows to score")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to compare")
+    parser.add_argument("--file", action="store_true", help="Shard a CSV file across the workers instead of a DataFrame")
+    args = parser.parse_args()
+
+    # Replicate the training file up to the requested number of rows
+    data = pd.read_csv(DATASET_DIR / config.app_config_.training_data_file)[config.model_config_.features]
+    data = pd.concat([data] * (args.rows // len(data) + 1), ignore_index=True).head(args.rows)
+
+    work_dir = tempfile.TemporaryDirectory()
+    input_path, output_path = Path(work_dir.name) / "policies.csv", Path(work_dir.name) / "scored.csv"
+    if args.file:
+        data.to_csv(input_path, index=False)
+
+    baseline = None
+    print(f"{'workers':>8}{'seconds':>10}{'rows/s':>12}{'speedup':>10}")
+    for n_workers in args.workers:
+        # Silence the per-shard data_frame.info() output while timing
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            if args.file:
+                score_file_parallel(input_path=input_path, output_path=output_path, n_workers=n_workers)
+            else:
+                make_prediction_parallel(input_data=data, n_workers=n_workers)
+            elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(f"{n_workers:>8}{elapsed:>10.2f}{args.rows / elapsed:>12.0f}{baseline / elapsed:>10.2f}")
+    work_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from vehicleinsurance_model.predict import make_prediction, make_prediction_record
+
+# Single policy record used for the one-row latency comparison
+record = {
+    "id": 1,
+    "Gender": "Male",
+    "Age": 44,
+    "Driving_License": 1,
+    "Region_Code": 28.0,
+    "Previously_Insured": 0,
+    "Vehicle_Age": "> 2 Years",
+    "Vehicle_Damage": "Yes",
+    "Annual_Premium": 40454.0,
+    "Policy_Sales_Channel": 26.0,
+    "Vintage": 217,
+}
+
+
+def measure(func, repeats: int, warmup: int = 20) -> np.ndarray:
+    """Calls func repeatedly and returns the per-call latencies in milliseconds."""
+    for _ in range(warmup):
+        func()
+
+    latencies = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        func()
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-record prediction latency: DataFrame path vs record fast path.")
+    parser.add_argument("--repeats", type=int, default=500, help="Number of timed calls per path")
+    args = parser.parse_args()
+
+    # Both paths must agree before their speed is worth comparing
+    frame = pd.DataFrame([record])
+    assert make_prediction(input_data=frame)["predictions"][0] == make_prediction_record(record=record)["predictions"][0]
+
+    paths = {
+        "make_prediction (DataFrame)": lambda: make_prediction(input_data=pd.DataFrame([record])),
+        "make_prediction_record": lambda: make_prediction_record(record=record),
+    }
+
+    print(f"{'path':<30}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, func in paths.items():
+        latencies = measure(func, args.repeats)
+        print(f"{name:<30}{np.percentile(latencies, 50):>10.3f}{np.percentile(latencies, 99):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model), this directory (for synthetic) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(parent))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, Optional
+import numpy as np
+import sklearn
+from synthetic import synthetic_policies
+from vehicleinsurance_model import __version__ as _version
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.processing import data_manager
+from vehicleinsurance_model.processing.validation import validate_inputs
+from vehicleinsurance_model import registry
+from vehicleinsurance_model.registry import model_registry
+
+# Default location of the results, one JSON file per package version
+RESULTS_DIR = parent / "results"
+
+# Measures the import and unpickling of the pipeline in a fresh interpreter
+COLD_START = """
+import sys, time
+start = time.perf_counter()
+sys.path.append({root!r})
+from pathlib import Path
+from vehicleinsurance_model.processing import data_manager
+data_manager.TRAINED_MODEL_DIR = Path({model_dir!r})
+data_manager.load_pipeline(file_name={file_name!r})
+print(time.perf_counter() - start)
+"""
+
+
+@contextlib.contextmanager
+def trained_model_dir(path: Path) -> Iterator[None]:
+    """Saves and serves models from path instead of TRAINED_MODEL_DIR, leaving the real trained models untouched."""
+    saved = data_manager.TRAINED_MODEL_DIR, registry.TRAINED_MODEL_DIR
+    data_manager.TRAINED_MODEL_DIR = registry.TRAINED_MODEL_DIR = path
+    model_registry.clear()
+    try:
+        yield
+    finally:
+        data_manager.TRAINED_MODEL_DIR, registry.TRAINED_MODEL_DIR = saved
+        model_registry.clear()
+
+
+def measure(func: Callable[[], object], repeats: int, max_seconds: float, min_repeat_seconds: float = 0.2) -> dict:
+    """
+    Per-call wall times of func, timeit style.
+    Every repeat runs func `number` times, with number calibrated so a repeat lasts at least
+    min_repeat_seconds; repeats stop early once max_seconds have been spent (at least one runs).
+    """
+    start = time.perf_counter()
+    func()  # Warm-up call, also used for the calibration
+    first = time.perf_counter() - start
+    number = max(1, int(min_repeat_seconds / first)) if first > 0 else 1
+
+    times = []
+    spent = time.perf_counter() - start
+    for _ in range(repeats):
+        repeat_start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - repeat_start
+        times.append(elapsed / number)
+        spent += elapsed
+        if spent > max_seconds:
+            break
+    return {"number": number, "repeats": len(times), "times": times}
+
+
+def summarize(timing: dict, rows: Optional[int]) -> dict:
+    """Adds min, median, mean, standard deviation and (for row benchmarks) rows per second."""
+    times = timing["times"]
+    median = statistics.median(times)
+    return {
+        **timing,
+        "rows": rows,
+        "min": min(times),
+        "median": median,
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rows_per_second": rows / median if rows else None,
+    }
+
+
+class Suite:
+    """
+    The benchmark cases of the model package and the API on synthetic data.
+    The configured pipeline is trained on synthetic records into a temporary model directory
+    (timed as the run_training case) and every other case runs against that model.
+    """
+
+    def __init__(self, args: argparse.Namespace, model_dir: Path):
+        self.args = args
+        self.model_dir = model_dir
+        self.results: Dict[str, dict] = {}
+
+    def selected(self, name: str) -> bool:
+        return not self.args.filter or any(pattern in name for pattern in self.args.filter)
+
+    def record(self, name: str, timing: dict, rows: Optional[int] = None) -> None:
+        self.results[name] = summarize(timing, rows)
+        result = self.results[name]
+        print(f"{name:<64}{result['median'] * 1000:>12.3f} ms  (x{result['number']}, {result['repeats']} repeats)", flush=True)
+
+    def run(self, name: str, func: Callable[[], object], rows: Optional[int] = None, repeats: Optional[int] = None) -> None:
+        if self.selected(name):
+            self.record(name, measure(func, repeats or self.args.repeats, self.args.max_seconds), rows)
+
+    def train(self) -> None:
+        """Trains the model every other case uses; the first fit is timed as run_training."""
+        from vehicleinsurance_model.train_pipeline import run_training
+
+        data = synthetic_policies(self.args.train_rows, seed=1, with_target=True)
+        fit = lambda: run_training(use_cache=False, track_memory=False, data=data)
+        start = time.perf_counter()
+        fit()
+        timing = {"number": 1, "repeats": 1, "times": [time.perf_counter() - start]}
+        for _ in range(self.args.training_repeats - 1):
+            start = time.perf_counter()
+            fit()
+            timing["times"].append(time.perf_counter() - start)
+            timing["repeats"] += 1
+        self.record(f"run_training[{self.args.train_rows}]", timing, rows=self.args.train_rows)
+
+    def load_pipeline(self) -> None:
+        """Loading the pickled pipeline, in this process and cold in a fresh interpreter (imports included)."""
+        file_name = model_registry.pipeline_file_name
+        self.run("load_pipeline.warm", lambda: data_manager.load_pipeline(file_name=file_name))
+
+        name = "load_pipeline.cold_start"
+        if self.selected(name):
+            code = COLD_START.format(root=str(root), model_dir=str(self.model_dir), file_name=file_name)
+            times = [
+                float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+                for _ in range(self.args.cold_repeats)
+            ]
+            self.record(name, {"number": 1, "repeats": len(times), "times": times})
+
+    def validation(self) -> None:
+        for n_rows in self.args.sizes:
+            data = synthetic_policies(n_rows)
+            self.run(f"validate_inputs[{n_rows}]", lambda: validate_inputs(input_df=data), rows=n_rows)
+
+    def transformers(self) -> None:
+        """Each fitted preprocessing step on its own, fed the output of the steps before it."""
+        pipeline = model_registry.get_pipeline()
+        for n_rows in self.args.sizes:
+            X = validate_inputs(input_df=synthetic_policies(n_rows))[0]
+            for name, step in pipeline.steps[:-1]:
+                self.run(f"transform.{name}:{type(step).__name__}[{n_rows}]", lambda: step.transform(X), rows=n_rows)
+                X = step.transform(X)
+
+    def predict(self) -> None:
+        pipeline = model_registry.get_pipeline()
+        for n_rows in self.args.predict_sizes:
+            X = validate_inputs(input_df=synthetic_policies(n_rows))[0]
+            self.run(f"vehicleinsurance_pipe.predict[{n_rows}]", lambda: pipeline.predict(X), rows=n_rows)
+
+    def api(self) -> None:
+        """POST /api/v1/predict through FastAPI's TestClient, with row and columnar JSON bodies."""
+        if not any(self.selected(f"api.predict.{body}") for body in ("rows", "columnar")):
+            return
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        with TestClient(app) as client:
+            for n_rows in self.args.api_sizes:
+                records = synthetic_policies(n_rows).astype(object)
+                bodies = {
+                    "rows": {"inputs": records.to_dict(orient="records")},
+                    "columnar": {"inputs": {name: records[name].tolist() for name in records.columns}},
+                }
+                for body_name, body in bodies.items():
+                    def post(body=body):
+                        response = client.post("/api/v1/predict", json=body)
+                        assert response.status_code == 200, response.text
+
+                    self.run(f"api.predict.{body_name}[{n_rows}]", post, rows=n_rows)
+
+    def run_all(self) -> Dict[str, dict]:
+        self.train()
+        self.load_pipeline()
+        self.validation()
+        self.transformers()
+        self.predict()
+        self.api()
+        return self.results
+
+
+def machine_info() -> dict:
+    """Where the results were measured, to tell hardware and library changes from code changes."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "git_commit": commit,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> int:
+    """
+    Prints the median time of every case in both result files and flags the ones that got slower
+    by more than threshold (a fraction). Returns the number of regressions.
+    """
+    print(f"{'case':<64}{'baseline ms':>14}{'current ms':>14}{'ratio':>8}")
+    regressions = 0
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before, after = baseline["results"][name]["median"], result["median"]
+        ratio = after / before
+        flag = ""
+        if ratio > 1 + threshold:
+            flag, regressions = "  REGRESSION", regressions + 1
+        print(f"{name:<64}{before * 1000:>14.3f}{after * 1000:>14.3f}{ratio:>8.2f}{flag}")
+    print(f"{regressions} regression(s) beyond {threshold:.0%}: {baseline['version']} -> {current['version']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark suite of the model package and the API on synthetic data.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks and save the results as JSON")
+    run.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/<version>.json)")
+    run.add_argument("--filter", nargs="+", default=None, help="Only run the cases whose name contains one of these")
+    run.add_argument("--sizes", type=int, nargs="+", default=[10_000], help="Rows for the validation and transformer cases")
+    run.add_argument("--predict-sizes", type=int, nargs="+", default=[1, 100, 10_000, 1_000_000], help="Rows per pipeline.predict call")
+    run.add_argument("--api-sizes", type=int, nargs="+", default=[1, 100, 10_000], help="Rows per /predict request")
+    run.add_argument("--train-rows", type=int, default=100_000, help="Synthetic records the model is trained on")
+    run.add_argument("--training-repeats", type=int, default=1, help="Timed run_training calls")
+    run.add_argument("--cold-repeats", type=int, default=3, help="Fresh interpreters started for the cold start case")
+    run.add_argument("--repeats", type=int, default=7, help="Timed repeats per case")
+    run.add_argument("--max-seconds", type=float, default=20.0, help="Time budget per case; fewer repeats run once it is spent")
+    run.add_argument("--compare", type=Path, default=None, help="Results file to compare the new results with")
+    run.add_argument("--threshold", type=float, default=0.10, help="Slowdown flagged as a regression (0.10 = 10%%)")
+
+    diff = commands.add_parser("compare", help="Compare two saved results files")
+    diff.add_argument("baseline", type=Path)
+    diff.add_argument("current", type=Path)
+    diff.add_argument("--threshold", type=float, default=0.10, help="Slowdown flagged as a regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        current = json.loads(args.current.read_text())
+        sys.exit(1 if compare(json.loads(args.baseline.read_text()), current, args.threshold) else 0)
+
+    with tempfile.TemporaryDirectory(prefix="vehicleinsurance-benchmark-") as model_dir, trained_model_dir(Path(model_dir)):
+        results = Suite(args, Path(model_dir)).run_all()
+
+    current = {
+        "version": _version,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "settings": {name: value for name, value in vars(args).items() if name not in ("command", "output", "compare")},
+        "config": {"n_estimators": config.model_config_.N_ESTIMATORS, "max_depth": config.model_config_.MAX_DEPTH},
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{_version}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2, default=str))
+    print(f"Results saved to {output}")
+
+    if args.compare:
+        sys.exit(1 if compare(json.loads(args.compare.read_text()), current, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import numpy as np
+import pandas as pd
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.processing.validation import _schema_fields
+
+# Distributions of the numeric DataInputSchema fields, close to the ones of the training file:
+# ("uniform", low, high) draws integers in [low, high], ("bernoulli", p) 0/1 flags,
+# ("lognormal", mean, sigma) positive amounts. Categorical fields draw from their allowed values.
+NUMERIC_DISTRIBUTIONS = {
+    "Age": ("uniform", 20, 85),
+    "Driving_License": ("bernoulli", 0.998),
+    "Region_Code": ("uniform", 0, 52),
+    "Previously_Insured": ("bernoulli", 0.46),
+    "Annual_Premium": ("lognormal", 10.3, 0.45),
+    "Policy_Sales_Channel": ("uniform", 1, 163),
+    "Vintage": ("uniform", 10, 299),
+}
+
+
+def _numeric(rng: np.random.Generator, name: str, n_rows: int) -> np.ndarray:
+    kind, *params = NUMERIC_DISTRIBUTIONS[name]
+    if kind == "uniform":
+        return rng.integers(params[0], params[1] + 1, size=n_rows)
+    if kind == "bernoulli":
+        return (rng.random(n_rows) < params[0]).astype(np.int64)
+    return np.round(rng.lognormal(params[0], params[1], size=n_rows), 0)
+
+
+def synthetic_policies(n_rows: int, seed: int = 0, with_target: bool = False) -> pd.DataFrame:
+    """
+    Random policy records in the model's input schema, so benchmarks run without the private dataset.
+    Every field of DataInputSchema is generated: categorical ones from their allowed values,
+    numeric ones from NUMERIC_DISTRIBUTIONS, ids counting from 1. Every record passes validate_inputs.
+    With with_target, a Response column is added that depends on the features (uninsured
+    customers with a damaged vehicle respond far more often), so the forest has something to learn.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (kind, allowed) in _schema_fields().items():
+        if name == "id":
+            columns[name] = np.arange(1, n_rows + 1)
+        elif allowed is not None:
+            columns[name] = np.asarray(allowed, dtype=object)[rng.integers(0, len(allowed), size=n_rows)]
+        else:
+            values = _numeric(rng, name, n_rows)
+            columns[name] = values.astype(np.float64) if kind is float else values.astype(np.int64)
+    data = pd.DataFrame(columns)[config.model_config_.features]
+
+    if with_target:
+        damaged = data[config.model_config_.Vehicle_Damage_var].to_numpy() == "Yes"
+        logit = -3.0 + 2.5 * damaged - 3.0 * data["Previously_Insured"].to_numpy() + 0.02 * (data["Age"].to_numpy() - 40)
+        data[config.model_config_.target] = (rng.random(n_rows) < 1 / (1 + np.exp(-logit))).astype(np.int64)
+    return data
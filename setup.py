@@ -49,7 +49,7 @@ setup(
     packages=find_packages(exclude=("tests",)),
     package_data={"regression_model": ["VERSION"]},
     install_requires=list_reqs(),
-    extras_require={},
+    extras_require={"parquet": ["pyarrow"], "numba": ["numba"]},
     include_package_data=True,
     license="BSD-3",
     classifiers=[
@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from app.api import api_router
+from app.config import settings
+from vehicleinsurance_model.registry import model_registry
+
+ADMIN_CALLS = [
+    ("/api/v1/models/activate", {"version": "0.0.0-missing"}),
+    ("/api/v1/models/shadow", {"version": "0.0.0-missing", "percent": 10}),
+]
+
+
+class Client:
+    """Posts to the API router in process."""
+
+    def __init__(self):
+        self.app = FastAPI()
+        self.app.include_router(api_router, prefix=settings.API_V1_STR)
+
+    def post(self, path: str, **kwargs) -> httpx.Response:
+        async def post():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://test") as client:
+                return await client.post(path, **kwargs)
+        return asyncio.run(post())
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.mark.parametrize("path, body", ADMIN_CALLS)
+def test_admin_endpoints_are_disabled_without_a_token(client, monkeypatch, path, body):
+    # Given: No ADMIN_TOKEN configured (the default)
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    active = model_registry.active_version
+
+    # When
+    response = client.post(path, json=body, headers={"Authorization": "Bearer anything"})
+
+    # Then
+    assert response.status_code == 403
+    assert model_registry.active_version == active
+
+
+@pytest.mark.parametrize("path, body", ADMIN_CALLS)
+def test_admin_endpoints_require_the_token(client, monkeypatch, path, body):
+    # Given
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+
+    # When / Then: Missing and wrong tokens are rejected before the registry is touched
+    assert client.post(path, json=body).status_code == 401
+    assert client.post(path, json=body, headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    # And: The right token reaches the endpoint (an unknown version is a 404)
+    assert client.post(path, json=body, headers={"Authorization": "Bearer s3cret"}).status_code == 404
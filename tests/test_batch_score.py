@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from vehicleinsurance_model.batch_score import score_file
+from vehicleinsurance_model.predict import make_prediction
+
+
+def test_score_file_in_chunks(sample_input_data, tmp_path):
+    """Chunked file scoring must return the same predictions as a single make_prediction call."""
+
+    # Given: A CSV input file of raw records
+    records = sample_input_data[0].head(1000)
+    input_path = tmp_path / "policies.csv"
+    records.to_csv(input_path, index=False)
+
+    # When: Scoring it in small chunks with probabilities
+    output_path = tmp_path / "scored.csv"
+    summary = score_file(input_path=input_path, output_path=output_path, chunksize=300, proba=True)
+
+    # Then: Every row is scored once, in input order, with identical predictions
+    scored = pd.read_csv(output_path)
+    assert summary == {"chunks": 4, "rows": 1000, "invalid_rows": 0}
+    assert list(scored["id"]) == list(records["id"])
+    assert np.array_equal(scored["prediction"].to_numpy(), make_prediction(input_data=records)["predictions"])
+    assert scored["probability"].between(0, 1).all()
+
+
+def test_score_file_top_k(sample_input_data, tmp_path):
+    """The running top-k across chunks matches ranking all probabilities at once."""
+
+    # Given: A CSV input file of raw records
+    records = sample_input_data[0].head(1000)
+    input_path = tmp_path / "policies.csv"
+    records.to_csv(input_path, index=False)
+
+    # When: Scoring it in chunks with a top-20 ranking and without probabilities in the output
+    summary = score_file(input_path=input_path, output_path=tmp_path / "scored.csv", chunksize=300, top_k=20)
+
+    # Then: The 20 highest probabilities, highest first, and the output file is unchanged
+    everything = score_file(input_path=input_path, output_path=tmp_path / "all.csv", proba=True)
+    probabilities = pd.read_csv(tmp_path / "all.csv")["probability"].to_numpy()
+    assert np.allclose(summary["top_k"]["probability"], np.sort(probabilities)[::-1][:20])
+    assert list(pd.read_csv(tmp_path / "scored.csv").columns) == ["id", "prediction"]
+    assert everything == {"chunks": 1, "rows": 1000, "invalid_rows": 0}
+
+
+def test_score_file_skips_invalid_rows(sample_input_data, tmp_path):
+    """Invalid records go to the errors file with their row in the input; the rest is still scored."""
+
+    # Given: A Parquet input (batches restart their index) with invalid records in its second and third chunks
+    pytest.importorskip("pyarrow")
+    records = sample_input_data[0].head(900).reset_index(drop=True).astype({"Gender": str})
+    records.loc[[350, 700, 701], "Gender"] = "Unknown"
+    input_path = tmp_path / "policies.parquet"
+    records.to_parquet(input_path, index=False)
+
+    # When
+    summary = score_file(input_path=input_path, output_path=tmp_path / "scored.csv", chunksize=300, errors_path=tmp_path / "errors.csv")
+
+    # Then
+    assert summary == {"chunks": 3, "rows": 900, "invalid_rows": 3}
+    errors = pd.read_csv(tmp_path / "errors.csv")
+    assert list(errors["row"]) == [350, 700, 701]
+    assert list(errors["id"]) == list(records["id"].iloc[[350, 700, 701]])
+    assert json.loads(errors["errors"][0])[0]["loc"] == ["inputs", 350, "Gender"]
+    scored = pd.read_csv(tmp_path / "scored.csv")
+    valid = records.drop(index=[350, 700, 701])
+    assert list(scored["id"]) == list(valid["id"])
+    assert np.array_equal(scored["prediction"].to_numpy(), make_prediction(input_data=valid)["predictions"])
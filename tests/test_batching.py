@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import asyncio
+import json
+import numpy as np
+import pandas as pd
+from app.batching import PredictionBatcher
+
+
+def fake_predict(*, input_data: pd.DataFrame, scored: list, **options) -> dict:
+    """make_prediction-like callable: predicts the value column, errors on negative values."""
+    scored.append(len(input_data))
+    bad = np.flatnonzero(input_data["value"].to_numpy() < 0)
+    if len(bad):
+        errors = [{"loc": ["inputs", int(row), "value"], "msg": "negative"} for row in bad]
+        return {"predictions": None, "version": "test", "errors": json.dumps(errors)}
+    return {"predictions": input_data["value"].to_numpy() * 2.0, "version": "test", "errors": None}
+
+
+def submit_all(batcher: PredictionBatcher, frames: list) -> list:
+    """Submits every frame concurrently, in order, and returns each caller's results."""
+    async def run():
+        return await asyncio.gather(*(batcher.submit(frame) for frame in frames))
+    return asyncio.run(run())
+
+
+def make_batcher(scored: list, max_batch_size: int) -> PredictionBatcher:
+    return PredictionBatcher(fake_predict, max_batch_size=max_batch_size, max_wait_ms=50, predict_options=lambda: {"scored": scored})
+
+
+def frames_of(*sizes: int) -> list:
+    """Frames of the given numbers of rows, numbered on from each other."""
+    bounds = np.cumsum((0,) + sizes)
+    return [pd.DataFrame({"value": np.arange(start, end, dtype=float)}) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def test_concurrent_requests_are_merged_and_split_back_in_order():
+    # Given
+    scored = []
+    frames = frames_of(2, 1, 3)
+
+    # When
+    results = submit_all(make_batcher(scored, max_batch_size=6), frames)
+
+    # Then: One predict call for all the rows, and every caller gets its own rows' predictions
+    assert scored == [6]
+    for frame, result in zip(frames, results):
+        assert np.array_equal(result["predictions"], frame["value"].to_numpy() * 2.0)
+        assert result["errors"] is None
+
+
+def test_request_that_does_not_fit_is_carried_over_to_the_next_batch():
+    # Given: The third request would take the first batch past max_batch_size
+    scored = []
+    frames = frames_of(2, 3, 2, 1)
+
+    # When
+    results = submit_all(make_batcher(scored, max_batch_size=6), frames)
+
+    # Then: It opens the next batch instead
+    assert scored == [5, 3]
+    for frame, result in zip(frames, results):
+        assert np.array_equal(result["predictions"], frame["value"].to_numpy() * 2.0)
+
+
+def test_invalid_request_does_not_fail_the_others():
+    # Given: The second request has an invalid row
+    scored = []
+    frames = frames_of(2, 2, 2)
+    frames[1].loc[1, "value"] = -1.0
+
+    # When
+    results = submit_all(make_batcher(scored, max_batch_size=64), frames)
+
+    # Then: The merged batch fails validation, then every caller is scored alone
+    assert scored == [6, 2, 2, 2]
+    assert [error["loc"] for error in json.loads(results[1]["errors"])] == [["inputs", 1, "value"]]
+    assert results[1]["predictions"] is None
+    for position in (0, 2):
+        assert results[position]["errors"] is None
+        assert np.array_equal(results[position]["predictions"], frames[position]["value"].to_numpy() * 2.0)
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import numpy as np
+from vehicleinsurance_model import __version__ as _version
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.predict import make_prediction, vehicleinsurance_pipe
+from vehicleinsurance_model.processing.bundle import load_bundle, save_bundle
+
+
+def test_bundle_round_trip(sample_input_data, tmp_path):
+    """A memory-mapped model bundle must predict exactly like the pickled pipeline."""
+
+    # Given: The trained pipeline saved as a bundle
+    path = tmp_path / "model.bundle"
+    save_bundle(pipeline=vehicleinsurance_pipe, path=path, input_features=config.model_config_.features, model_version=_version)
+
+    # When: Loading it memory-mapped and scoring the test split
+    subject = load_bundle(path=path, mmap_mode="r")
+    records = sample_input_data[0]
+
+    # Then: Node arrays are memory-mapped and predictions are identical
+    assert isinstance(subject.estimator.threshold, np.memmap)
+    assert np.array_equal(subject.predict(records), make_prediction(input_data=records)["predictions"])
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import numpy as np
+import pandas as pd
+from vehicleinsurance_model.cache import PredictionCache
+from vehicleinsurance_model.predict import make_prediction
+from vehicleinsurance_model.registry import model_registry
+
+
+def test_prediction_cache_scores_only_misses(sample_input_data):
+    """Cached rows are served from the cache; only unseen rows reach the model."""
+
+    # Given: An empty cache and a batch whose second half repeats the first with new ids
+    cache = PredictionCache(max_entries=1000, ttl_seconds=None, registry=model_registry)
+    records = sample_input_data[0].head(200)
+    refreshed = records.head(100).assign(id=records["id"].head(100) + 10_000_000)
+    scored_rows = []
+
+    def predict(rows):
+        scored_rows.append(len(rows))
+        return model_registry.get_pipeline().predict(rows)
+
+    # When: Scoring the first half, then the whole batch plus the refreshed quotes
+    cache.predict(records.head(100), predict)
+    subject = cache.predict(pd.concat([records, refreshed]), predict)
+
+    # Then: Predictions are unchanged, the refreshed quotes hit, only the unseen rows were scored
+    expected = make_prediction(input_data=pd.concat([records, refreshed]))["predictions"]
+    assert np.array_equal(subject, expected)
+    assert scored_rows[1] <= 100
+    assert cache.stats()["hits"] == 200
+    assert np.array_equal(make_prediction(input_data=pd.concat([records, refreshed]), cache=True)["predictions"], expected)
+
+
+def test_prediction_cache_eviction_and_invalidation(sample_input_data):
+    """The cache stays bounded and is emptied when a new pipeline is loaded."""
+
+    cache = PredictionCache(max_entries=10, ttl_seconds=None, registry=model_registry)
+    records = sample_input_data[0].head(50)
+    cache.predict(records, model_registry.get_pipeline().predict)
+    assert cache.stats()["size"] == 10
+
+    # A new pipeline load bumps the registry generation
+    model_registry.generation += 1
+    try:
+        cache.predict(records.head(1), model_registry.get_pipeline().predict)
+    finally:
+        model_registry.generation -= 1
+    assert cache.stats()["size"] == 1
+    assert cache.stats()["misses"] == 51
+
+
+def test_prediction_cache_drops_rows_scored_across_a_model_swap(sample_input_data):
+    """Rows scored while a new pipeline is activated are not cached under the new generation."""
+
+    cache = PredictionCache(max_entries=100, ttl_seconds=None, registry=model_registry)
+    records = sample_input_data[0].head(20)
+
+    def predict_during_swap(rows):
+        model_registry.generation += 1  # registry.activate() completes while the old model scores
+        return model_registry.get_pipeline().predict(rows)
+
+    try:
+        cache.predict(records, predict_during_swap)
+        assert cache.stats()["size"] == 0
+
+        # Rows are keyed on the version that scored them
+        cache.predict(records, model_registry.get_pipeline().predict, model_version="0.0.0-other")
+        cache.predict(records, model_registry.get_pipeline().predict)
+        assert cache.stats()["hits"] == 0 and cache.stats()["size"] == 40
+    finally:
+        model_registry.generation -= 1
@@ -0,0 +1,154 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import asyncio
+import json
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import FastAPI
+from app.api import api_router
+from app.chunking import ChunkedPredictor, RequestCancelled
+from app.config import settings
+from app.executor import InferenceExecutor
+
+
+class FakeRequest:
+    """Stands in for a Starlette request whose client disconnects after a number of checks."""
+
+    def __init__(self, disconnect_after: int = None):
+        self.checks = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.disconnect_after is not None and self.checks > self.disconnect_after
+
+
+def fake_predict(*, input_data: pd.DataFrame, scored: list = None, **options) -> dict:
+    """make_prediction-like callable: predicts the value column, errors on negative values."""
+    if scored is not None:
+        scored.append(len(input_data))
+    bad = np.flatnonzero(input_data["value"].to_numpy() < 0)
+    if len(bad):
+        errors = [{"loc": ["inputs", int(row), "value"], "msg": "negative"} for row in bad]
+        return {"predictions": None, "version": "test", "errors": json.dumps(errors)}
+    return {"predictions": input_data["value"].to_numpy() * 2.0, "version": "test", "errors": None}
+
+
+def test_chunks_are_assembled_in_order():
+    # Given
+    chunked = ChunkedPredictor(InferenceExecutor(kind="inline"), chunk_rows=3)
+    frame = pd.DataFrame({"value": np.arange(10, dtype=float)})
+    scored = []
+
+    # When
+    results = asyncio.run(chunked.run(FakeRequest(), fake_predict, frame, scored=scored))
+
+    # Then
+    assert scored == [3, 3, 3, 1]
+    assert np.array_equal(results["predictions"], np.arange(10) * 2.0)
+    assert results["version"] == "test" and results["errors"] is None
+
+
+def test_disconnected_client_stops_scoring():
+    # Given: A client that goes away after its first chunk was scored
+    chunked = ChunkedPredictor(InferenceExecutor(kind="inline"), chunk_rows=3)
+    frame = pd.DataFrame({"value": np.arange(10, dtype=float)})
+    scored = []
+
+    # When / Then
+    with pytest.raises(RequestCancelled) as cancelled:
+        asyncio.run(chunked.run(FakeRequest(disconnect_after=1), fake_predict, frame, scored=scored))
+    assert cancelled.value.status_code == 499
+    assert scored == [3]
+    assert chunked.disconnected == 1
+
+
+def test_deadline_and_error_positions():
+    # Given
+    chunked = ChunkedPredictor(InferenceExecutor(kind="inline"), chunk_rows=3, timeout_seconds=5)
+    frame = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, -7.0]})
+
+    async def run(deadline_offset=None):
+        deadline = chunked.deadline() if deadline_offset is None else asyncio.get_running_loop().time() + deadline_offset
+        return await chunked.run(FakeRequest(), fake_predict, frame, deadline)
+
+    # When: One invalid row in the last chunk
+    results = asyncio.run(run())
+
+    # Then: Its position is the one in the whole request
+    assert [error["loc"] for error in json.loads(results["errors"])] == [["inputs", 6, "value"]]
+
+    # And: A request past its deadline is abandoned with 504
+    with pytest.raises(RequestCancelled) as cancelled:
+        asyncio.run(run(deadline_offset=-1))
+    assert cancelled.value.status_code == 504 and chunked.timed_out == 1
+
+
+def test_rest_of_request_is_validated_in_cancellable_chunks(monkeypatch):
+    # Given: An invalid row in the first chunk, and validation that reports negative values
+    validated = []
+
+    def fake_validation_errors(*, input_data):
+        validated.append(len(input_data))
+        return fake_predict(input_data=input_data)["errors"]
+
+    monkeypatch.setattr("app.chunking.validation_errors", fake_validation_errors)
+    chunked = ChunkedPredictor(InferenceExecutor(kind="inline"), chunk_rows=3)
+    frame = pd.DataFrame({"value": [-1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, -8.0, 9.0, 10.0]})
+
+    # When
+    results = asyncio.run(chunked.run(FakeRequest(), fake_predict, frame))
+
+    # Then: Every remaining chunk is validated on its own and every error keeps its position
+    assert validated == [3, 3, 1]
+    assert [error["loc"][1] for error in json.loads(results["errors"])] == [0, 7]
+
+    # And: A client leaving during validation stops it
+    validated.clear()
+    with pytest.raises(RequestCancelled):
+        asyncio.run(chunked.run(FakeRequest(disconnect_after=2), fake_predict, frame))
+    assert validated == [3]
+
+
+def test_empty_request_is_answered_without_scoring():
+    # Given
+    chunked = ChunkedPredictor(InferenceExecutor(kind="inline"), chunk_rows=3)
+    scored = []
+
+    # When
+    results = asyncio.run(chunked.run(FakeRequest(), fake_predict, pd.DataFrame({"value": []}), model_version="test", scored=scored))
+
+    # Then: No chunk reaches the model, which rejects empty matrices
+    assert scored == []
+    assert len(results["predictions"]) == 0 and results["version"] == "test" and results["errors"] is None
+
+
+@pytest.mark.parametrize("path, keys", [
+    ("/api/v1/predict", {"predictions": [], "errors": None}),
+    ("/api/v1/predict_proba", {"probabilities": [], "predictions": [], "errors": None, "top_k": None}),
+])
+def test_empty_request_gets_empty_predictions(monkeypatch, path, keys):
+    # Given: The API router, with micro-batching on so small requests would go to the batcher
+    monkeypatch.setattr(settings, "PREDICT_BATCHING", True)
+    app = FastAPI()
+    app.include_router(api_router, prefix=settings.API_V1_STR)
+
+    async def post():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(path, json={"inputs": []})
+
+    # When
+    response = asyncio.run(post())
+
+    # Then
+    assert response.status_code == 200
+    assert {key: response.json()[key] for key in keys} == keys
@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import pandas as pd
+import pytest
+from vehicleinsurance_model.config.core import DATASET_DIR
+from vehicleinsurance_model.processing import data_manager
+
+
+def test_dataset_cache(tmp_path, monkeypatch):
+    """The dataset is cached with compact dtypes and re-read when the source file changes."""
+    pytest.importorskip("pyarrow")
+
+    # Given: A copy of the first rows of the training data in a temporary dataset directory
+    source = pd.read_csv(DATASET_DIR / "data00.csv", nrows=500)
+    source.to_csv(tmp_path / "sample.csv", index=False)
+    monkeypatch.setattr(data_manager, "DATASET_DIR", tmp_path)
+    monkeypatch.setattr(data_manager, "DATASET_CACHE_DIR", tmp_path / "cache")
+
+    # When: Loading it twice
+    first = data_manager._load_raw_dataset(file_name="sample.csv")
+    cached = data_manager._load_raw_dataset(file_name="sample.csv")
+
+    # Then: Compact dtypes, one Feather copy, and the same values as the CSV
+    assert str(cached["Gender"].dtype) == "category" and cached["Age"].dtype == "int8"
+    assert len(list((tmp_path / "cache").glob("sample-*.feather"))) == 1
+    pd.testing.assert_frame_equal(first, cached)
+    pd.testing.assert_frame_equal(cached.astype(source.dtypes.to_dict()), source)
+
+    # When/Then: Editing the source invalidates the cached copy
+    source.head(100).to_csv(tmp_path / "sample.csv", index=False)
+    assert len(data_manager._load_raw_dataset(file_name="sample.csv")) == 100
+    assert len(list((tmp_path / "cache").glob("sample-*.feather"))) == 1
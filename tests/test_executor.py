@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import asyncio
+import threading
+import pytest
+from app.executor import ExecutorBusy, InferenceExecutor
+
+
+def test_abandoned_calls_hold_their_slot_until_the_work_finishes():
+    # Given: One worker and no queue, busy with a call whose caller gives up
+    executor = InferenceExecutor(kind="thread", workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario():
+        call = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        # Then: The work is still running, so the executor stays full
+        assert executor.in_flight == 1
+        with pytest.raises(ExecutorBusy):
+            await executor.run(lambda: None)
+
+        # And: Its slot is freed once it finishes
+        release.set()
+        for _ in range(100):
+            if executor.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
+        assert await executor.run(lambda: 42) == 42
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_process_workers_report_their_stage_timings(sample_input_data):
+    # Given
+    from vehicleinsurance_model.monitoring import inference_metrics
+    from vehicleinsurance_model.predict import FOREST_STAGE, make_prediction
+    executor = InferenceExecutor(kind="process", workers=1, max_queue=0)
+    before = inference_metrics._stage(FOREST_STAGE).snapshot()["count"]
+
+    # When: Scoring in a worker process
+    try:
+        results = asyncio.run(executor.run(make_prediction, input_data=sample_input_data[0].head(50)))
+    finally:
+        executor.shutdown()
+
+    # Then: The worker's forest timing is recorded in this process
+    assert len(results["predictions"]) == 50
+    assert inference_metrics._stage(FOREST_STAGE).snapshot()["count"] == before + 1
@@ -57,4 +57,85 @@ def test_gender_variable_mapper(sample_input_data):
 
     # Then: Verify that 'Male' is correctly mapped to numerical representation (1)
     assert subject.iloc[4]["Gender"] == 1, \
-        "Expected mapped Gender to be 1 after transformation."
\ No newline at end of file
+        "Expected mapped Gender to be 1 after transformation."
+
+def test_dtype_plan_compacts_pipeline_output(sample_input_data):
+    """The dtype plan stores the model matrix compactly without changing the predictions."""
+    import copy
+    from vehicleinsurance_model.registry import model_registry
+
+    pipeline = model_registry.get_pipeline()
+    X = sample_input_data[0][config.model_config_.features]
+
+    planned, unplanned = X, X
+    for _, step in pipeline.steps[:-1]:
+        planned = step.transform(planned)
+        step = copy.deepcopy(step)
+        step.dtypes = None
+        unplanned = step.transform(unplanned)
+
+    # Every planned column has its planned dtype in the final frame
+    for column, dtype in config.model_config_.dtype_plan.items():
+        assert planned[column].dtype == np.dtype(dtype)
+    assert planned.memory_usage(deep=True).sum() < unplanned.memory_usage(deep=True).sum()
+
+    forest = pipeline.steps[-1][1]
+    assert np.array_equal(forest.predict_proba(planned), forest.predict_proba(unplanned))
+
+
+@pytest.mark.parametrize("mode", ["sparse", "ordinal"])
+def test_encoder_modes_match_dense(sample_input_data, mode):
+    """Sparse one-hot holds the dense values without a dense block; ordinal keeps one code column per feature."""
+    from vehicleinsurance_model.processing.features import ColumnOneHotEncoder
+
+    X = sample_input_data[0]
+    variable = [config.model_config_.Region_Code_var, config.model_config_.Policy_Sales_Channel_var]
+    dense = ColumnOneHotEncoder(variable=variable).fit(X).transform(X)
+    subject = ColumnOneHotEncoder(variable=variable, mode=mode).fit(X).transform(X)
+
+    if mode == "sparse":
+        encoded = [name for name in subject.columns if name not in X.columns]
+        assert all(isinstance(subject[name].dtype, pd.SparseDtype) for name in encoded)
+        assert list(subject.columns) == list(dense.columns)
+        assert np.array_equal(subject[encoded].to_numpy(dtype=np.float64), dense[encoded].to_numpy(dtype=np.float64))
+        assert subject.memory_usage(deep=True).sum() < dense.memory_usage(deep=True).sum()
+    else:
+        assert list(subject.columns) == list(X.columns)
+        region = subject[variable[0]].to_numpy()
+        assert np.array_equal(np.sort(np.unique(region)), np.arange(X[variable[0]].nunique()))
+
+
+@pytest.mark.parametrize("mode", ["dense", "sparse", "ordinal"])
+def test_encoder_handle_unknown(sample_input_data, mode):
+    """Unseen categories raise by default and encode as all zeros / code -1 when ignored."""
+    from vehicleinsurance_model.processing.features import ColumnOneHotEncoder
+
+    X = sample_input_data[0]
+    unseen = X.head(3).copy()
+    unseen["Vehicle_Damage"] = "Maybe"
+    variable = [config.model_config_.Vehicle_Damage_var]
+
+    with pytest.raises(ValueError):
+        ColumnOneHotEncoder(variable=variable, mode=mode).fit(X).transform(unseen)
+
+    subject = ColumnOneHotEncoder(variable=variable, mode=mode, handle_unknown="ignore").fit(X).transform(unseen)
+    if mode == "ordinal":
+        assert (subject["Vehicle_Damage"] == -1).all()
+    else:
+        assert (subject[["Vehicle_Damage_No", "Vehicle_Damage_Yes"]].to_numpy(dtype=np.float64) == 0).all()
+
+
+def test_rename_columns_transformer(sample_input_data):
+    """Nothing is renamed by default; given names of the encoded columns, they are renamed and cast to int."""
+    from vehicleinsurance_model.processing.features import ColumnOneHotEncoder, RenameColumnsTransformer
+
+    X = sample_input_data[0]
+    encoded = ColumnOneHotEncoder(variable=[config.model_config_.Vehicle_Age_var]).fit(X).transform(X)
+
+    assert list(RenameColumnsTransformer().fit(encoded).transform(encoded).columns) == list(encoded.columns)
+
+    rename_map = {"Vehicle_Age_< 1 Year": "Vehicle_Age_lt_1_Year"}
+    subject = RenameColumnsTransformer(rename_map=rename_map, int_columns=["Vehicle_Age_lt_1_Year"]).fit(encoded).transform(encoded)
+    assert "Vehicle_Age_< 1 Year" not in subject.columns
+    assert subject["Vehicle_Age_lt_1_Year"].dtype.kind == "i"
+    assert np.array_equal(subject["Vehicle_Age_lt_1_Year"].to_numpy(), encoded["Vehicle_Age_< 1 Year"].to_numpy())
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import numpy as np
+import pytest
+from vehicleinsurance_model.predict import make_prediction, vehicleinsurance_fused_pipe, vehicleinsurance_pipe
+
+
+def test_fused_transform_matches_pipeline(sample_input_data):
+    """The fused single-pass transform must reproduce the step-by-step preprocessing bit-for-bit."""
+
+    # Given: The step-by-step output as the forest sees it (float32)
+    expected = sample_input_data[0]
+    for _, step in vehicleinsurance_pipe.steps[:-1]:
+        expected = step.transform(expected)
+    expected = expected.to_numpy(dtype=np.float32)
+
+    # When: Running the fused transform on the same raw input
+    subject = vehicleinsurance_fused_pipe.transform(sample_input_data[0])
+
+    # Then: Same dtype, same column order and identical values
+    assert subject.dtype == np.float32
+    assert vehicleinsurance_fused_pipe.feature_names == list(vehicleinsurance_pipe[-1].feature_names_in_)
+    assert np.array_equal(subject, expected, equal_nan=True), "Fused transform differs from the pipeline."
+
+
+def test_fused_prediction_matches_pipeline(sample_input_data):
+    """Fused and step-by-step predictions must be identical."""
+
+    expected = make_prediction(input_data=sample_input_data[0])
+    subject = make_prediction(input_data=sample_input_data[0], fused=True)
+
+    assert subject.get("errors") is None
+    assert isinstance(subject["predictions"][0], np.int64)
+    assert np.array_equal(subject["predictions"], expected["predictions"])
+
+
+def test_fused_transform_rejects_unknown_category(sample_input_data):
+    """Unknown categories must fail like OneHotEncoder(handle_unknown='error') does."""
+
+    data = sample_input_data[0].head(5).copy()
+    data["Vehicle_Damage"] = "Maybe"
+
+    with pytest.raises(ValueError):
+        vehicleinsurance_fused_pipe.transform(data)
+
+
+@pytest.mark.filterwarnings("ignore:pandas.DataFrame with sparse columns found")
+@pytest.mark.parametrize("mode", ["sparse", "ordinal"])
+def test_fused_transform_matches_encoding_modes(sample_input_data, mode):
+    """Sparse and ordinal encoders with handle_unknown='ignore' fuse to the same values as the step-by-step path."""
+    from sklearn.base import clone
+    from vehicleinsurance_model.config.core import config
+    from vehicleinsurance_model.processing.fused import FusedPipeline
+
+    # Given: The pipeline refitted with the encoding mode, Region_Code as a categorical and a small forest
+    X, y = sample_input_data[0][config.model_config_.features], sample_input_data[1]
+    pipeline = clone(vehicleinsurance_pipe).set_params(
+        encode_cols__mode=mode,
+        encode_cols__handle_unknown="ignore",
+        encode_cols__variable=["Vehicle_Age", "Vehicle_Damage", "Region_Code"],
+        model_rf__n_estimators=5,
+        model_rf__n_jobs=1,
+    )
+    pipeline.fit(X, y)
+    fused = FusedPipeline.from_pipeline(pipeline, config.model_config_.features)
+
+    # When: Scoring rows that include an unseen region
+    data = X.head(50).copy()
+    data.iloc[0, data.columns.get_loc("Region_Code")] = 999.0
+    expected = data
+    for _, step in pipeline.steps[:-1]:
+        expected = step.transform(expected)
+
+    # Then: Identical matrices, and the single-record path agrees
+    subject = fused.transform(data)
+    assert np.array_equal(subject, expected.to_numpy(dtype=np.float32), equal_nan=True)
+    assert np.array_equal(fused.transform_.transform_record(data.iloc[0].to_dict()), subject[:1], equal_nan=True)
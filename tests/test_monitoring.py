@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import logging
+from vehicleinsurance_model import monitoring
+from vehicleinsurance_model.monitoring import InferenceMetrics, inference_metrics
+from vehicleinsurance_model.predict import make_prediction, make_prediction_record
+
+
+def test_prediction_records_every_stage(sample_input_data):
+    # Given
+    X_test = sample_input_data[0].head(50)
+    before = {name: histogram.snapshot()["count"] for name, histogram in inference_metrics.stages.items()}
+    rows_before = inference_metrics.rows.snapshot()["count"]
+
+    # When
+    make_prediction(input_data=X_test)
+    make_prediction(input_data=X_test, fused=True, engine="numpy")
+    make_prediction_record(record=X_test.iloc[0].to_dict())
+
+    # Then
+    counts = {name: histogram.snapshot()["count"] - before.get(name, 0) for name, histogram in inference_metrics.stages.items()}
+    for step in ("map_gender", "scale_cols", "scale_annualpremium", "encode_cols",
+                 "renamecolumnstransformer", "dropcolumnstransformer"):
+        assert counts[step] == 1
+    assert counts["model_rf"] == 3
+    assert counts["fused_transform"] == 2
+    assert counts["validation"] == 3
+    assert inference_metrics.rows.snapshot()["count"] - rows_before == 3
+
+
+def test_render_prometheus_and_disabled_metrics():
+    # Given
+    metrics = InferenceMetrics(enabled=True)
+    disabled = InferenceMetrics(enabled=False)
+
+    # When
+    metrics.observe("scale_cols", 0.0003)
+    metrics.observe_rows(20)
+    with disabled.time("scale_cols"):
+        pass
+    disabled.observe_rows(20)
+    text = metrics.render_prometheus()
+
+    # Then
+    assert "# TYPE vehicleinsurance_stage_seconds histogram" in text
+    assert 'vehicleinsurance_stage_seconds_bucket{stage="scale_cols",le="0.00025"} 0' in text
+    assert 'vehicleinsurance_stage_seconds_bucket{stage="scale_cols",le="0.0005"} 1' in text
+    assert 'vehicleinsurance_stage_seconds_bucket{stage="scale_cols",le="+Inf"} 1' in text
+    assert 'vehicleinsurance_stage_seconds_count{stage="scale_cols"} 1' in text
+    assert 'vehicleinsurance_rows_per_call_bucket{le="100"} 1' in text
+    assert "vehicleinsurance_rows_per_call_sum 20" in text
+    assert disabled.stages == {} and disabled.rows.snapshot()["count"] == 0
+
+
+def test_sampled_logging_respects_level(caplog, monkeypatch):
+    # Given
+    monkeypatch.setattr(monitoring.config.app_config_, "log_sample_rate", 1.0)
+
+    # When
+    with caplog.at_level(logging.WARNING, logger="vehicleinsurance_model"):
+        monitoring.log_sampled(logging.DEBUG, "hidden %s", "row")
+        monitoring.log_sampled(logging.WARNING, "shown %s", "row")
+
+    # Then
+    assert [record.getMessage() for record in caplog.records] == ["shown row"]
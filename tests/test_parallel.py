@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import numpy as np
+import pandas as pd
+import pytest
+from vehicleinsurance_model.parallel import make_prediction_parallel, score_file_parallel
+from vehicleinsurance_model.predict import make_prediction, vehicleinsurance_fused_pipe, vehicleinsurance_pipe
+from vehicleinsurance_model.registry import model_registry
+
+
+@pytest.mark.parametrize("engine", ["numpy", "numba"])
+def test_flat_forest_matches_sklearn(sample_input_data, engine):
+    """The flattened forest must return exactly the probabilities of the sklearn forest."""
+    if engine == "numba":
+        pytest.importorskip("numba")
+
+    X = vehicleinsurance_fused_pipe.transform(sample_input_data[0])
+    X[::11, 1] = np.nan  # Exercise the missing-value routing as well
+
+    expected = vehicleinsurance_pipe.steps[-1][1].predict_proba(pd.DataFrame(X, columns=vehicleinsurance_fused_pipe.feature_names))
+    assert np.array_equal(model_registry.get_flat_forest().predict_proba(X, engine=engine), expected)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "numba"])
+def test_make_prediction_engines(sample_input_data, engine):
+    """Every inference engine must return exactly the sklearn predictions, fused or not."""
+    if engine == "numba":
+        pytest.importorskip("numba")
+
+    records = sample_input_data[0].head(5000)
+    expected = make_prediction(input_data=records)["predictions"]
+
+    assert np.array_equal(make_prediction(input_data=records, engine=engine)["predictions"], expected)
+    assert np.array_equal(make_prediction(input_data=records, fused=True, engine=engine)["predictions"], expected)
+
+
+def test_make_prediction_parallel(sample_input_data):
+    """Sharded scoring must reassemble the predictions in input order."""
+
+    records = sample_input_data[0].head(3000)
+
+    subject = make_prediction_parallel(input_data=records, n_workers=2)
+
+    assert subject.get("errors") is None
+    assert np.array_equal(subject["predictions"], make_prediction(input_data=records)["predictions"])
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_score_file_parallel(sample_input_data, tmp_path, suffix):
+    """File-level sharding must write every valid record once, in input order, and report invalid ones."""
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+
+    records = sample_input_data[0].head(3000).reset_index(drop=True).astype({"Gender": str})
+    records.loc[[10, 2500], "Gender"] = "Unknown"
+    input_path = tmp_path / f"policies{suffix}"
+    records.to_csv(input_path, index=False) if suffix == ".csv" else records.to_parquet(input_path, index=False, row_group_size=500)
+
+    summary = score_file_parallel(
+        input_path=input_path, output_path=tmp_path / f"scored{suffix}", n_workers=3, chunksize=400, errors_path=tmp_path / "errors.csv"
+    )
+
+    valid = records.drop(index=[10, 2500])
+    scored = pd.read_csv(tmp_path / "scored.csv") if suffix == ".csv" else pd.read_parquet(tmp_path / "scored.parquet")
+    assert summary == {"shards": 3, "rows": 3000, "invalid_rows": 2}
+    assert list(scored["id"]) == list(valid["id"])
+    assert np.array_equal(scored["prediction"].to_numpy(), make_prediction(input_data=valid)["predictions"])
+    assert list(pd.read_csv(tmp_path / "errors.csv")["row"]) == [10, 2500]
+    assert not list(tmp_path.glob("scored.part*"))
+
+
+def test_make_prediction_parallel_reports_the_active_version_and_handles_empty_input(sample_input_data):
+    subject = make_prediction_parallel(input_data=sample_input_data[0].head(0), n_workers=2)
+
+    assert subject["version"] == model_registry.active_version
+    assert subject["errors"] is None and len(subject["predictions"]) == 0
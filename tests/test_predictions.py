@@ -6,9 +6,10 @@ parent, root = file.parent, file.parents[1]
 
 # Add parent directory to sys.path for module imports
 sys.path.append(str(root))
+import subprocess
 import numpy as np
 from sklearn.metrics import accuracy_score, precision_score
-from vehicleinsurance_model.predict import make_prediction
+from vehicleinsurance_model.predict import make_prediction, make_prediction_proba, make_prediction_record
 
 
 
@@ -41,4 +42,64 @@ def test_make_prediction(sample_input_data):
 
     # Validate model performance thresholds
     assert ACC > 0.8, f"Model accuracy too low: {ACC}. Expected > 0.8."
-    assert PRE > 0.3, f"Model precision too low: {PRE}. Expected > 0.3."
\ No newline at end of file
+    assert PRE > 0.3, f"Model precision too low: {PRE}. Expected > 0.3."
+
+def test_make_prediction_record(sample_input_data):
+    """The single-record fast path must agree with the DataFrame path."""
+
+    # Given: A handful of raw records from the test split
+    records = sample_input_data[0].head(20)
+
+    # When: Scoring them with both paths
+    expected = make_prediction(input_data=records)["predictions"]
+    subject = [make_prediction_record(record=record) for record in records.to_dict(orient="records")]
+
+    # Then: One np.int64 prediction per record, identical to the DataFrame path
+    assert all(result.get("errors") is None for result in subject), "Expected no errors during prediction."
+    assert isinstance(subject[0]["predictions"][0], np.int64)
+    assert [result["predictions"][0] for result in subject] == list(expected)
+
+
+def test_make_prediction_proba(sample_input_data):
+    """Scores and thresholded labels come from one pass and agree with make_prediction at 0.5."""
+
+    # Given: A slice of raw records and their hard labels
+    records = sample_input_data[0].head(2000)
+    expected = make_prediction(input_data=records)["predictions"]
+
+    # When: Scoring them with the default threshold, a strict one and a top-k ranking
+    subject = make_prediction_proba(input_data=records, engine="numpy", top_k=10)
+    strict = make_prediction_proba(input_data=records, threshold=0.9)
+
+    # Then: Probabilities in [0, 1], identical labels at 0.5, fewer positives above 0.9
+    scores = subject["probabilities"]
+    assert subject["errors"] is None and subject["threshold"] == 0.5
+    assert ((scores >= 0) & (scores <= 1)).all()
+    assert np.array_equal(subject["predictions"], expected)
+    assert np.array_equal(strict["predictions"], (strict["probabilities"] > 0.9).astype(np.int64))
+    assert strict["predictions"].sum() <= subject["predictions"].sum()
+
+    # The top-k positions hold the 10 highest scores, highest first
+    assert np.array_equal(scores[subject["top_k"]], np.sort(scores)[::-1][:10])
+
+
+def test_make_prediction_record_reports_errors():
+    """Invalid records return validation errors instead of predictions."""
+
+    result = make_prediction_record(record={"Gender": "Male", "Age": "forty-four"})
+
+    assert result["predictions"] is None
+    assert result["errors"] is not None
+
+
+def test_import_is_lazy():
+    """Importing the predict module must neither load the model nor import scikit-learn."""
+
+    code = (
+        "import sys\n"
+        "from vehicleinsurance_model.predict import make_prediction\n"
+        "from vehicleinsurance_model.registry import model_registry\n"
+        "assert not model_registry.loaded\n"
+        "assert 'sklearn' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import json
+import numpy as np
+from vehicleinsurance_model.batch_score import score_file
+from vehicleinsurance_model.predict import make_prediction
+from vehicleinsurance_model.processing.profiling import PipelineProfiler, copied_output, diff_profiles
+
+PIPELINE_STEPS = ["map_gender", "scale_cols", "scale_annualpremium", "encode_cols",
+                  "renamecolumnstransformer", "dropcolumnstransformer", "model_rf"]
+
+
+def test_profiled_prediction_records_every_step(sample_input_data):
+    # Given
+    X_test = sample_input_data[0].head(500)
+    profiler = PipelineProfiler(label="0.0.1")
+
+    # When
+    profiled = make_prediction(input_data=X_test, profiler=profiler)
+
+    # Then: Same predictions, one profile per named step in pipeline order
+    assert np.array_equal(profiled["predictions"], make_prediction(input_data=X_test)["predictions"])
+    report = profiler.to_dict()
+    assert report["rows"] == 500
+    assert [step["step"] for step in report["steps"]] == PIPELINE_STEPS
+    for step in report["steps"]:
+        assert step["calls"] == 1 and step["seconds"] > 0 and step["peak_mb"] >= 0
+        assert step["bytes_in"] > 0 and step["bytes_out"] > 0
+    assert report["steps"][-1]["bytes_out"] == profiled["predictions"].nbytes
+
+
+def test_profiled_batch_scoring_aggregates_chunks(sample_input_data, tmp_path):
+    # Given
+    input_path = tmp_path / "policies.csv"
+    sample_input_data[0].head(600).to_csv(input_path, index=False)
+    profiler = PipelineProfiler(label="0.0.1")
+
+    # When
+    score_file(input_path=input_path, output_path=tmp_path / "scored.csv", chunksize=200, fused=True, profiler=profiler)
+    profiler.save(tmp_path / "profile.json")
+    saved = json.loads((tmp_path / "profile.json").read_text())
+
+    # Then
+    assert saved["rows"] == 600
+    assert [(step["step"], step["calls"]) for step in saved["steps"]] == [("fused_transform", 3), ("model_rf", 3)]
+    assert "fused_transform" in diff_profiles(saved, saved) and "model_rf" in profiler.report()
+
+
+def test_copied_output_tells_views_from_copies():
+    # Given
+    X = np.arange(100, dtype=np.float64)
+
+    # Then
+    assert copied_output(X, X[10:]) == (0, 0)
+    assert copied_output(X, X * 2) == (1, 800)
@@ -0,0 +1,99 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import os
+import shutil
+import numpy as np
+import pytest
+from vehicleinsurance_model import __version__ as _version
+from vehicleinsurance_model.config.core import TRAINED_MODEL_DIR
+from vehicleinsurance_model.predict import make_prediction
+from vehicleinsurance_model.processing import data_manager
+from vehicleinsurance_model.processing.data_manager import model_file_names, remove_old_pipelines
+from vehicleinsurance_model.registry import ModelRegistry
+
+
+@pytest.fixture
+def candidate_version():
+    """A second saved model version: a copy of the current one under another name."""
+    version = "0.0.1-candidate"
+    for source, target in zip(model_file_names(_version), model_file_names(version)):
+        if (TRAINED_MODEL_DIR / source).is_dir():
+            shutil.copytree(TRAINED_MODEL_DIR / source, TRAINED_MODEL_DIR / target)
+        else:
+            shutil.copy(TRAINED_MODEL_DIR / source, TRAINED_MODEL_DIR / target)
+    yield version
+    for target in model_file_names(version):
+        shutil.rmtree(TRAINED_MODEL_DIR / target, ignore_errors=True)
+        (TRAINED_MODEL_DIR / target).unlink(missing_ok=True)
+
+
+def test_activate_swaps_and_rolls_back(candidate_version, sample_input_data):
+    """Activating a version warms it first, switches at once and keeps the previous one for rollback."""
+
+    # Given: A fresh registry serving the package version
+    registry = ModelRegistry(version=_version)
+    registry.warmup()
+    generation = registry.generation
+
+    # When: Activating the candidate version
+    registry.activate(candidate_version)
+
+    # Then: It is active and already loaded, the cache generation moved, and rollback is possible
+    assert registry.active_version == candidate_version and registry.model().loaded
+    assert registry.previous_version == _version
+    assert registry.generation == generation + 1
+    assert {_version, candidate_version} <= set(registry.available_versions())
+
+    registry.activate(_version)
+    assert registry.active_version == _version
+
+    with pytest.raises(ValueError):
+        registry.activate("9.9.9")
+
+
+def test_shadow_routing(candidate_version, sample_input_data):
+    """A candidate receives the configured share of traffic and scores like any saved version."""
+
+    registry = ModelRegistry(version=_version)
+    registry.set_candidate(candidate_version, percent=100.0)
+    assert registry.route_shadow() == candidate_version
+
+    registry.set_candidate(candidate_version, percent=0.0)
+    assert registry.route_shadow() is None
+
+    registry.set_candidate(None)
+    assert registry.candidate_version is None
+    with pytest.raises(ValueError):
+        registry.set_candidate(candidate_version, percent=150.0)
+
+    # The copy holds the same model, so a call naming it predicts the same labels
+    records = sample_input_data[0].head(200)
+    candidate = make_prediction(input_data=records, model_version=candidate_version)
+    assert candidate["version"] == candidate_version
+    assert np.array_equal(candidate["predictions"], make_prediction(input_data=records)["predictions"])
+
+
+def test_remove_old_pipelines_keeps_latest_versions(tmp_path, monkeypatch):
+    """Saving keeps the newest versions on disk instead of deleting every other one."""
+
+    # Given: Four saved versions, oldest first
+    monkeypatch.setattr(data_manager, "TRAINED_MODEL_DIR", tmp_path)
+    for age, version in enumerate(["0.0.4", "0.0.3", "0.0.2", "0.0.1"]):
+        pickle_name, bundle_name = model_file_names(version)
+        (tmp_path / pickle_name).touch()
+        (tmp_path / bundle_name).mkdir()
+        os.utime(tmp_path / pickle_name, (1_000_000 - age, 1_000_000 - age))
+
+    # When: Saving 0.0.5 with room for two earlier versions
+    remove_old_pipelines(files_to_keep=list(model_file_names("0.0.5")), keep_latest=2)
+
+    # Then: Only the two newest earlier versions remain
+    assert data_manager.list_model_versions() == ["0.0.4", "0.0.3"]
+    assert (tmp_path / model_file_names("0.0.3")[1]).is_dir()
+    assert not (tmp_path / model_file_names("0.0.1")[1]).exists()
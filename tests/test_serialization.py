@@ -0,0 +1,149 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import asyncio
+import httpx
+import msgpack
+import numpy as np
+import orjson
+import pytest
+from fastapi import FastAPI
+from app.api import api_router
+from app.config import settings
+from app.schemas import ColumnarDataInputs
+from app.serialization import MSGPACK, MsgpackResponse, NumpyORJSONResponse
+
+
+class Client:
+    """Posts to the API router in process."""
+
+    def __init__(self):
+        self.app = FastAPI()
+        self.app.include_router(api_router, prefix=settings.API_V1_STR)
+
+    def post(self, path: str, **kwargs) -> httpx.Response:
+        async def post():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://test") as client:
+                return await client.post(path, **kwargs)
+        return asyncio.run(post())
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.fixture
+def records(sample_input_data):
+    """Five valid records, as plain JSON values."""
+    frame = sample_input_data[0].head(5).astype({"Gender": str, "Vehicle_Age": str, "Vehicle_Damage": str})
+    return orjson.loads(frame[list(ColumnarDataInputs.model_fields)].to_json(orient="records"))
+
+
+def columns_of(records: list) -> dict:
+    return {name: [record[name] for record in records] for name in ColumnarDataInputs.model_fields}
+
+
+def test_columnar_body_gets_the_same_predictions_as_rows(client, records):
+    # When
+    rows = client.post("/api/v1/predict", json={"inputs": records})
+    columns = client.post("/api/v1/predict", json={"inputs": columns_of(records)})
+
+    # Then
+    assert rows.status_code == columns.status_code == 200
+    assert len(columns.json()["predictions"]) == 5
+    assert columns.json()["predictions"] == rows.json()["predictions"]
+
+
+def test_empty_columnar_body_gets_empty_predictions(client):
+    # When
+    response = client.post("/api/v1/predict", json={"inputs": {name: [] for name in ColumnarDataInputs.model_fields}})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["predictions"] == []
+
+
+@pytest.mark.parametrize("change, error", [
+    (lambda columns: columns["Age"].pop(), {"type": "value_error", "loc": ["body", "inputs"]}),
+    (lambda columns: columns.update(Colour=["red"] * 5), {"type": "extra_forbidden", "loc": ["body", "inputs", "Colour"]}),
+    (lambda columns: columns.pop("Vintage"), {"type": "missing", "loc": ["body", "inputs", "Vintage"]}),
+    (lambda columns: columns.update(Vintage=3), {"type": "list_type", "loc": ["body", "inputs", "Vintage"]}),
+])
+def test_malformed_columnar_body_is_rejected(client, records, change, error):
+    # Given: Columns of unequal lengths, an unknown column, a missing column or a column that is no list
+    columns = columns_of(records)
+    change(columns)
+
+    # When
+    response = client.post("/api/v1/predict", json={"inputs": columns})
+
+    # Then
+    assert response.status_code == 422
+    assert [{key: detail[key] for key in error} for detail in response.json()["detail"]] == [error]
+
+
+@pytest.mark.parametrize("path", ["/api/v1/predict", "/api/v1/predict_proba"])
+def test_msgpack_round_trip(client, records, path):
+    # Given
+    body = msgpack.packb({"inputs": records})
+
+    # When: MessagePack in and out, MessagePack in and JSON out, and JSON in and MessagePack out
+    both = client.post(path, content=body, headers={"Content-Type": MSGPACK, "Accept": MSGPACK})
+    request_only = client.post(path, content=body, headers={"Content-Type": MSGPACK})
+    response_only = client.post(path, json={"inputs": records}, headers={"Accept": MSGPACK})
+    expected = client.post(path, json={"inputs": records}).json()
+
+    # Then: The same results whichever way they travel
+    assert both.headers["content-type"] == response_only.headers["content-type"] == MSGPACK
+    assert request_only.headers["content-type"] == "application/json"
+    assert msgpack.unpackb(both.content) == request_only.json() == msgpack.unpackb(response_only.content) == expected
+    assert len(expected["predictions"]) == 5
+
+
+@pytest.mark.parametrize("accept", ["", "*/*", "application/json", "text/html, application/xml;q=0.9"])
+def test_responses_fall_back_to_json(client, records, accept):
+    # When
+    response = client.post("/api/v1/predict", json={"inputs": records}, headers={"Accept": accept})
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert len(response.json()["predictions"]) == 5
+
+
+def test_numpy_results_are_encoded_natively():
+    # Given: Results as the model returns them
+    content = {
+        "predictions": np.array([0.0, 1.0]),
+        "probabilities": np.array([0.25, 0.75], dtype=np.float32),
+        "top_k": np.array([1, 0], dtype=np.int64),
+        "threshold": np.float64(0.5),
+        "version": "test",
+    }
+    expected = {"predictions": [0.0, 1.0], "probabilities": [0.25, 0.75], "top_k": [1, 0], "threshold": 0.5, "version": "test"}
+
+    # When / Then
+    assert orjson.loads(NumpyORJSONResponse(content).body) == expected
+    assert msgpack.unpackb(MsgpackResponse(content).body) == expected
+
+
+def test_malformed_msgpack_bodies_are_rejected(client, records):
+    # Given: A body that is no MessagePack, and a columnar body with a MessagePack bin value
+    columns = columns_of(records)
+    columns["Gender"][0] = b"Male"
+
+    # When
+    malformed = client.post("/api/v1/predict", content=b"\xc1", headers={"Content-Type": MSGPACK})
+    binary = client.post("/api/v1/predict", content=msgpack.packb({"inputs": columns}), headers={"Content-Type": MSGPACK})
+
+    # Then: A 422, and a validation error rather than a server error
+    assert malformed.status_code == 422
+    assert binary.status_code == 400
+    assert [(error["type"], error["input"]) for error in binary.json()["detail"]] == [("literal_error", "Male")]
@@ -0,0 +1,149 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the API directory (for app) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "vehicleinsurance_api"))
+import asyncio
+import json
+import numpy as np
+import orjson
+import pandas as pd
+from app.executor import ExecutorBusy, InferenceExecutor
+from app.streaming import StreamScorer
+from vehicleinsurance_model.predict import make_prediction
+
+
+class FakeRequest:
+    """Stands in for a Starlette request whose body arrives in the given chunks."""
+
+    def __init__(self, chunks: list):
+        self.chunks = chunks
+
+    async def stream(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+def fake_predict(*, input_data: pd.DataFrame, scored: list = None, **options) -> dict:
+    """make_prediction-like callable: predicts Age > 40, errors on negative ages."""
+    if scored is not None:
+        scored.append(len(input_data))
+    bad = np.flatnonzero(input_data["Age"].to_numpy() < 0)
+    if len(bad):
+        errors = [{"loc": ["inputs", int(row), "Age"], "msg": "negative"} for row in bad]
+        return {"predictions": None, "version": "test", "errors": json.dumps(errors)}
+    return {"predictions": (input_data["Age"].to_numpy() > 40).astype(int), "version": "test", "errors": None}
+
+
+def collect(scorer: StreamScorer, chunks: list, **options) -> list:
+    async def run():
+        return [line async for body in scorer.stream(FakeRequest(chunks), **options) for line in body.splitlines()]
+    return [orjson.loads(line) for line in asyncio.run(run())]
+
+
+def test_records_are_scored_in_bounded_batches_and_order():
+    # Given: 25 records, split across body chunks in the middle of lines
+    body = b"".join(orjson.dumps({"id": i, "Age": 30 + i}) + b"\n" for i in range(25))
+    chunks = [body[i:i + 37] for i in range(0, len(body), 37)]
+    scorer = StreamScorer(fake_predict, InferenceExecutor(kind="inline"), batch_rows=4)
+    scored = []
+
+    # When
+    lines = collect(scorer, chunks, scored=scored)
+
+    # Then: One line per record, in order, and no batch over batch_rows
+    assert [line["row"] for line in lines] == list(range(25))
+    assert [line["prediction"] for line in lines] == [int(30 + i > 40) for i in range(25)]
+    assert lines[3]["id"] == 3
+    assert sum(scored) == 25 and max(scored) <= 4
+
+
+def test_bad_records_get_error_lines_and_the_rest_is_scored():
+    # Given: A malformed line, a non-object line and an invalid record among valid ones
+    chunks = [b'{"id": 0, "Age": 50}\n{"id": 1, "Age"\n[1, 2]\n', b'{"id": 3, "Age": -1}\n{"id": 4, "Age": 20}']
+    scorer = StreamScorer(fake_predict, InferenceExecutor(kind="inline"))
+
+    # When
+    lines = collect(scorer, chunks)
+
+    # Then
+    assert [line["row"] for line in lines] == [0, 1, 2, 3, 4]
+    assert lines[0]["prediction"] == 1 and lines[4]["prediction"] == 0
+    assert lines[1]["errors"][0]["type"] == "json_invalid" and lines[2]["errors"][0]["type"] == "json_invalid"
+    assert lines[3]["errors"] == [{"loc": ["inputs", 3, "Age"], "msg": "negative"}]
+
+
+def test_overlong_line_ends_the_stream():
+    # Given
+    scorer = StreamScorer(fake_predict, InferenceExecutor(kind="inline"), max_line_bytes=64)
+    chunks = [b'{"id": 0, "Age": 50}\n', b'{"id": 1, "Age": ' + b" " * 100]
+
+    # When
+    lines = collect(scorer, chunks)
+
+    # Then: The records before it are answered, then a final error line
+    assert lines[0] == {"row": 0, "id": 0, "prediction": 1}
+    assert "exceeds 64 bytes" in lines[-1]["error"]
+
+
+def test_failing_batch_is_rescored_record_by_record():
+    # Given: A model that fails on the first batch only
+    calls = []
+
+    def flaky_predict(**kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("model exploded")
+        return fake_predict(**kwargs)
+
+    body = b"".join(orjson.dumps({"id": i, "Age": 50}) + b"\n" for i in range(6))
+    scorer = StreamScorer(flaky_predict, InferenceExecutor(kind="inline"), batch_rows=3)
+
+    # When
+    lines = collect(scorer, [body])
+
+    # Then: Every record is still answered
+    assert [line["row"] for line in lines] == list(range(6))
+    assert all(line["prediction"] == 1 for line in lines)
+
+
+def test_record_the_model_fails_on_gets_an_error_line(sample_input_data):
+    # Given: A record that passes validation but has nulls the model cannot handle, among valid ones
+    records = sample_input_data[0].head(4).to_dict(orient="records")
+    records.insert(2, {"id": 99, "Gender": "Male"})
+    body = b"".join(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n" for record in records)
+    scorer = StreamScorer(make_prediction, InferenceExecutor(kind="inline"))
+
+    # When
+    lines = collect(scorer, [body])
+
+    # Then: Only that record gets an error line
+    assert [line["row"] for line in lines] == list(range(5))
+    assert "error" in lines[2] and "prediction" not in lines[2]
+    assert [line["id"] for line in lines if "prediction" in line] == [record["id"] for record in records if record["id"] != 99]
+
+
+def test_busy_executor_gets_a_batch_error_line_and_the_stream_goes_on():
+    # Given: An executor that is busy for the first batch only
+    calls = []
+
+    def busy_predict(**kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise ExecutorBusy("busy")
+        return fake_predict(**kwargs)
+
+    body = b"".join(orjson.dumps({"id": i, "Age": 50}) + b"\n" for i in range(6))
+    scorer = StreamScorer(busy_predict, InferenceExecutor(kind="inline"), batch_rows=3)
+
+    # When
+    lines = collect(scorer, [body])
+
+    # Then: The batch is not rescored
+    assert lines[0] == {"rows": [0, 2], "error": "busy"}
+    assert [line["row"] for line in lines[1:]] == [3, 4, 5]
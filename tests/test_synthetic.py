@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory (for vehicleinsurance_model) and the benchmarks directory (for synthetic) to sys.path
+sys.path.append(str(root))
+sys.path.append(str(root / "benchmarks"))
+from synthetic import synthetic_policies
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.processing.validation import validate_inputs
+
+
+def test_synthetic_policies_are_valid_and_reproducible():
+    # When
+    data = synthetic_policies(2000, seed=3, with_target=True)
+
+    # Then
+    assert list(data.columns) == config.model_config_.features + [config.model_config_.target]
+    assert validate_inputs(input_df=data[config.model_config_.features])[1] is None
+    assert 0.01 < data[config.model_config_.target].mean() < 0.5
+    assert data.equals(synthetic_policies(2000, seed=3, with_target=True))
@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import numpy as np
+from sklearn.base import clone
+from vehicleinsurance_model.pipeline import vehicleinsurance_pipe
+from vehicleinsurance_model.processing.timing import StageTimer
+from vehicleinsurance_model import train_pipeline
+from vehicleinsurance_model.config.core import PACKAGE_ROOT, TRAINING_CACHE_DIR
+from vehicleinsurance_model.train_pipeline import data_fingerprint, fit_forest, fit_preprocessing, transformers_code_key
+
+
+def test_warm_start_growth_matches_single_fit(sample_input_data):
+    """Growing the forest in warm-start steps must give exactly the forest of a single fit."""
+
+    # Given: Preprocessed records and a small forest
+    X, y = sample_input_data[0].head(2000), sample_input_data[1].head(2000)
+    _, Xt, _ = fit_preprocessing(vehicleinsurance_pipe.steps[:-1], X, y)
+    forest = clone(vehicleinsurance_pipe.steps[-1][1]).set_params(n_estimators=60, n_jobs=1)
+
+    # When: Fitting it in one go and in warm-start steps
+    timer = StageTimer(track_memory=False)
+    single = fit_forest(clone(forest).set_params(warm_start=False), Xt, y, timer)
+    grown = fit_forest(clone(forest).set_params(warm_start=True), Xt, y, timer)
+
+    # Then: Both forests predict the same probabilities and every step was timed
+    assert np.array_equal(single.predict_proba(Xt), grown.predict_proba(Xt))
+    assert len(grown.estimators_) == 60
+    assert [stage["stage"] for stage in timer.stages][1:] == [f"fit model_rf ({n} trees)" for n in (25, 50, 60)]
+
+
+def test_data_fingerprint_tracks_the_training_data(sample_input_data):
+    """The preprocessing cache key changes with the data, not with the object identity."""
+
+    X, y = sample_input_data[0].head(100), sample_input_data[1].head(100)
+
+    assert data_fingerprint(X, y) == data_fingerprint(X.copy(), y.copy())
+    assert data_fingerprint(X, y) != data_fingerprint(X.assign(Age=X["Age"] + 1), y)
+
+
+def test_transformers_code_key_tracks_the_transformer_code(monkeypatch):
+    """The preprocessing cache key changes with the transformers' source, and the cache is not shipped in the package."""
+
+    steps = vehicleinsurance_pipe.steps[:-1]
+    features_source = PACKAGE_ROOT / "processing" / "features.py"
+    key = transformers_code_key(steps)
+    original_read_bytes = Path.read_bytes
+
+    # When: processing/features.py is edited
+    monkeypatch.setattr(Path, "read_bytes", lambda path: original_read_bytes(path) + (b"# edited" if path == features_source else b""))
+
+    # Then
+    assert transformers_code_key(steps) != key
+    assert PACKAGE_ROOT not in TRAINING_CACHE_DIR.parents
+    assert Path(train_pipeline.preprocessing_memory.location) == TRAINING_CACHE_DIR
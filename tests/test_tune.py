@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.tune import PARAMETER_NAMES, prepare_folds, run_candidates, sample_candidates
+
+
+def test_run_candidates(sample_input_data):
+    """Every candidate is cross-validated on the shared preprocessed folds and logged with its latency."""
+
+    # Given: Two preprocessed folds and three candidates from the configured search space
+    X, y = sample_input_data[0].head(3000), sample_input_data[1].head(3000)
+    folds = prepare_folds(X, y, n_folds=2, random_state=0)
+    candidates = sample_candidates(3, random_state=0)
+
+    # When: Cross-validating them
+    results = run_candidates(candidates, folds, n_jobs=1, n_rows=1000)
+
+    # Then: One row per candidate with its parameters and fold-averaged metrics
+    assert len(folds) == 2 and folds[0][0].shape[1] == 13
+    assert len(results) == 3
+    assert set(PARAMETER_NAMES) | {"accuracy", "precision", "fit_seconds", "latency_us_per_row"} == set(results.columns)
+    assert all(value in config.model_config_.search_space.N_ESTIMATORS for value in results["N_ESTIMATORS"])
+    assert (results["latency_us_per_row"] > 0).all()
@@ -0,0 +1,149 @@
+import sys
+from pathlib import Path
+# Dynamically determine file paths for resolving module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to sys.path for module imports
+sys.path.append(str(root))
+import json
+import random
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from vehicleinsurance_model.processing.validation import MultipleDataInputs, validate_inputs
+
+
+def test_validate_inputs_accepts_clean_data(sample_input_data):
+    """Clean records pass the columnar validation unchanged."""
+
+    validated_data, errors = validate_inputs(input_df=sample_input_data[0])
+
+    assert errors is None
+    assert len(validated_data) == len(sample_input_data[0])
+
+
+def test_validate_inputs_matches_pydantic_errors(sample_input_data):
+    """Columnar validation reports the same errors, in the same JSON shape, as the per-row Pydantic models."""
+
+    # Given: Records with a wrong type, a fractional integer, an unknown category and a missing value
+    data = sample_input_data[0].head(50).astype(object)
+    data.iloc[3, data.columns.get_loc("Age")] = "forty"
+    data.iloc[7, data.columns.get_loc("Vintage")] = 12.5
+    data.iloc[7, data.columns.get_loc("Vehicle_Damage")] = "Maybe"
+    data.iloc[9, data.columns.get_loc("Gender")] = 1
+    data.iloc[11, data.columns.get_loc("Region_Code")] = np.nan
+
+    # When: Validating with the columnar validator and with the Pydantic models
+    _, errors = validate_inputs(input_df=data)
+    with pytest.raises(ValidationError) as expected:
+        MultipleDataInputs(inputs=data.replace({np.nan: None}).to_dict(orient="records"))
+
+    # Then: Identical errors, ordered by row and column
+    assert json.loads(errors) == json.loads(expected.value.json())
+    assert [error["loc"][1:] for error in json.loads(errors)] == [
+        [3, "Age"], [7, "Vehicle_Damage"], [7, "Vintage"], [9, "Gender"]
+    ]
+
+
+def test_validate_inputs_parses_float_strings_like_pydantic(sample_input_data):
+    """Float fields sent as text are accepted or rejected exactly as the Pydantic models do."""
+
+    # Given: Annual_Premium values as text, special values and pydantic's underscore rules included
+    texts = ["nan", "-Infinity", "INF", " 1.5 ", "1_000", "1_.5", "2e3", ".5", "_1", "1__0", "1_", "0x10", "", "1,5", "١٢"]
+    data = sample_input_data[0].head(len(texts)).astype(object)
+    data["Annual_Premium"] = texts
+
+    # When
+    validated_data, errors = validate_inputs(input_df=data)
+    with pytest.raises(ValidationError) as expected:
+        MultipleDataInputs(inputs=data.replace({np.nan: None}).to_dict(orient="records"))
+
+    # Then: The same errors, and the accepted values converted to the same floats
+    assert json.loads(errors) == json.loads(expected.value.json())
+    accepted = data.head(8)
+    validated_data, errors = validate_inputs(input_df=accepted)
+    parsed = [record.Annual_Premium for record in MultipleDataInputs(inputs=accepted.to_dict(orient="records")).inputs]
+    assert errors is None
+    assert np.array_equal(validated_data["Annual_Premium"].to_numpy(dtype=float), np.array(parsed, dtype=float), equal_nan=True)
+
+
+def _fuzz_values(rng: random.Random, n_values: int) -> list:
+    """Integers as text, bytes and numbers, well and badly formed; strings stay within int64."""
+    values = []
+    for _ in range(n_values):
+        digits = "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 16)))
+        if rng.random() < 0.2:
+            position = rng.randint(0, len(digits))
+            digits = digits[:position] + rng.choice(["_", "__"]) + digits[position:]
+        text = rng.choice(["", "+", "-"]) + digits + rng.choice(["", "", ".", ".0", ".00", ".5", "e3", "0_0"])
+        text = rng.choice(["", " ", "\t"]) + text + rng.choice(["", " ", "\n"])
+        kind = rng.random()
+        if kind < 0.55:
+            values.append(text)
+        elif kind < 0.65:
+            values.append(text.encode())
+        elif kind < 0.8:
+            values.append(rng.choice([3.0, 2.5, -0.0, 1e20, 2.0 ** 63, -(2.0 ** 63), 2.0 ** 62, float("inf"), float("nan")]))
+        else:
+            values.append(rng.choice(["٣", "1_000", "28.", ".0", "0x10", "", "nan", b"\xd9\xa3", "9223372036854775807"]))
+    return values
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_validate_inputs_fuzz_matches_pydantic(sample_input_data, seed):
+    """Integer fields given fuzzed values fail and convert exactly as the Pydantic models do."""
+
+    # Given
+    values = _fuzz_values(random.Random(seed), 200)
+    data = sample_input_data[0].head(len(values)).reset_index(drop=True).astype(object)
+    data["Age"] = pd.Series(values, dtype=object)
+    records = data.to_dict(orient="records")
+    for record, value in zip(records, values):
+        record["Age"] = None if isinstance(value, float) and np.isnan(value) else value
+
+    # When
+    validated_data, errors = validate_inputs(input_df=data)
+    try:
+        parsed = MultipleDataInputs.model_validate({"inputs": records})
+        expected = None
+    except ValidationError as error:
+        expected = json.loads(error.json())
+
+    # Then: The same errors, and without errors the same values
+    assert (json.loads(errors) if errors else None) == expected
+    valid = [row for row in range(len(values)) if row not in {error["loc"][1] for error in expected or []}]
+    subject, _ = validate_inputs(input_df=data.iloc[valid])
+    parsed = MultipleDataInputs.model_validate({"inputs": [records[row] for row in valid]})
+    assert np.array_equal(
+        subject["Age"].to_numpy(dtype=float), np.array([record.Age for record in parsed.inputs], dtype=float), equal_nan=True
+    )
+
+
+def test_validate_inputs_reports_bytes_as_text(sample_input_data):
+    """Bytes (e.g. msgpack bin values) give JSON errors instead of failing to serialize."""
+
+    data = sample_input_data[0].head(2).astype(object)
+    data.iloc[0, data.columns.get_loc("Gender")] = b"Male"
+    data.iloc[1, data.columns.get_loc("Age")] = b"\xff"
+
+    _, errors = validate_inputs(input_df=data)
+    with pytest.raises(ValidationError) as expected:
+        MultipleDataInputs(inputs=data.to_dict(orient="records"))
+
+    assert [(error["type"], error["input"]) for error in json.loads(errors)] == [("literal_error", "Male"), ("int_parsing", "�")]
+    assert [error["type"] for error in json.loads(errors)] == [error["type"] for error in expected.value.errors()]
+
+
+def test_validate_inputs_rejects_integers_beyond_int64(sample_input_data):
+    """Integers the model's int64 columns cannot hold fail, even as strings Pydantic would accept."""
+
+    data = sample_input_data[0].head(4).astype(object)
+    data["Age"] = ["9223372036854775807", "9223372036854775808", 1e20, "-9_223_372_036_854_775_809"]
+
+    validated_data, errors = validate_inputs(input_df=data)
+
+    assert [(error["type"], error["loc"][1]) for error in json.loads(errors)] == [("int_parsing_size", row) for row in (1, 2, 3)]
+    validated_data, errors = validate_inputs(input_df=data.head(1))
+    assert errors is None and validated_data["Age"].tolist() == [2 ** 63 - 1]
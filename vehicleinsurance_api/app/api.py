@@ -1,15 +1,23 @@
 import sys
 from pathlib import Path
+import asyncio
 import json
-from typing import Any
-import numpy as np
-import pandas as pd
-from fastapi import APIRouter, HTTPException, Body
-from fastapi.encoders import jsonable_encoder
-from vehicleinsurance_model import __version__ as model_version
-from vehicleinsurance_model.predict import make_prediction
+import secrets
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.background import BackgroundTask
+from vehicleinsurance_model.predict import make_prediction, make_prediction_proba
+from vehicleinsurance_model.processing.scoring import top_k as top_k_rows
+from vehicleinsurance_model.registry import model_registry
 from app import __version__, schemas
+from app.batching import PredictionBatcher
+from app.chunking import ChunkedPredictor
 from app.config import settings
+from app.executor import ExecutorBusy, InferenceExecutor
+from app.serialization import MSGPACK, decode_inputs, encode_response
+from app.shadow import ShadowScorer
+from app.streaming import NDJSON, NDJSONStreamingResponse, StreamScorer
 
 # Dynamically resolve file paths to support imports
 file = Path(__file__).resolve()
@@ -21,6 +29,37 @@ sys.path.append(str(root))
 # Create an API router instance for managing endpoints
 api_router = APIRouter()
 
+# Runs the blocking model work off the event loop so /health and other requests stay responsive
+executor = InferenceExecutor(
+    kind=settings.INFERENCE_EXECUTOR,
+    workers=settings.INFERENCE_WORKERS,
+    max_queue=settings.INFERENCE_MAX_QUEUE,
+)
+
+# Coalesces concurrent /predict calls into micro-batches when PREDICT_BATCHING is enabled
+batcher = PredictionBatcher(
+    make_prediction,
+    max_batch_size=settings.PREDICT_MAX_BATCH_SIZE,
+    max_wait_ms=settings.PREDICT_MAX_WAIT_MS,
+    executor=executor,
+    predict_options=lambda: {"model_version": model_registry.active_version},
+)
+
+# Splits requests into row chunks and stops scoring them when the client leaves or the deadline passes
+chunked = ChunkedPredictor(executor, chunk_rows=settings.PREDICT_CHUNK_ROWS, timeout_seconds=settings.PREDICT_TIMEOUT_SECONDS)
+
+# Scores NDJSON record streams on /predict/stream in bounded micro-batches
+stream_scorer = StreamScorer(
+    make_prediction,
+    executor=executor,
+    batch_rows=settings.PREDICT_STREAM_BATCH_ROWS,
+    max_wait_ms=settings.PREDICT_STREAM_MAX_WAIT_MS,
+    max_line_bytes=settings.PREDICT_STREAM_MAX_LINE_BYTES,
+)
+
+# Scores a share of /predict traffic with the candidate model version, after responding
+shadow = ShadowScorer(make_prediction, executor=executor)
+
 @api_router.get("/health", response_model=schemas.Health, status_code=200)
 def health() -> dict:
     """
@@ -30,7 +69,7 @@ def health() -> dict:
     health = schemas.Health(
         name=settings.PROJECT_NAME, 
         api_version=__version__, 
-        model_version=model_version
+        model_version=model_registry.active_version
     )
     return health.dict()
 
@@ -54,22 +93,175 @@ example_input = {
     ]
 }
 
+# The request body is decoded by decode_inputs rather than by FastAPI, so it is documented here
+request_body = {
+    "requestBody": {
+        "required": True,
+        "description": "MultipleDataInputs: inputs as a list of records or as {field: [values]} columns.",
+        "content": {
+            "application/json": {"schema": {"type": "object"}, "example": example_input},
+            MSGPACK: {"schema": {"type": "object"}},
+        },
+    }
+}
+
 
-@api_router.post("/predict", response_model=schemas.PredictionResults, status_code=200)
-async def predict(input_data: schemas.MultipleDataInputs = Body(..., example=example_input)) -> Any:
+@api_router.post("/predict", response_model=schemas.PredictionResults, status_code=200, openapi_extra=request_body)
+async def predict(request: Request) -> Any:
     """
     Prediction endpoint for vehicle insurance model.
-    Accepts input data in JSON format, processes it, and returns predictions.
+    Accepts input data as JSON or MessagePack, processes it, and returns predictions,
+    as MessagePack when the Accept header asks for it and as JSON otherwise.
     """
 
-    # Convert input JSON data into a Pandas DataFrame
-    input_df = pd.DataFrame(jsonable_encoder(input_data.inputs))
+    # Decode the body; columnar bodies go straight into a DataFrame
+    input_df = await decode_inputs(request)
 
-    # Replace NaN values with None for proper handling
-    results = make_prediction(input_data=input_df.replace({np.nan: None}))
+    # Merge small requests with concurrent ones into one batch, or score this request on its own in chunks,
+    # abandoning it when the client disconnects or the deadline passes (empty requests are answered there).
+    # The active version is passed explicitly so process workers follow a hot swap too.
+    deadline = chunked.deadline()
+    try:
+        if settings.PREDICT_BATCHING and 0 < len(input_df) <= settings.PREDICT_CHUNK_ROWS:
+            results = await chunked.wait(request, lambda: batcher.submit(input_df), deadline)
+        else:
+            results = await chunked.run(request, make_prediction, input_df, deadline, model_version=model_registry.active_version)
+    except ExecutorBusy as error:
+        raise HTTPException(status_code=503, detail=str(error), headers={"Retry-After": "1"})
 
     # Handle errors returned by the prediction process
     if results["errors"] is not None:
         raise HTTPException(status_code=400, detail=json.loads(results["errors"]))
 
-    return results
\ No newline at end of file
+    # NumPy arrays are serialized natively by the response class
+    response = encode_response(request, results)
+
+    # Shadow-score a share of the requests with the candidate version once the response is sent
+    candidate = model_registry.route_shadow() if len(input_df) else None
+    if candidate is not None:
+        response.background = BackgroundTask(shadow.score, input_df, results["predictions"], candidate)
+    return response
+
+
+# /predict/stream reads its body incrementally, so it is documented here as well
+stream_request_body = {
+    "requestBody": {
+        "required": True,
+        "description": "One DataInputSchema record per line (newline-delimited JSON), sent in any number of chunks.",
+        "content": {NDJSON: {"schema": {"type": "string"}, "example": json.dumps(example_input["inputs"][0])}},
+    }
+}
+stream_responses = {200: {"description": "One result per input line, in order", "content": {NDJSON: {}}}}
+
+
+@api_router.post("/predict/stream", status_code=200, openapi_extra=stream_request_body, responses=stream_responses,
+                 response_class=NDJSONStreamingResponse)
+async def predict_stream(request: Request) -> NDJSONStreamingResponse:
+    """
+    Streaming prediction endpoint.
+    Reads an NDJSON body of records as it arrives, scores them in bounded micro-batches and
+    streams one NDJSON line per record back as each batch completes:
+    {"row", "id", "prediction"}, {"row", "errors"} for an invalid record, or {"row", "error"}
+    for a record the model fails on.
+    The whole stream is scored by the model version active when it started (X-Model-Version).
+    """
+    version = model_registry.active_version
+    return NDJSONStreamingResponse(stream_scorer.stream(request, model_version=version), headers={"X-Model-Version": version})
+
+
+@api_router.post("/predict_proba", response_model=schemas.ProbabilityResults, status_code=200, openapi_extra=request_body)
+async def predict_proba(
+    request: Request,
+    threshold: Optional[float] = Query(None, ge=0.0, le=1.0, description="Label a record 1 when its probability exceeds this"),
+    top_k: Optional[int] = Query(None, ge=1, description="Also return the positions of the top_k highest-scoring records"),
+) -> Any:
+    """
+    Scoring endpoint for vehicle insurance model.
+    Returns each record's probability of a positive response and its label under the
+    decision threshold, both from a single forest pass.
+    """
+
+    # Decode the body; columnar bodies go straight into a DataFrame
+    input_df = await decode_inputs(request)
+
+    # Scored in chunks like /predict; the top_k ranking is taken over the assembled probabilities
+    try:
+        results = await chunked.run(
+            request, make_prediction_proba, input_df, chunked.deadline(), threshold=threshold, model_version=model_registry.active_version
+        )
+    except ExecutorBusy as error:
+        raise HTTPException(status_code=503, detail=str(error), headers={"Retry-After": "1"})
+
+    # Handle errors returned by the scoring process
+    if results["errors"] is not None:
+        raise HTTPException(status_code=400, detail=json.loads(results["errors"]))
+
+    if top_k is not None:
+        results["top_k"] = top_k_rows(results["probabilities"], top_k)
+
+    # NumPy arrays are serialized natively by the response class
+    return encode_response(request, {"top_k": None, **results})
+
+
+@api_router.get("/predict/batching", response_model=schemas.BatchingStats, status_code=200)
+def batching_stats() -> dict:
+    """
+    Micro-batching statistics.
+    Returns histograms of rows and requests per batch and of the time requests waited in the queue.
+    """
+    return {
+        "enabled": settings.PREDICT_BATCHING,
+        "max_batch_size": batcher.max_batch_size,
+        "max_wait_ms": batcher.max_wait * 1000,
+        **batcher.metrics.snapshot(),
+    }
+
+
+@api_router.get("/models", response_model=schemas.ModelStatus, status_code=200)
+def models() -> dict:
+    """
+    Model versions.
+    Returns the active, previous and candidate versions, the shadow traffic percentage,
+    the versions saved on disk and how the candidate's shadow predictions compare.
+    """
+    return {**model_registry.status(), "shadow": shadow.snapshot()}
+
+
+# Admin endpoints change what every client is served, so they take a bearer token
+admin_bearer = HTTPBearer(auto_error=False)
+
+
+def require_admin(credentials: Optional[HTTPAuthorizationCredentials] = Depends(admin_bearer)) -> None:
+    """Rejects admin calls: 403 while ADMIN_TOKEN is not set, 401 without the matching bearer token."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (ADMIN_TOKEN is not set)")
+    if credentials is None or not secrets.compare_digest(credentials.credentials.encode(), settings.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing admin token", headers={"WWW-Authenticate": "Bearer"})
+
+
+@api_router.post("/models/activate", response_model=schemas.ModelStatus, status_code=200, dependencies=[Depends(require_admin)])
+async def activate_model(body: schemas.ActivateModel) -> dict:
+    """
+    Hot-swaps the served model (admin: requires the ADMIN_TOKEN bearer token).
+    The version is loaded and warmed in a background thread while the current one keeps
+    serving, then becomes active at once; activating the previous version rolls back.
+    Process workers load the new version on their first request for it.
+    """
+    try:
+        await asyncio.to_thread(model_registry.activate, body.version)
+    except ValueError as error:
+        raise HTTPException(status_code=404, detail=str(error))
+    return models()
+
+
+@api_router.post("/models/shadow", response_model=schemas.ModelStatus, status_code=200, dependencies=[Depends(require_admin)])
+async def shadow_traffic(body: schemas.ShadowTraffic) -> dict:
+    """
+    Routes a percentage of /predict requests to a candidate version for shadow scoring (admin).
+    The candidate is warmed first; its predictions are only compared, never returned.
+    """
+    try:
+        await asyncio.to_thread(model_registry.set_candidate, body.version, body.percent)
+    except ValueError as error:
+        raise HTTPException(status_code=404, detail=str(error))
+    return models()
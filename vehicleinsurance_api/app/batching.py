@@ -0,0 +1,144 @@
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Tuple
+import pandas as pd
+from app.executor import InferenceExecutor
+from app.metrics import Histogram
+
+# A queued request: its input rows, the future its caller awaits and the time it was queued
+QueuedRequest = Tuple[pd.DataFrame, asyncio.Future, float]
+
+
+class BatchingMetrics:
+    """Batch size and queue wait statistics of the prediction micro-batcher."""
+
+    def __init__(self):
+        self.batch_rows = Histogram(buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256, 512])
+        self.batch_requests = Histogram(buckets=[1, 2, 4, 8, 16, 32, 64])
+        self.queue_wait_ms = Histogram(buckets=[0.5, 1, 2, 5, 10, 25, 50, 100, 250, 1000])
+
+    def snapshot(self) -> dict:
+        return {
+            "batch_rows": self.batch_rows.snapshot(),
+            "batch_requests": self.batch_requests.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+        }
+
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent prediction requests into micro-batches.
+    Requests are queued and merged into one DataFrame until max_batch_size rows are collected
+    or max_wait_ms has passed since the first one arrived; the merged batch is scored with a
+    single predict call and the results are split back to each caller. Batches are scored on
+    the given executor, so new requests keep being collected while earlier batches run.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[..., dict],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        executor: Optional[InferenceExecutor] = None,
+        predict_options: Optional[Callable[[], dict]] = None,
+    ):
+        self.predict = predict  # make_prediction-compatible callable
+        self.predict_options = predict_options  # Extra keyword arguments for predict, read once per batch
+        self.executor = executor or InferenceExecutor(kind="inline")
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.metrics = BatchingMetrics()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._carry: Optional[QueuedRequest] = None  # Request that did not fit into the previous batch
+
+    def _ensure_worker(self) -> None:
+        """Starts the batching task on the running event loop if it is not running yet."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._carry = None
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, input_df: pd.DataFrame) -> dict:
+        """Queues the rows for the next batch and waits for their share of the results."""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((input_df, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> List[QueuedRequest]:
+        """Waits for the first request, then gathers more until the batch is full or the wait expires."""
+        loop = asyncio.get_running_loop()
+        if self._carry is not None:
+            first, self._carry = self._carry, None
+        else:
+            first = await self._queue.get()
+        batch, rows = [first], len(first[0])
+        deadline = loop.time() + self.max_wait
+
+        while rows < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if rows + len(item[0]) > self.max_batch_size:
+                self._carry = item  # Keep it for the next batch rather than overshooting this one
+                break
+            batch.append(item)
+            rows += len(item[0])
+
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            loop.create_task(self._score(batch))
+
+    async def _score(self, batch: List[QueuedRequest]) -> None:
+        """Scores one merged batch and resolves every caller's future with its own rows."""
+
+        # Callers that went away no longer need results
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+
+        now = time.perf_counter()
+        for _, _, queued_at in batch:
+            self.metrics.queue_wait_ms.observe((now - queued_at) * 1000)
+        self.metrics.batch_requests.observe(len(batch))
+        self.metrics.batch_rows.observe(sum(len(frame) for frame, _, _ in batch))
+
+        try:
+            merged = pd.concat([frame for frame, _, _ in batch], ignore_index=True)
+            options = self.predict_options() if self.predict_options else {}
+            results = await self.executor.run(self.predict, input_data=merged, **options)
+
+            # Validation errors refer to merged row positions; score each caller alone so it gets its own
+            if results["errors"] is not None and len(batch) > 1:
+                for frame, future, _ in batch:
+                    _resolve(future, await self.executor.run(self.predict, input_data=frame, **options))
+                return
+
+            offset = 0
+            for frame, future, _ in batch:
+                predictions = results["predictions"]
+                if predictions is not None:
+                    predictions = predictions[offset:offset + len(frame)]
+                _resolve(future, {**results, "predictions": predictions})
+                offset += len(frame)
+
+        except Exception as error:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    """Sets a caller's result unless the caller has been cancelled meanwhile."""
+    if not future.done():
+        future.set_result(result)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException, Request
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.predict import make_prediction_proba
+from vehicleinsurance_model.processing.validation import validate_inputs
+from vehicleinsurance_model.registry import model_registry
+from app.executor import InferenceExecutor
+
+
+class RequestCancelled(HTTPException):
+    """Raised when a request's remaining chunks are abandoned: its client went away or its deadline passed."""
+
+
+def _offset_errors(errors: str, offset: int) -> list:
+    """Validation errors of a chunk with their row positions shifted to the whole request's."""
+    errors = json.loads(errors)
+    for error in errors:
+        error["loc"][1] += offset
+    return errors
+
+
+def validation_errors(*, input_data: pd.DataFrame) -> Optional[str]:
+    """Validation errors of records without scoring them (module level, so process workers can run it)."""
+    return validate_inputs(input_df=input_data)[1]
+
+
+def empty_results(predict: Callable[..., dict], **options: Any) -> dict:
+    """
+    The result of predict (make_prediction or make_prediction_proba) for a request without rows,
+    built without calling it: the fitted pipeline rejects empty matrices.
+    """
+    version = options.get("model_version") or model_registry.active_version
+    if predict is make_prediction_proba:
+        threshold = options.get("threshold")
+        threshold = config.model_config_.DECISION_THRESHOLD if threshold is None else threshold
+        return {"probabilities": np.empty(0), "predictions": np.empty(0, dtype=int), "threshold": threshold, "version": version, "errors": None}
+    return {"predictions": np.empty(0), "version": version, "errors": None}
+
+
+class ChunkedPredictor:
+    """
+    Scores a request as a sequence of row chunks on the inference executor, so it can be abandoned midway.
+
+    - Requests are split into chunks of at most chunk_rows rows (views, not copies); each chunk is one
+      executor call, so other requests' chunks interleave with a large request's instead of queuing
+      behind all of it.
+    - Before every chunk the client connection and the request's deadline are checked. A request
+      whose client disconnected or whose deadline passed schedules no further chunks, and the chunk
+      in flight is no longer awaited: it is cancelled if it has not started yet, and its result is
+      dropped as soon as it finishes otherwise. Its rows and partial results are then freed.
+    - Array results (predictions, probabilities) are written into output arrays allocated after the
+      first chunk, so at most one chunk's results exist besides the assembled ones.
+    - Validation errors keep their positions in the whole request; after the first chunk with errors
+      the remaining chunks are only validated, so the error list is complete.
+    - A request without rows is answered with empty results without scheduling any chunk.
+    """
+
+    def __init__(self, executor: InferenceExecutor, chunk_rows: int = 2000, timeout_seconds: float = 0.0):
+        self.executor = executor
+        self.chunk_rows = chunk_rows
+        self.timeout = timeout_seconds or None  # 0 disables the deadline
+        self.disconnected = 0  # Requests abandoned because their client went away
+        self.timed_out = 0  # Requests abandoned at their deadline
+
+    def deadline(self) -> Optional[float]:
+        """Event loop time by which a request starting now must be answered."""
+        return None if self.timeout is None else asyncio.get_running_loop().time() + self.timeout
+
+    async def _check(self, request: Request, deadline: Optional[float]) -> Optional[float]:
+        """Raises RequestCancelled when the request should stop; returns the seconds left before its deadline."""
+        if await request.is_disconnected():
+            self.disconnected += 1
+            raise RequestCancelled(status_code=499, detail="Client closed the request")
+        if deadline is None:
+            return None
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            self.timed_out += 1
+            raise RequestCancelled(status_code=504, detail=f"Request exceeded its {self.timeout:g} s deadline")
+        return remaining
+
+    async def wait(self, request: Request, work: Callable[[], Awaitable[Any]], deadline: Optional[float]) -> Any:
+        """
+        Checks the request, then starts and awaits one piece of work (a coroutine factory),
+        giving up on it (504) when the request's deadline passes first.
+        """
+        remaining = await self._check(request, deadline)
+        try:
+            return await asyncio.wait_for(work(), remaining)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise RequestCancelled(status_code=504, detail=f"Request exceeded its {self.timeout:g} s deadline")
+
+    async def run(
+        self, request: Request, predict: Callable[..., dict], input_df: pd.DataFrame, deadline: Optional[float] = None, **options: Any
+    ) -> dict:
+        """
+        Scores input_df chunk by chunk with predict (make_prediction or make_prediction_proba and their
+        options) and returns the same result structure as a single call over all the rows.
+        """
+        n_rows = len(input_df)
+        if n_rows == 0:
+            return empty_results(predict, **options)
+
+        results: Dict[str, Any] = {}
+        for start in range(0, n_rows, self.chunk_rows):
+            chunk = input_df.iloc[start:start + self.chunk_rows]
+            chunk_results = await self.wait(request, lambda: self.executor.run(predict, input_data=chunk, **options), deadline)
+
+            if chunk_results["errors"] is not None:
+                errors = _offset_errors(chunk_results["errors"], start)
+                for rest_start in range(start + self.chunk_rows, n_rows, self.chunk_rows):
+                    # Chunk by chunk as well, so validating the rest can be abandoned midway too
+                    rest = input_df.iloc[rest_start:rest_start + self.chunk_rows]
+                    rest_errors = await self.wait(request, lambda: self.executor.run(validation_errors, input_data=rest), deadline)
+                    if rest_errors is not None:
+                        errors += _offset_errors(rest_errors, rest_start)
+                return {**chunk_results, "errors": json.dumps(errors, separators=(",", ":"))}
+
+            if not results:
+                # Allocate the assembled arrays once, shaped for the whole request
+                results = {
+                    key: np.empty((n_rows,) + value.shape[1:], dtype=value.dtype) if isinstance(value, np.ndarray) else value
+                    for key, value in chunk_results.items()
+                }
+            for key, value in chunk_results.items():
+                if isinstance(value, np.ndarray):
+                    results[key][start:start + len(chunk)] = value
+            del chunk, chunk_results
+        return results
@@ -1,7 +1,8 @@
+import os
 import sys
 from typing import List
 from pydantic import AnyHttpUrl
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     """
@@ -25,9 +26,39 @@ class Settings(BaseSettings):
     # Project metadata
     PROJECT_NAME: str = "Vehicle Insurance Prediction API"
 
-    class Config:
-        """Pydantic configuration settings."""
-        case_sensitive = True  # Enforce case-sensitive environment variable parsing
+    # Opt-in micro-batching of concurrent /predict calls
+    # Requests are merged until PREDICT_MAX_BATCH_SIZE rows or PREDICT_MAX_WAIT_MS have been reached.
+    PREDICT_BATCHING: bool = False
+    PREDICT_MAX_BATCH_SIZE: int = 64
+    PREDICT_MAX_WAIT_MS: float = 5.0
+
+    # Inference executor running the blocking model work off the event loop
+    # INFERENCE_EXECUTOR is "thread", "process" (each worker loads the pipeline once) or "inline".
+    # Calls beyond INFERENCE_WORKERS running plus INFERENCE_MAX_QUEUE waiting are rejected with 503.
+    INFERENCE_EXECUTOR: str = "thread"
+    INFERENCE_WORKERS: int = os.cpu_count() or 1
+    INFERENCE_MAX_QUEUE: int = 64
+
+    # Cancellable inference: requests are scored in chunks of PREDICT_CHUNK_ROWS rows, and abandoned
+    # between chunks when the client disconnects or after PREDICT_TIMEOUT_SECONDS (0 for no deadline)
+    PREDICT_CHUNK_ROWS: int = 2000
+    PREDICT_TIMEOUT_SECONDS: float = 30.0
+
+    # NDJSON streaming on /predict/stream: records are scored in batches of at most PREDICT_STREAM_BATCH_ROWS,
+    # the first one closed PREDICT_STREAM_MAX_WAIT_MS after its first record; longer lines than PREDICT_STREAM_MAX_LINE_BYTES end the stream
+    PREDICT_STREAM_BATCH_ROWS: int = 5000
+    PREDICT_STREAM_MAX_WAIT_MS: float = 20.0
+    PREDICT_STREAM_MAX_LINE_BYTES: int = 65536
+
+    # Bearer token required by the model admin endpoints (/models/activate, /models/shadow);
+    # they are disabled (403) while it is empty
+    ADMIN_TOKEN: str = ""
+
+    # Level of the vehicleinsurance_model logs (hot-path messages are also sampled, see config.yml log_sample_rate)
+    LOG_LEVEL: str = "WARNING"
+
+    # Pydantic configuration settings
+    model_config = SettingsConfigDict(case_sensitive=True)  # Enforce case-sensitive environment variable parsing
 
 # Instantiate the settings object
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import asyncio
+import importlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, Tuple
+from vehicleinsurance_model.monitoring import inference_metrics
+
+
+class ExecutorBusy(Exception):
+    """Raised when the inference queue is full and the request should be retried later."""
+
+
+def _load_model() -> None:
+    """Process worker initializer: loads the pickled pipeline once per worker at startup."""
+    importlib.import_module("vehicleinsurance_model.registry").model_registry.warmup()
+
+
+def _run_recorded(func: Callable[..., Any], **kwargs: Any) -> Tuple[Any, list]:
+    """Process worker side of a call: its result and the inference metrics it observed, for the API process."""
+    with inference_metrics.recording() as observations:
+        result = func(**kwargs)
+    return result, observations
+
+
+def _noop() -> None:
+    """Submitted once at startup so process workers are spawned and initialized eagerly."""
+
+
+class InferenceExecutor:
+    """
+    Runs blocking inference off the event loop.
+    kind selects a thread pool, a process pool (each worker loads the pipeline once at startup)
+    or 'inline' to score on the event loop as before. At most workers + max_queue calls are
+    accepted at a time; further calls raise ExecutorBusy so the API can answer 503.
+    Inference metrics observed in process workers are sent back with each result and recorded here.
+    """
+
+    def __init__(self, kind: str = "thread", workers: int = 1, max_queue: int = 64):
+        if kind not in ("thread", "process", "inline"):
+            raise ValueError(f"Unknown inference executor kind: {kind!r}")
+
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0  # Running plus queued calls, only touched from the event loop
+        self._pool: Optional[Executor] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    @property
+    def idle(self) -> bool:
+        """Whether a pool worker is free right now (never for 'inline', which runs on the event loop)."""
+        return self.kind != "inline" and self.in_flight < self.workers
+
+    def start(self) -> None:
+        """Creates the worker pool; process workers load the model before serving any request."""
+        if self._pool is not None or self.kind == "inline":
+            return
+        if self.kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inference")
+        else:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_load_model)
+            self._pool.submit(_noop).result()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Awaits func(**kwargs) on the pool, rejecting the call when the queue is full."""
+        if self.kind == "inline":
+            return func(**kwargs)
+        if self.in_flight >= self.capacity:
+            raise ExecutorBusy(f"Inference queue is full ({self.in_flight} calls in flight)")
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            future = self._pool.submit(partial(_run_recorded, func, **kwargs) if self.kind == "process" else partial(func, **kwargs))
+        except Exception:
+            self.in_flight -= 1
+            raise
+        # The call holds its slot until the pool is done with it, not until the caller stops waiting:
+        # work abandoned by a disconnected client keeps running (unless it had not started yet).
+        # Registered before wrap_future's own callback, so the slot is free when the caller resumes.
+        future.add_done_callback(lambda _: self._release(loop))
+        if self.kind != "process":
+            return await asyncio.wrap_future(future)
+        result, observations = await asyncio.wrap_future(future)
+        inference_metrics.replay(observations)
+        return result
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Frees a call's slot on the event loop once its pool future is done (from a pool thread)."""
+        try:
+            loop.call_soon_threadsafe(self._decrement)
+        except RuntimeError:
+            pass  # The event loop is closed: nothing waits for the slot any more
+
+    def _decrement(self) -> None:
+        self.in_flight -= 1
@@ -1,11 +1,15 @@
+import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from app.api import api_router
+from fastapi.responses import HTMLResponse, Response
+from app.api import api_router, batcher, chunked, executor
 from app.config import settings
+from app.metrics import PROMETHEUS_CONTENT_TYPE, render_metrics
+from vehicleinsurance_model.registry import model_registry
 
 # Dynamically resolve file paths for module imports
 file = Path(__file__).resolve()
@@ -14,10 +18,24 @@ parent, root = file.parent, file.parents[1]
 # Add parent directory to Python's module search path
 sys.path.append(str(root))
 
+# Leveled logging for the model package; nothing below LOG_LEVEL is formatted or emitted
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logging.getLogger("vehicleinsurance_model").setLevel(settings.LOG_LEVEL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Loads the model and starts the inference workers before serving, and stops them on shutdown."""
+    model_registry.warmup()
+    executor.start()
+    yield
+    executor.shutdown()
+
+
 # Initialize the FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,  # API title from config settings
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"  # Define OpenAPI documentation URL
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",  # Define OpenAPI documentation URL
+    lifespan=lifespan  # Inference executor startup and shutdown
 )
 
 # Create an API router for handling root-level requests
@@ -44,6 +62,12 @@ def index(request: Request) -> Any:
     return HTMLResponse(content=body)
 
 
+@root_router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus scrape endpoint: inference stage latencies, rows per call, micro-batching and abandoned requests."""
+    return Response(content=render_metrics(batcher.metrics, chunked), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # Include API routers for handling different routes
 app.include_router(api_router, prefix=settings.API_V1_STR)
 app.include_router(root_router)
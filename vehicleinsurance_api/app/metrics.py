@@ -0,0 +1,27 @@
+from vehicleinsurance_model.monitoring import Histogram, inference_metrics, prometheus_histogram
+
+__all__ = ["Histogram", "inference_metrics", "prometheus_histogram", "render_metrics"]
+
+# Media type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_metrics(batching, chunked) -> str:
+    """
+    The service's metrics in the Prometheus text exposition format: per-stage inference latencies
+    and rows per call, the micro-batching histograms and the requests abandoned midway.
+    Stages run in process workers (INFERENCE_EXECUTOR=process) are sent back with each result and
+    included as well, except for calls whose caller stopped waiting; decoding and encoding always
+    run in the API process.
+    """
+    return inference_metrics.render_prometheus() + "".join([
+        prometheus_histogram("vehicleinsurance_batch_rows", "Rows per micro-batch.", {"": batching.batch_rows}),
+        prometheus_histogram("vehicleinsurance_batch_requests", "Requests per micro-batch.", {"": batching.batch_requests}),
+        prometheus_histogram(
+            "vehicleinsurance_batch_queue_wait_milliseconds", "Time requests waited for their micro-batch.", {"": batching.queue_wait_ms}
+        ),
+        "# HELP vehicleinsurance_abandoned_requests_total Requests whose remaining chunks were not scored.\n",
+        "# TYPE vehicleinsurance_abandoned_requests_total counter\n",
+        f'vehicleinsurance_abandoned_requests_total{{reason="disconnect"}} {chunked.disconnected}\n',
+        f'vehicleinsurance_abandoned_requests_total{{reason="deadline"}} {chunked.timed_out}\n',
+    ])
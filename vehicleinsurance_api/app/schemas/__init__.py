@@ -1,2 +1,4 @@
+from .batching import BatchingStats
 from .health import Health
-from .predict import MultipleDataInputs, PredictionResults
+from .models import ActivateModel, ModelStatus, ShadowStats, ShadowTraffic
+from .predict import ColumnarDataInputs, DataInputSchema, MultipleDataInputs, PredictionResults, ProbabilityResults
@@ -0,0 +1,19 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class HistogramStats(BaseModel):
+    count: int
+    sum: float
+    mean: float
+    buckets: Dict[str, int]
+
+
+class BatchingStats(BaseModel):
+    enabled: bool
+    max_batch_size: int
+    max_wait_ms: float
+    batch_rows: HistogramStats
+    batch_requests: HistogramStats
+    queue_wait_ms: HistogramStats
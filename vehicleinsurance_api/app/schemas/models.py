@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from .batching import HistogramStats
+
+
+class ShadowStats(BaseModel):
+    requests: int
+    rows: int
+    disagreements: int
+    agreement_rate: float
+    skipped: int
+    errors: int
+    latency_ms: HistogramStats
+
+
+class ModelStatus(BaseModel):
+    active: str
+    previous: Optional[str]
+    candidate: Optional[str]
+    shadow_percent: float
+    loaded: List[str]
+    available: List[str]
+    shadow: ShadowStats
+
+
+class ActivateModel(BaseModel):
+    version: str
+
+
+class ShadowTraffic(BaseModel):
+    version: Optional[str] = Field(None, description="Candidate version, or null to stop shadow scoring")
+    percent: float = Field(0.0, ge=0.0, le=100.0, description="Share of requests also scored by the candidate")
@@ -1,31 +1,66 @@
 from typing import Any, List, Optional, Union
-import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
 
 
 class PredictionResults(BaseModel):
     errors: Optional[Any]
     version: str
-    #predictions: Optional[List[int]]
-    predictions: Optional[int]
+    predictions: Optional[List[int]]
+
+
+class ProbabilityResults(BaseModel):
+    errors: Optional[Any]
+    version: str
+    threshold: float
+    probabilities: Optional[List[float]]
+    predictions: Optional[List[int]]
+    top_k: Optional[List[int]] = None
 
 
 class DataInputSchema(BaseModel):
-    dteday: Optional[str]
-    season: Optional[str]
-    hr: Optional[str]
-    holiday: Optional[str]
-    weekday: Optional[str]
-    workingday: Optional[str]
-    weathersit: Optional[str]
-    temp: Optional[float]
-    atemp: Optional[float]
-    hum: Optional[float]
-    windspeed: Optional[float]
-    yr: Optional[int]
-    mnth: Optional[str]
+    """One policy record. Values are checked against the model's own schema when scoring."""
+    id: Optional[int]
+    Gender: Optional[str]
+    Age: Optional[int]
+    Driving_License: Optional[int]
+    Region_Code: Optional[float]
+    Previously_Insured: Optional[int]
+    Vehicle_Age: Optional[str]
+    Vehicle_Damage: Optional[str]
+    Annual_Premium: Optional[float]
+    Policy_Sales_Channel: Optional[float]
+    Vintage: Optional[int]
+
+
+class ColumnarDataInputs(BaseModel):
+    """
+    Policy records as one list of values per field, all of the same length.
+    Each list becomes a DataFrame column directly, without building an object per record.
+    Keys other than the fields are rejected.
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    id: List[Optional[int]]
+    Gender: List[Optional[str]]
+    Age: List[Optional[int]]
+    Driving_License: List[Optional[int]]
+    Region_Code: List[Optional[float]]
+    Previously_Insured: List[Optional[int]]
+    Vehicle_Age: List[Optional[str]]
+    Vehicle_Damage: List[Optional[str]]
+    Annual_Premium: List[Optional[float]]
+    Policy_Sales_Channel: List[Optional[float]]
+    Vintage: List[Optional[int]]
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "ColumnarDataInputs":
+        lengths = {name: len(values) for name, values in self}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"All columns must have the same number of values, got {lengths}")
+        return self
 
 
 class MultipleDataInputs(BaseModel):
-    inputs: List[DataInputSchema]
+    """A batch of records, either as a list of row objects or as columns of values."""
+    inputs: Union[List[DataInputSchema], ColumnarDataInputs]
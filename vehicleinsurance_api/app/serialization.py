@@ -0,0 +1,128 @@
+from typing import Any
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import ValidationError
+from app import schemas
+from app.metrics import inference_metrics
+
+# Media type of MessagePack request and response bodies
+MSGPACK = "application/msgpack"
+
+
+def _msgpack():
+    """Imports msgpack, which is only needed for application/msgpack bodies."""
+    try:
+        import msgpack
+    except ImportError:
+        raise HTTPException(status_code=415, detail=f"{MSGPACK} bodies require msgpack: pip install msgpack")
+    return msgpack
+
+
+def _encode_numpy(value: Any) -> Any:
+    """msgpack fallback for NumPy values, which it does not serialize natively."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class NumpyORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, which writes NumPy arrays and scalars natively."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+class MsgpackResponse(Response):
+    """MessagePack response; NumPy arrays are written as plain lists."""
+
+    media_type = MSGPACK
+
+    def render(self, content: Any) -> bytes:
+        return _msgpack().packb(content, default=_encode_numpy)
+
+
+def encode_response(request: Request, content: dict) -> Response:
+    """
+    Renders the result as MessagePack when the client accepts it, otherwise as JSON with orjson.
+    The body is rendered when the response is created, which is timed as the "encode" stage.
+    """
+    with inference_metrics.time("encode"):
+        if MSGPACK in request.headers.get("accept", ""):
+            return MsgpackResponse(content)
+        return NumpyORJSONResponse(content)
+
+
+def input_frame(input_data: schemas.MultipleDataInputs) -> pd.DataFrame:
+    """
+    DataFrame of the request's records.
+    Columnar bodies are passed to pandas as whole columns; row bodies are read record by record.
+    Missing values become None in object columns and NaN in numeric ones.
+    """
+    if isinstance(input_data.inputs, schemas.ColumnarDataInputs):
+        return pd.DataFrame(dict(input_data.inputs))
+    return pd.DataFrame.from_records(
+        [row.model_dump() for row in input_data.inputs], columns=list(schemas.DataInputSchema.model_fields)
+    )
+
+
+def _columnar_frame(inputs: dict) -> pd.DataFrame:
+    """
+    DataFrame of a columnar body without the per-value Pydantic pass.
+    Only the shape is checked here (every field present, as lists of equal length, and no other keys);
+    the values are checked by the model's vectorized input validation when scoring.
+    """
+    fields = list(schemas.ColumnarDataInputs.model_fields)
+    errors = [
+        {"type": "missing" if name not in inputs else "list_type", "loc": ["body", "inputs", name],
+         "msg": "Field required" if name not in inputs else "Input should be a valid list", "input": None}
+        for name in fields
+        if not isinstance(inputs.get(name), list)
+    ]
+    errors += [
+        {"type": "extra_forbidden", "loc": ["body", "inputs", name], "msg": "Extra inputs are not permitted", "input": None}
+        for name in inputs
+        if name not in schemas.ColumnarDataInputs.model_fields
+    ]
+    if not errors and len({len(inputs[name]) for name in fields}) > 1:
+        errors.append({"type": "value_error", "loc": ["body", "inputs"], "msg": "All columns must have the same number of values", "input": None})
+    if errors:
+        raise RequestValidationError(errors)
+    return pd.DataFrame({name: inputs[name] for name in fields})
+
+
+async def decode_inputs(request: Request) -> pd.DataFrame:
+    """
+    Reads a MultipleDataInputs body, JSON (decoded with orjson) or MessagePack, into a DataFrame.
+    Columnar bodies go straight into pandas; row bodies are validated by MultipleDataInputs first.
+    Malformed bodies are answered with 422, like FastAPI's own body validation.
+    Parsing and building the DataFrame are timed as the "decode" stage.
+    """
+    body = await request.body()
+    with inference_metrics.time("decode"):
+        return _decode_body(request, body)
+
+
+def _decode_body(request: Request, body: bytes) -> pd.DataFrame:
+    try:
+        if request.headers.get("content-type", "").startswith(MSGPACK):
+            payload = _msgpack().unpackb(body)
+        else:
+            payload = orjson.loads(body)
+    except (ValueError, TypeError) as error:
+        raise RequestValidationError([{"type": "value_error", "loc": ["body"], "msg": f"Malformed request body: {error}", "input": None}])
+
+    inputs = payload.get("inputs") if isinstance(payload, dict) else None
+    if isinstance(inputs, dict):
+        return _columnar_frame(inputs)
+
+    try:
+        input_data = schemas.MultipleDataInputs.model_validate(payload)
+    except ValidationError as error:
+        raise RequestValidationError(error.errors(include_url=False, include_context=False))
+    return input_frame(input_data)
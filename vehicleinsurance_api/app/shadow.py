@@ -0,0 +1,57 @@
+import time
+from typing import Any, Callable
+import numpy as np
+import pandas as pd
+from app.executor import InferenceExecutor
+from app.metrics import Histogram
+
+
+class ShadowScorer:
+    """
+    Scores a share of the traffic with the registry's candidate model version for comparison.
+    It runs after the response has been sent, and only when an inference worker is idle,
+    so live requests are never delayed by it; requests it had to skip are counted.
+    The candidate's predictions are compared with the ones the active version returned.
+    """
+
+    def __init__(self, predict: Callable[..., dict], executor: InferenceExecutor):
+        self.predict = predict  # make_prediction-compatible callable accepting model_version
+        self.executor = executor
+        self.requests = 0
+        self.rows = 0
+        self.disagreements = 0  # Rows where the candidate's prediction differs from the active one
+        self.skipped = 0
+        self.errors = 0
+        self.latency_ms = Histogram(buckets=[1, 5, 10, 25, 50, 100, 250, 1000])
+
+    async def score(self, input_df: pd.DataFrame, predictions: np.ndarray, version: str) -> None:
+        """Scores the request's rows with the candidate version and records how often it disagrees."""
+        if not self.executor.idle:
+            self.skipped += 1
+            return
+
+        start = time.perf_counter()
+        try:
+            results = await self.executor.run(self.predict, input_data=input_df, model_version=version)
+        except Exception:
+            self.errors += 1
+            return
+        if results["errors"] is not None:
+            self.errors += 1
+            return
+
+        self.latency_ms.observe((time.perf_counter() - start) * 1000)
+        self.requests += 1
+        self.rows += len(input_df)
+        self.disagreements += int(np.count_nonzero(results["predictions"] != predictions))
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "rows": self.rows,
+            "disagreements": self.disagreements,
+            "agreement_rate": 1 - self.disagreements / self.rows if self.rows else 1.0,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "latency_ms": self.latency_ms.snapshot(),
+        }
@@ -0,0 +1,259 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
+import orjson
+import pandas as pd
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+from app import schemas
+from app.executor import ExecutorBusy, InferenceExecutor
+
+# Media type of newline-delimited JSON request and response bodies
+NDJSON = "application/x-ndjson"
+
+# Marks the end of the request body in the record queue
+_END = object()
+
+
+class StreamError(Exception):
+    """Raised when the request body cannot be read as NDJSON any further."""
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming NDJSON response whose body generator reads the request body itself.
+    StreamingResponse would otherwise listen for the client disconnecting on the same ASGI
+    receive channel and consume the body chunks; a disconnect surfaces through request.stream().
+    """
+
+    media_type = NDJSON
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _line(content: dict) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+
+
+def _parse(line: bytes, row: int) -> Tuple[int, Any]:
+    """(row, record) for a JSON object line, (row, error message) otherwise."""
+    try:
+        record = orjson.loads(line)
+    except orjson.JSONDecodeError as error:
+        return row, f"Malformed JSON: {error}"
+    if not isinstance(record, dict):
+        return row, "Each line must be a JSON object with the DataInputSchema fields"
+    return row, record
+
+
+async def read_records(request: Request, queue: asyncio.Queue, max_line_bytes: int) -> None:
+    """
+    Reads the request body chunk by chunk and queues, per body chunk, the list of its parsed lines
+    as (row, record or error). The queue is bounded, so the body is only read as fast as it is scored.
+    A line longer than max_line_bytes ends the stream; any failure (e.g. the client disconnecting)
+    is queued for the consumer.
+    """
+    buffer, row = b"", 0
+    try:
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            if len(buffer) > max_line_bytes:
+                raise StreamError(f"Line {row + len(lines)} exceeds {max_line_bytes} bytes")
+            parsed = []
+            for line in lines:
+                if line.strip():
+                    parsed.append(_parse(line, row))
+                    row += 1
+            if parsed:
+                await queue.put(parsed)
+        if buffer.strip():
+            await queue.put([_parse(buffer, row)])
+        await queue.put(_END)
+    except Exception as error:
+        await queue.put(error)
+
+
+class StreamScorer:
+    """
+    Scores an NDJSON stream of records in bounded micro-batches and streams NDJSON results back.
+
+    - A reader task parses the body as it arrives and queues the records of each body chunk; the
+      queue holds two chunks, so the body is only read as fast as it is scored.
+    - While one batch is scored on the inference executor the next one is collected, and it is closed
+      as soon as the scored one is done (or at batch_rows records): batches grow with the load and
+      the executor never waits for the body. The first batch is closed max_wait_ms after its first
+      record, so the first predictions go out without waiting for the rest of the body.
+    - At most these two batches and the queued chunks are held: memory per connection is bounded
+      whatever the body size.
+    - Every record gets one output line, in input order: {"row", "id", "prediction"}, or
+      {"row", "errors"} when the record is malformed or fails validation; the batch's other
+      records are still scored. When the model fails on a batch its records are rescored one by
+      one, and those it fails on get a {"row", "error"} line. A busy executor gives one
+      {"rows": [first, last], "error"} line for the batch, and a failure of the stream itself a
+      final {"error"} line.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[..., dict],
+        executor: InferenceExecutor,
+        batch_rows: int = 5000,
+        max_wait_ms: float = 20.0,
+        max_line_bytes: int = 65536,
+    ):
+        self.predict = predict  # make_prediction-compatible callable
+        self.executor = executor
+        self.batch_rows = batch_rows
+        self.max_wait = max_wait_ms / 1000
+        self.max_line_bytes = max_line_bytes
+
+    async def _next(self, queue: asyncio.Queue, timeout: Optional[float] = None, pending: Optional[asyncio.Task] = None):
+        """
+        The next list of records from the reader, _END at the end of the body, or None when the timeout
+        expires or the pending batch finishes scoring first. Reader failures are raised.
+        """
+        if queue.empty() and (timeout is not None or pending is not None):
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait([getter] + ([pending] if pending is not None else []), timeout=timeout,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()  # A cancelled Queue.get() takes nothing from the queue
+                return None
+            item = getter.result()
+        else:
+            item = await queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def _collect(self, queue: asyncio.Queue, carry: list, pending: Optional[asyncio.Task]) -> Tuple[list, list, bool]:
+        """
+        Gathers the next batch of at most batch_rows records. Returns (batch, carried over records, body ended).
+        The batch is closed when it is full, when the body ends, or - once it holds a record - when the
+        batch being scored finishes; with nothing being scored, max_wait_ms after its first record.
+        """
+        loop = asyncio.get_running_loop()
+        batch, deadline = carry, None  # carry is a fresh slice, extended in place
+        while len(batch) < self.batch_rows:
+            try:
+                if not batch:
+                    item = await self._next(queue)
+                elif pending is not None and not pending.done():
+                    item = await self._next(queue, pending=pending)
+                else:
+                    deadline = deadline or loop.time() + self.max_wait
+                    item = await self._next(queue, timeout=max(deadline - loop.time(), 0))
+            except Exception as error:
+                if not batch:
+                    raise
+                queue.put_nowait(error)  # The reader has stopped: score the records read so far, then fail
+                break
+            if item is None:
+                break
+            if item is _END:
+                return batch[:self.batch_rows], batch[self.batch_rows:], True
+            batch.extend(item)
+        return batch[:self.batch_rows], batch[self.batch_rows:], False
+
+    async def _predict(self, records: List[Tuple[int, dict]], outputs: dict, options: dict) -> Optional[list]:
+        """
+        Scores records into outputs (row -> output line): invalid records get their errors and the rest
+        is scored without them. Returns the validation errors that name no record, if any.
+        """
+        while records:
+            frame = pd.DataFrame.from_records([record for _, record in records], columns=list(schemas.DataInputSchema.model_fields))
+            results = await self.executor.run(self.predict, input_data=frame, **options)
+            if results["errors"] is None:
+                for (row, record), prediction in zip(records, results["predictions"]):
+                    outputs[row] = {"row": row, "id": record.get("id"), "prediction": int(prediction)}
+                return None
+
+            # Report the invalid records and score the rest of the batch without them
+            invalid = {}
+            for error in json.loads(results["errors"]):
+                position = error["loc"][1]
+                error["loc"][1] = records[position][0]
+                invalid.setdefault(position, []).append(error)
+            for position, errors in invalid.items():
+                outputs[records[position][0]] = {"row": records[position][0], "errors": errors}
+            if not invalid:
+                return json.loads(results["errors"])
+            records = [record for position, record in enumerate(records) if position not in invalid]
+        return None
+
+    async def _predict_each(self, records: List[Tuple[int, dict]], outputs: dict, options: dict) -> Optional[list]:
+        """Scores the records not answered yet one at a time with _predict; those the model fails on get an error line."""
+        errors = None
+        for row, record in records:
+            if row not in outputs:
+                try:
+                    errors = await self._predict([(row, record)], outputs, options) or errors
+                except ExecutorBusy:
+                    raise
+                except Exception as error:
+                    outputs[row] = {"row": row, "error": str(error) or type(error).__name__}
+        return errors
+
+    async def _score(self, batch: List[Tuple[int, Any]], options: dict) -> bytes:
+        """Scores one batch and returns its output lines, in row order."""
+        outputs = {
+            row: {"row": row, "errors": [{"type": "json_invalid", "loc": ["inputs", row], "msg": value}]}
+            for row, value in batch
+            if isinstance(value, str)
+        }
+        records = [(row, value) for row, value in batch if isinstance(value, dict)]
+        try:
+            try:
+                errors = await self._predict(records, outputs, options)
+            except ExecutorBusy:
+                raise
+            except Exception:
+                # A valid record can still make the model fail (e.g. nulls it cannot impute):
+                # rescore the batch record by record, so only the failing records get an error line
+                errors = await self._predict_each(records, outputs, options)
+        except ExecutorBusy as error:
+            # The stream goes on with the next batch
+            return _line({"rows": [batch[0][0], batch[-1][0]], "error": str(error) or type(error).__name__})
+        if errors:
+            return _line({"rows": [batch[0][0], batch[-1][0]], "errors": errors})
+        return b"".join(_line(outputs[row]) for row in sorted(outputs))
+
+    async def stream(self, request: Request, **options: Any) -> AsyncIterator[bytes]:
+        """
+        Output body of the stream: the lines of each batch as soon as it has been scored and the next one read.
+        options are passed to every predict call (e.g. the model version, fixed for the whole stream).
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)  # Body chunks parsed ahead of the batch being collected
+        reader = asyncio.create_task(read_records(request, queue, self.max_line_bytes))
+        pending: Optional[asyncio.Task] = None
+        try:
+            carry, ended = [], False
+            while carry or not ended:
+                if ended:
+                    batch, carry = carry[:self.batch_rows], carry[self.batch_rows:]
+                else:
+                    batch, carry, ended = await self._collect(queue, carry, pending)
+                scoring = asyncio.create_task(self._score(batch, options)) if batch else None
+                if pending is not None:
+                    yield await pending
+                pending = scoring
+            if pending is not None:
+                yield await pending
+                pending = None
+        except StreamError as error:
+            if pending is not None:
+                yield await pending
+                pending = None
+            yield _line({"error": str(error)})
+        except ClientDisconnect:
+            return
+        finally:
+            # The stream ended early: stop reading the body and drop the work in progress
+            reader.cancel()
+            if pending is not None:
+                pending.cancel()
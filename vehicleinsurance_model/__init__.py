@@ -2,8 +2,9 @@ import sys
 from pathlib import Path
 file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
+if str(root) not in sys.path:
+    sys.path.append(str(root))
 
-from vehicleinsurance_model.config.core import PACKAGE_ROOT, config
-with open(PACKAGE_ROOT / "VERSION") as version_file:
-    __version__ = version_file.read().strip()
\ No newline at end of file
+# Read the version directly; the YAML configuration is only parsed by modules that need it
+with open(parent / "VERSION") as version_file:
+    __version__ = version_file.read().strip()
@@ -0,0 +1,245 @@
+import sys
+from pathlib import Path
+# Dynamically resolve file paths for module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to Python's module search path
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import argparse
+import json
+from typing import Iterator, List, Optional, Union
+import numpy as np
+import pandas as pd
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.monitoring import logger
+from vehicleinsurance_model.predict import _predict_proba_validated
+from vehicleinsurance_model.processing.profiling import PipelineProfiler
+from vehicleinsurance_model.processing.scoring import TopK, apply_threshold, check_threshold, positive_proba
+from vehicleinsurance_model.processing.validation import validate_inputs
+from vehicleinsurance_model.registry import model_registry
+
+
+def _require_pyarrow():
+    """Imports pyarrow for Parquet support, which is an optional dependency."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Parquet input/output requires pyarrow: pip install pyarrow") from error
+    return pyarrow
+
+
+def read_chunks(*, input_path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Reads an input file in chunks of at most chunksize rows.
+    CSV files are read with pd.read_csv(chunksize=...), Parquet files batch by batch within row groups.
+    """
+    if input_path.suffix == ".parquet":
+        pyarrow = _require_pyarrow()
+        parquet_file = pyarrow.parquet.ParquetFile(input_path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(input_path, chunksize=chunksize) as reader:
+            yield from reader
+
+
+class PredictionWriter:
+    """
+    Appends scored chunks to a CSV or Parquet output file as they are produced,
+    so only the current chunk is ever held in memory.
+    """
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self._parquet_writer = None
+        self._header_written = False
+
+    def write(self, scored: pd.DataFrame) -> None:
+        if self.output_path.suffix == ".parquet":
+            pyarrow = _require_pyarrow()
+            table = pyarrow.Table.from_pandas(scored, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pyarrow.parquet.ParquetWriter(self.output_path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            scored.to_csv(self.output_path, mode="a" if self._header_written else "w", header=not self._header_written, index=False)
+            self._header_written = True
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def _drop_invalid(chunk: pd.DataFrame, errors: str, row_offset: int, invalid: List[dict]) -> pd.DataFrame:
+    """
+    Appends the chunk's invalid records to invalid as {"row", id, "errors"}, with rows counted from
+    row_offset, and returns the validated data of its other records.
+    """
+    rows = {}
+    for error in json.loads(errors):
+        position = error["loc"][1]
+        error["loc"][1] = row_offset + position  # loc is ("inputs", row, field)
+        rows.setdefault(position, []).append(error)
+    ids = chunk[config.model_config_.id_var].to_numpy() if config.model_config_.id_var in chunk else np.full(len(chunk), None)
+    for position, row_errors in sorted(rows.items()):
+        invalid.append({"row": row_offset + position, config.model_config_.id_var: ids[position], "errors": json.dumps(row_errors)})
+
+    # Only this path validates records twice
+    valid = np.ones(len(chunk), dtype=bool)
+    valid[list(rows)] = False
+    return validate_inputs(input_df=chunk.iloc[valid])[0]
+
+
+def score_chunk(
+    *,
+    chunk: pd.DataFrame,
+    proba: bool = False,
+    fused: bool = False,
+    threshold: Optional[float] = None,
+    profiler: Optional[PipelineProfiler] = None,
+    row_offset: int = 0,
+    invalid: Optional[List[dict]] = None,
+) -> pd.DataFrame:
+    """
+    Validates and scores one chunk of raw records.
+    Returns the record ids with their predictions and, optionally, the positive-class probability.
+    Probabilities and labels come from the same forest pass; with a threshold, a record is
+    labelled 1 when its probability exceeds it, otherwise the label is the most probable class.
+    With a profiler, every named pipeline step and the forest are profiled.
+
+    row_offset is the position of the chunk's first row in the whole input, used in error rows.
+    Without an invalid list a chunk with validation errors raises ValueError; with one, its
+    invalid records are appended to it as {"row", id, "errors"} and the other records are scored.
+    """
+    validated_data, errors = validate_inputs(input_df=chunk)
+    if errors:
+        if invalid is None:
+            raise ValueError(f"Validation failed for chunk starting at row {row_offset}: {errors}")
+        validated_data = _drop_invalid(chunk, errors, row_offset, invalid)
+
+    # Ensure validated data is in the correct feature order before prediction
+    validated_data = validated_data.reindex(columns=config.model_config_.features)
+
+    if profiler is not None:
+        profiler.add_rows(len(validated_data))
+    if len(validated_data):
+        probabilities, classes = _predict_proba_validated(validated_data, fused=fused, engine="sklearn", profiler=profiler)
+        positive = positive_proba(probabilities, classes)
+        predictions = classes.take(np.argmax(probabilities, axis=1)) if threshold is None else apply_threshold(positive, classes, threshold)
+    else:
+        positive = predictions = np.empty(0)
+
+    scored = pd.DataFrame({
+        config.model_config_.id_var: validated_data[config.model_config_.id_var].to_numpy(),
+        "prediction": predictions,
+    })
+    if proba:
+        scored["probability"] = positive
+    return scored
+
+
+def score_file(
+    *,
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    chunksize: int = 100_000,
+    proba: bool = False,
+    fused: bool = False,
+    threshold: Optional[float] = None,
+    top_k: Optional[int] = None,
+    profiler: Optional[PipelineProfiler] = None,
+    errors_path: Optional[Union[str, Path]] = None,
+) -> dict:
+    """
+    Scores an input file larger than memory chunk by chunk.
+    - Reads CSV or Parquet input in chunks of chunksize rows.
+    - Validates and predicts each chunk with the trained pipeline.
+    - Writes predictions (and optionally probabilities) incrementally to the output file.
+    - Records failing validation are left out of the output and counted; with errors_path they are
+      written there (CSV or Parquet) with their row in the input, id and validation errors.
+    - With top_k, keeps a running top-k of the highest-propensity records across chunks.
+    - With a profiler, profiles every pipeline step, aggregated over the chunks.
+    Returns the number of chunks, rows read and invalid rows, and with top_k a DataFrame of the
+    top_k record ids and probabilities, highest first.
+    """
+    if threshold is not None:
+        check_threshold(threshold)
+    writer = PredictionWriter(Path(output_path))
+    errors_writer = PredictionWriter(Path(errors_path)) if errors_path is not None else None
+    ranking = TopK(top_k) if top_k is not None else None
+    n_chunks = n_rows = n_invalid = 0
+
+    try:
+        for chunk in read_chunks(input_path=Path(input_path), chunksize=chunksize):
+            invalid = []
+            scored = score_chunk(
+                chunk=chunk, proba=proba or ranking is not None, fused=fused, threshold=threshold, profiler=profiler,
+                row_offset=n_rows, invalid=invalid,
+            )
+            if invalid:
+                logger.warning("%d invalid records in the chunk starting at row %d", len(invalid), n_rows)
+                n_invalid += len(invalid)
+                if errors_writer is not None:
+                    errors_writer.write(pd.DataFrame(invalid))
+            if ranking is not None:
+                ranking.update(scored["probability"].to_numpy(), scored[config.model_config_.id_var].to_numpy())
+                if not proba:
+                    scored = scored.drop(columns="probability")
+            if len(scored):  # A chunk of invalid records only has nothing to write
+                writer.write(scored)
+            n_chunks += 1
+            n_rows += len(chunk)
+    finally:
+        writer.close()
+        if errors_writer is not None:
+            errors_writer.close()
+
+    summary = {"chunks": n_chunks, "rows": n_rows, "invalid_rows": n_invalid}
+    if ranking is not None:
+        ids, scores = ranking.result()
+        summary["top_k"] = pd.DataFrame({config.model_config_.id_var: ids, "probability": scores})
+    return summary
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stream-score a CSV or Parquet file of policy records.")
+    parser.add_argument("input_path", help="CSV or Parquet file with the model features")
+    parser.add_argument("output_path", help="CSV or Parquet file to write predictions to")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Rows scored per chunk")
+    parser.add_argument("--proba", action="store_true", help="Also write the positive-class probability")
+    parser.add_argument("--fused", action="store_true", help="Use the fused single-pass preprocessing")
+    parser.add_argument("--threshold", type=float, default=None, help="Label a record 1 when its probability exceeds this")
+    parser.add_argument("--top-k", type=int, default=None, help="Also print the top-k highest-propensity records")
+    parser.add_argument("--profile", default=None, help="Profile every pipeline step and write the report to this JSON file")
+    parser.add_argument("--errors-path", default=None, help="CSV or Parquet file to write the records failing validation to")
+    args = parser.parse_args(argv)
+    profiler = PipelineProfiler(label=model_registry.active_version) if args.profile else None
+
+    summary = score_file(
+        input_path=args.input_path,
+        output_path=args.output_path,
+        chunksize=args.chunksize,
+        proba=args.proba,
+        fused=args.fused,
+        threshold=args.threshold,
+        top_k=args.top_k,
+        profiler=profiler,
+        errors_path=args.errors_path,
+    )
+    print(f"✅ Scored {summary['rows'] - summary['invalid_rows']} rows in {summary['chunks']} chunks into {args.output_path}")
+    if summary["invalid_rows"]:
+        print(f"⚠️ Skipped {summary['invalid_rows']} invalid rows" + (f", written to {args.errors_path}" if args.errors_path else ""))
+    if args.top_k is not None:
+        print(f"Top {args.top_k} records by probability of a positive response:")
+        print(summary["top_k"].to_string(index=False))
+    if profiler is not None:
+        profiler.save(args.profile)
+        print(profiler.report())
+
+
+# Run batch scoring when script is executed directly
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+import numpy as np
+import pandas as pd
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.registry import ModelRegistry, model_registry
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU/TTL cache of per-row predictions.
+
+    - Rows are keyed on a 64-bit hash of their canonicalized feature values (every feature
+      except the unused id), together with the model version that scored them and the registry generation.
+    - At most max_entries rows are kept; the least recently used are evicted first.
+    - Entries older than ttl_seconds are treated as misses (ttl_seconds=None never expires).
+    - Loading a new pipeline bumps the registry generation, which drops every cached row; rows scored
+      while it changed are not stored, as they may come from the replaced pipeline.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: Optional[float], registry: ModelRegistry):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.registry = registry
+        self.key_columns = [feature for feature in config.model_config_.features if feature not in config.model_config_.unused_fields]
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (prediction, expiry time)
+        self._generation = registry.generation
+
+    def row_keys(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Stable hash of each row's feature values.
+        Numeric columns are hashed as float64 so 44 and 44.0 map to the same key.
+        """
+        canonical = data[self.key_columns].copy()
+        for column in canonical.columns:
+            if pd.api.types.is_numeric_dtype(canonical[column]):
+                canonical[column] = canonical[column].astype(np.float64)
+        return pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+
+    def _sync_generation(self) -> None:
+        """Drops every entry once a new pipeline has been loaded. Called with the lock held."""
+        if self.registry.generation != self._generation:
+            self._entries.clear()
+            self._generation = self.registry.generation
+
+    def predict(self, data: pd.DataFrame, predict: Callable[[pd.DataFrame], np.ndarray], model_version: Optional[str] = None) -> np.ndarray:
+        """
+        Returns the predictions for validated rows, looking every row up in the cache first.
+        Only the distinct rows that miss are passed to predict, in one batch.
+        model_version is the version predict scores with (the registry's active one by default).
+        """
+        model_version = model_version or self.registry.active_version
+        hashes = self.row_keys(data)
+        results = np.empty(len(data), dtype=object)
+        hit = np.zeros(len(data), dtype=bool)
+
+        with self._lock:
+            self._sync_generation()
+            generation = self._generation
+            now = time.monotonic()
+            for i, row_hash in enumerate(hashes):
+                entry = self._entries.get((model_version, generation, row_hash))
+                if entry is not None and entry[1] > now:
+                    results[i] = entry[0]
+                    hit[i] = True
+                    self._entries.move_to_end((model_version, generation, row_hash))
+            self.hits += int(hit.sum())
+            self.misses += int(len(data) - hit.sum())
+
+        if not hit.all():
+            # Score each distinct missing row once, then fan the predictions back out
+            missing = np.flatnonzero(~hit)
+            unique_hashes, first, inverse = np.unique(hashes[missing], return_index=True, return_inverse=True)
+            predictions = predict(data.iloc[missing[first]])
+            results[missing] = list(predictions[inverse])
+            self._store(unique_hashes, predictions, model_version, generation)
+
+        return np.asarray(list(results))
+
+    def _store(self, hashes: np.ndarray, predictions: np.ndarray, model_version: str, generation: int) -> None:
+        """Caches rows scored during the given generation, unless a new pipeline has been loaded since."""
+        with self._lock:
+            self._sync_generation()
+            if self._generation != generation:
+                return
+            expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else np.inf
+            for row_hash, prediction in zip(hashes, predictions):
+                key = (model_version, generation, row_hash)
+                self._entries[key] = (prediction, expires)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+# Cache in front of make_prediction(cache=True)
+prediction_cache = PredictionCache(
+    max_entries=config.app_config_.prediction_cache_size,
+    ttl_seconds=config.app_config_.prediction_cache_ttl_seconds,
+    registry=model_registry,
+)
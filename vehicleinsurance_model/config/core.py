@@ -5,7 +5,9 @@ file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
 
 # Add parent directory to Python's module search path
-sys.path.append(str(root))
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import os
 from typing import Dict, List
 from pydantic import BaseModel
 from strictyaml import YAML, load
@@ -18,6 +20,12 @@ CONFIG_FILE_PATH = PACKAGE_ROOT / "config.yml"  # Path to config file
 DATASET_DIR = PACKAGE_ROOT / "datasets"  # Directory containing datasets
 TRAINED_MODEL_DIR = PACKAGE_ROOT / "trained_models"  # Directory for trained models
 
+# Caches live outside the package, so they are never shipped in its sdist/wheel
+# (VEHICLEINSURANCE_CACHE_DIR overrides the default ~/.cache/vehicleinsurance_model)
+CACHE_DIR = Path(os.environ.get("VEHICLEINSURANCE_CACHE_DIR") or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "vehicleinsurance_model")
+TRAINING_CACHE_DIR = CACHE_DIR / "training_cache"  # Cached preprocessing output of training runs
+DATASET_CACHE_DIR = CACHE_DIR / "dataset_cache"  # Columnar copies of the datasets
+
 
 class AppConfig(BaseModel):
     """
@@ -28,6 +36,22 @@ class AppConfig(BaseModel):
     training_data_file: str
     pipeline_name: str
     pipeline_save_file: str
+    prediction_cache_size: int  # Maximum number of rows held by the prediction cache
+    prediction_cache_ttl_seconds: float  # Seconds a cached prediction stays valid
+    dataset_cache: bool  # Whether datasets are read from their columnar cache
+    training_cache: bool  # Whether run_training reuses cached preprocessing output
+    models_to_keep: int  # Trained model versions kept in TRAINED_MODEL_DIR
+    inference_metrics: bool  # Whether the prediction path records per-stage latency histograms
+    log_sample_rate: float  # Fraction of hot-path calls logged when their level is enabled
+
+
+class SearchSpace(BaseModel):
+    """Candidate values of the algorithm parameters explored by the tune entry point."""
+    N_ESTIMATORS: List[int]
+    MAX_DEPTH: List[int]
+    MIN_SAMPLES_SPLIT: List[int]
+    MIN_SAMPLES_LEAF: List[int]
+    CRITERION: List[str]
 
 
 class ModelConfig(BaseModel):
@@ -52,7 +76,13 @@ class ModelConfig(BaseModel):
     Policy_Sales_Channel_var: str
     Vintage_var: str
 
+    dataset_dtypes: Dict[str, str]  # Compact dtype of every raw dataset column
+    dtype_plan: Dict[str, str]  # Compact dtype of every column produced by the preprocessing transformers
     Gender_mappings: Dict[str, int]  # Mapping dictionary for Gender column
+    Vehicle_Age_categories: List[str]  # Allowed values of the Vehicle_Age column
+    Vehicle_Damage_categories: List[str]  # Allowed values of the Vehicle_Damage column
+    encoding_mode: str  # ColumnOneHotEncoder output: 'dense', 'sparse' or 'ordinal'
+    encoding_handle_unknown: str  # Unseen categories: 'error' or 'ignore'
 
     # Model training hyperparameters
     TEST_SIZE: float  # Test dataset size percentage
@@ -62,6 +92,17 @@ class ModelConfig(BaseModel):
     MIN_SAMPLES_SPLIT: int  # Minimum number of samples required to split a node
     MIN_SAMPLES_LEAF: int  # Minimum number of samples required in a leaf node
     CRITERION: str  # Splitting criterion (e.g., 'gini' or 'entropy')
+    DECISION_THRESHOLD: float  # Probability above which a record is labelled positive
+    N_JOBS: int  # Cores used to fit the trees (-1 for all cores)
+    WARM_START: bool  # Grow the forest in steps of WARM_START_STEP trees
+    WARM_START_STEP: int  # Trees added per warm-start step
+
+    # Hyperparameter search settings
+    search_space: SearchSpace  # Candidate values per algorithm parameter
+    TUNE_CV_FOLDS: int  # Cross-validation folds per candidate
+    TUNE_N_CANDIDATES: int  # Candidates sampled from the search space
+    TUNE_HALVING_FACTOR: int  # Successive halving keeps 1/factor of the candidates per round
+    TUNE_SCORING: str  # Metric candidates are ranked by ('accuracy' or 'precision')
 
 
 class Config(BaseModel):
@@ -0,0 +1,161 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional, Sequence
+from vehicleinsurance_model.config.core import config
+
+# Library logger; the package adds no handlers, so nothing is emitted until the application configures logging
+logger = logging.getLogger("vehicleinsurance_model")
+
+
+def log_sampled(level: int, message: str, *args) -> None:
+    """
+    Logs a hot-path message for a sample of the calls (config.yml log_sample_rate).
+    The level is checked first, so a disabled level costs one comparison and the
+    arguments are never formatted.
+    """
+    if logger.isEnabledFor(level) and random.random() < config.app_config_.log_sample_rate:
+        logger.log(level, message, *args)
+
+
+class Histogram:
+    """
+    Minimal thread-safe histogram with cumulative buckets.
+    Tracks observation count and sum, as used for batch sizes and latencies.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets: List[float] = sorted(buckets)
+        self._counts = [0] * len(self.buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Records one observation."""
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Returns count, sum, mean and cumulative bucket counts."""
+        with self._lock:
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "mean": self._sum / self._count if self._count else 0.0,
+                "buckets": {str(bound): count for bound, count in zip(self.buckets, self._counts)},
+            }
+
+    def prometheus_samples(self, name: str, labels: str = "") -> List[str]:
+        """Bucket, sum and count samples in the Prometheus text format; labels is e.g. 'stage="scale_cols"'."""
+        snapshot = self.snapshot()
+        prefix = f"{labels}," if labels else ""
+        lines = [f'{name}_bucket{{{prefix}le="{bound}"}} {count}' for bound, count in snapshot["buckets"].items()]
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {snapshot["count"]}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {snapshot['sum']}")
+        lines.append(f"{name}_count{suffix} {snapshot['count']}")
+        return lines
+
+
+def prometheus_histogram(name: str, help_text: str, histograms: Dict[str, Histogram], label: Optional[str] = None) -> str:
+    """
+    One Prometheus histogram metric in the text exposition format.
+    histograms maps label values to their histogram, or holds a single unlabelled one under "".
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for value, histogram in histograms.items():
+        lines.extend(histogram.prometheus_samples(name, f'{label}="{value}"' if label else ""))
+    return "\n".join(lines) + "\n"
+
+
+# Latency buckets in seconds, from tens of microseconds (one fused row) to seconds (large batches)
+STAGE_BUCKETS = [0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+ROW_BUCKETS = [1, 10, 100, 1000, 10_000, 100_000]
+
+
+class InferenceMetrics:
+    """
+    Wall time of every inference stage (validation, each named pipeline step, the forest,
+    request decoding and response encoding) and rows per prediction call.
+    When disabled (config.yml inference_metrics: false) time() returns a shared no-op
+    context manager and nothing is measured or stored.
+    Inside recording() observations are kept in a list instead, for another process to replay().
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.stages: Dict[str, Histogram] = {}
+        self.rows = Histogram(buckets=ROW_BUCKETS)
+        self._lock = threading.Lock()
+        self._disabled = nullcontext()
+        self._recorded: Optional[list] = None  # (stage, seconds), or (None, rows), while recording
+
+    def _stage(self, stage: str) -> Histogram:
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.stages.setdefault(stage, Histogram(buckets=STAGE_BUCKETS))
+        return histogram
+
+    def observe(self, stage: str, seconds: float) -> None:
+        if self.enabled:
+            if self._recorded is not None:
+                self._recorded.append((stage, seconds))
+            else:
+                self._stage(stage).observe(seconds)
+
+    def observe_rows(self, n_rows: int) -> None:
+        if self.enabled:
+            if self._recorded is not None:
+                self._recorded.append((None, n_rows))
+            else:
+                self.rows.observe(n_rows)
+
+    @contextmanager
+    def recording(self) -> Iterator[list]:
+        """
+        Keeps the observations made in the block in the yielded list instead of the histograms.
+        Used by process workers, one call at a time, to send their timings back with the result.
+        """
+        self._recorded = recorded = []
+        try:
+            yield recorded
+        finally:
+            self._recorded = None
+
+    def replay(self, observations: List[tuple]) -> None:
+        """Records observations kept by recording(), e.g. in another process."""
+        for stage, value in observations:
+            if stage is None:
+                self.observe_rows(value)
+            else:
+                self.observe(stage, value)
+
+    def time(self, stage: str):
+        """Context manager timing the enclosed block as one observation of the stage."""
+        return self._timed(stage) if self.enabled else self._disabled
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def render_prometheus(self) -> str:
+        """The stage latencies and rows per call in the Prometheus text format."""
+        return prometheus_histogram(
+            "vehicleinsurance_stage_seconds", "Wall time of each inference stage.", dict(sorted(self.stages.items())), label="stage"
+        ) + prometheus_histogram("vehicleinsurance_rows_per_call", "Rows scored per prediction call.", {"": self.rows})
+
+
+# Instrumentation of the prediction hot path
+inference_metrics = InferenceMetrics(enabled=config.app_config_.inference_metrics)
@@ -0,0 +1,247 @@
+import sys
+from pathlib import Path
+# Dynamically resolve file paths for module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to Python's module search path
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import io
+import json
+import shutil
+from typing import Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from vehicleinsurance_model.batch_score import PredictionWriter, _drop_invalid, _require_pyarrow
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.processing.forest import FlatForest
+from vehicleinsurance_model.processing.fused import FusedTransform
+from vehicleinsurance_model.processing.scoring import positive_proba
+from vehicleinsurance_model.processing.validation import validate_inputs
+from vehicleinsurance_model.registry import model_registry
+
+
+def _score_shard(shard: pd.DataFrame, offset: int, transform: FusedTransform, forest: FlatForest) -> Tuple[Optional[np.ndarray], list]:
+    """
+    Validates and scores one shard inside a worker process.
+    Returns its predictions, or its validation errors with row positions relative to the full input.
+    """
+    validated_data, errors = validate_inputs(input_df=shard)
+    if errors:
+        errors = json.loads(errors)
+        for error in errors:
+            error["loc"][1] += offset  # loc is ("inputs", row, field)
+        return None, errors
+
+    validated_data = validated_data.reindex(columns=config.model_config_.features)
+    return forest.predict(transform.transform(validated_data)), []
+
+
+def make_prediction_parallel(*, input_data: pd.DataFrame, n_workers: int = -1, max_nbytes: str = "1M") -> dict:
+    """
+    Make predictions by sharding the input across worker processes.
+
+    - The input is split into one contiguous shard per worker.
+    - Each worker validates, preprocesses and scores its shard.
+    - The forest is shipped as flat NumPy arrays shared by memory-mapping: workers reopen the
+      saved model bundle's files, or joblib dumps the arrays once (those larger than max_nbytes),
+      so workers share it instead of unpickling private copies of the sklearn trees.
+    - Shard results are reassembled in input order.
+    Returns the same result structure and predictions as make_prediction.
+    """
+    input_data = pd.DataFrame(input_data)
+    version = model_registry.active_version
+    models = model_registry.model(version)
+    fused_transform = models.get_fused_pipeline().transform_
+    flat_forest = models.get_flat_forest()
+    n_jobs = effective_n_jobs(n_workers)
+    bounds = np.linspace(0, len(input_data), n_jobs + 1, dtype=int)
+
+    shard_results = Parallel(n_jobs=n_jobs, backend="loky", max_nbytes=max_nbytes)(
+        delayed(_score_shard)(
+            input_data.iloc[start:end], int(start), fused_transform, flat_forest
+        )
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if end > start
+    )
+
+    # Merge errors from every shard; joblib returns shards in submission order
+    errors = [error for _, shard_errors in shard_results for error in shard_errors]
+    if errors:
+        return {"predictions": None, "version": version, "errors": json.dumps(errors)}
+
+    if not shard_results:
+        return {"predictions": np.empty(0), "version": version, "errors": None}
+    predictions = np.concatenate([shard_predictions for shard_predictions, _ in shard_results])
+    return {"predictions": np.floor(predictions), "version": version, "errors": None}
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of the bytes [start, end) of a file, so pandas can parse one shard of a CSV."""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._left = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n_bytes = self._file.readinto(memoryview(buffer)[:self._left])
+        self._left -= n_bytes
+        return n_bytes
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _csv_shards(input_path: Path, n_shards: int) -> List[Tuple[int, int]]:
+    """
+    Splits a CSV file's records into n_shards byte ranges of about equal size, each starting at a line.
+    Records must not contain quoted newlines.
+    """
+    size = input_path.stat().st_size
+    with open(input_path, "rb") as input_file:
+        input_file.readline()  # Header
+        cuts = [input_file.tell()]
+        for shard in range(1, n_shards):
+            input_file.seek(max(cuts[0] + (size - cuts[0]) * shard // n_shards, cuts[-1]))
+            input_file.readline()  # The line under way belongs to the previous shard
+            cuts.append(min(input_file.tell(), size))
+    cuts.append(size)
+    return [(start, end) for start, end in zip(cuts[:-1], cuts[1:]) if end > start]
+
+
+def _parquet_shards(input_path: Path, n_shards: int) -> List[List[int]]:
+    """Splits a Parquet file's row groups into at most n_shards contiguous lists."""
+    n_row_groups = _require_pyarrow().parquet.ParquetFile(input_path).num_row_groups
+    return [shard.tolist() for shard in np.array_split(np.arange(n_row_groups), n_shards) if len(shard)]
+
+
+def _read_shard(input_path: Path, shard: Union[Tuple[int, int], List[int]], chunksize: int) -> Iterator[pd.DataFrame]:
+    """Reads one shard (a CSV byte range or Parquet row groups) in chunks of at most chunksize rows."""
+    if input_path.suffix == ".parquet":
+        parquet_file = _require_pyarrow().parquet.ParquetFile(input_path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, row_groups=shard):
+            yield batch.to_pandas()
+    else:
+        columns = pd.read_csv(input_path, nrows=0).columns
+        with pd.read_csv(io.BufferedReader(_ByteRange(input_path, *shard)), names=columns, header=None, chunksize=chunksize) as reader:
+            yield from reader
+
+
+def _score_file_shard(
+    input_path: Path, shard: Union[Tuple[int, int], List[int]], part_path: Path,
+    transform: FusedTransform, forest: FlatForest, chunksize: int, proba: bool,
+) -> Tuple[int, List[dict]]:
+    """
+    Scores one shard of an input file chunk by chunk inside a worker process and writes its
+    predictions to part_path. Returns its number of rows and its invalid records, with rows
+    counted from the start of the shard.
+    """
+    writer = PredictionWriter(part_path)
+    n_rows, invalid = 0, []
+    try:
+        for chunk in _read_shard(input_path, shard, chunksize):
+            validated_data, errors = validate_inputs(input_df=chunk)
+            if errors:
+                validated_data = _drop_invalid(chunk, errors, n_rows, invalid)
+            validated_data = validated_data.reindex(columns=config.model_config_.features)
+            if len(validated_data):
+                probabilities = forest.predict_proba(transform.transform(validated_data))
+                scored = pd.DataFrame({
+                    config.model_config_.id_var: validated_data[config.model_config_.id_var].to_numpy(),
+                    "prediction": forest.classes_.take(np.argmax(probabilities, axis=1)),
+                })
+                if proba:
+                    scored["probability"] = positive_proba(probabilities, forest.classes_)
+                writer.write(scored)
+            n_rows += len(chunk)
+    finally:
+        writer.close()
+    return n_rows, invalid
+
+
+def _concatenate_parts(parts: List[Path], output_path: Path) -> None:
+    """Writes the shards' output files, in order, into one CSV or Parquet file."""
+    parts = [part for part in parts if part.exists()]  # Shards of invalid records only write nothing
+    if output_path.suffix == ".parquet":
+        parquet = _require_pyarrow().parquet
+        writer = None
+        try:
+            for part in parts:
+                part_file = parquet.ParquetFile(part)
+                writer = writer or parquet.ParquetWriter(output_path, part_file.schema_arrow)
+                for batch in part_file.iter_batches():
+                    writer.write_batch(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        with open(output_path, "wb") as output_file:
+            for position, part in enumerate(parts):
+                with open(part, "rb") as part_file:
+                    header = part_file.readline()
+                    if position == 0:
+                        output_file.write(header)
+                    shutil.copyfileobj(part_file, output_file)
+
+
+def score_file_parallel(
+    *,
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    n_workers: int = -1,
+    chunksize: int = 100_000,
+    proba: bool = False,
+    errors_path: Optional[Union[str, Path]] = None,
+    max_nbytes: str = "1M",
+) -> dict:
+    """
+    Scores a CSV or Parquet file by sharding the file itself across worker processes.
+
+    - CSV files are split into one byte range per worker, cut at line boundaries; Parquet files
+      into contiguous row groups. Each worker reads only its shard, chunk by chunk.
+    - Workers score with the shared flat forest, as in make_prediction_parallel, and write their
+      predictions to a part file next to output_path; the parts are then concatenated in input order.
+    - Invalid records are skipped and counted as in batch_score.score_file, and with errors_path
+      written there with their row in the whole input.
+    Returns the number of shards, rows read and invalid rows.
+    """
+    input_path, output_path = Path(input_path), Path(output_path)
+    models = model_registry.model(model_registry.active_version)
+    n_jobs = effective_n_jobs(n_workers)
+    shards = _parquet_shards(input_path, n_jobs) if input_path.suffix == ".parquet" else _csv_shards(input_path, n_jobs)
+    parts = [output_path.with_name(f"{output_path.stem}.part{position}{output_path.suffix}") for position in range(len(shards))]
+
+    try:
+        shard_results = Parallel(n_jobs=n_jobs, backend="loky", max_nbytes=max_nbytes)(
+            delayed(_score_file_shard)(
+                input_path, shard, part, models.get_fused_pipeline().transform_, models.get_flat_forest(), chunksize, proba
+            )
+            for shard, part in zip(shards, parts)
+        )
+        _concatenate_parts(parts, output_path)
+    finally:
+        for part in parts:
+            part.unlink(missing_ok=True)
+
+    # Shard-relative rows of invalid records become rows of the whole input
+    invalid, offset = [], 0
+    for n_rows, shard_invalid in shard_results:
+        for record in shard_invalid:
+            errors = json.loads(record["errors"])
+            for error in errors:
+                error["loc"][1] += offset
+            invalid.append({**record, "row": record["row"] + offset, "errors": json.dumps(errors)})
+        offset += n_rows
+    if invalid and errors_path is not None:
+        errors_writer = PredictionWriter(Path(errors_path))
+        errors_writer.write(pd.DataFrame(invalid))
+        errors_writer.close()
+
+    return {"shards": len(shards), "rows": offset, "invalid_rows": len(invalid)}
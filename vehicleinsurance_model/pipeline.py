@@ -5,7 +5,8 @@ file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
 
 # Add parent directory to Python's module search path
-sys.path.append(str(root))
+if str(root) not in sys.path:
+    sys.path.append(str(root))
 from sklearn.pipeline import Pipeline
 from sklearn.ensemble import RandomForestClassifier
 from vehicleinsurance_model.config.core import config
@@ -23,29 +24,36 @@ vehicleinsurance_pipe = Pipeline([
     ######### Ordinal Encoding ###########
     ('map_gender', Mapper(
         variable=config.model_config_.Gender_var,
-        mappings=config.model_config_.Gender_mappings
+        mappings=config.model_config_.Gender_mappings,
+        dtypes=config.model_config_.dtype_plan
     )),  # Converts 'Male' and 'Female' into numerical values
 
     ########## Feature Scaling ##########
     ('scale_cols', ColumnStandardScalar(variable=[
         config.model_config_.Age_var, config.model_config_.Vintage_var
-    ])),  # Standard scales Age and Vintage features
+    ], dtypes=config.model_config_.dtype_plan)),  # Standard scales Age and Vintage features
 
     ('scale_annualpremium', AnnualPremiumMinMaxScalar(variable=[
         config.model_config_.Annual_Premium_var
-    ])),  # Scales Annual Premium using MinMaxScaler
+    ], dtypes=config.model_config_.dtype_plan)),  # Scales Annual Premium using MinMaxScaler
 
     ######## One-Hot Encoding ########
     ('encode_cols', ColumnOneHotEncoder(variable=[
         config.model_config_.Vehicle_Age_var, config.model_config_.Vehicle_Damage_var
-    ])),  # Converts categorical Vehicle Age & Damage features into numerical representation
+    ], dtypes=config.model_config_.dtype_plan,
+        mode=config.model_config_.encoding_mode,
+        handle_unknown=config.model_config_.encoding_handle_unknown,
+    )),  # Converts categorical Vehicle Age & Damage features into numerical representation
 
     ########## Column Renaming ##########
-    ('renamecolumnstransformer', RenameColumnsTransformer()),  # Renames specific categorical columns for consistency
+    ('renamecolumnstransformer', RenameColumnsTransformer(
+        dtypes=config.model_config_.dtype_plan
+    )),  # Renames columns and casts them to integers when given a rename_map or int_columns (none by default)
 
     ############## Column Dropping #############
     ('dropcolumnstransformer', DropColumnsTransformer(
-        variable=config.model_config_.id_var
+        variable=config.model_config_.id_var,
+        dtypes=config.model_config_.dtype_plan
     )),  # Drops ID column to prevent data leakage
 
     ########## Machine Learning Model ##########
@@ -55,6 +63,8 @@ vehicleinsurance_pipe = Pipeline([
         random_state=config.model_config_.RANDOM_STATE,  # Ensures reproducibility
         min_samples_split=config.model_config_.MIN_SAMPLES_SPLIT,  # Minimum samples needed for a split
         min_samples_leaf=config.model_config_.MIN_SAMPLES_LEAF,  # Minimum samples per leaf node
-        criterion=config.model_config_.CRITERION  # Decision tree split criterion ('entropy' or 'gini')
+        criterion=config.model_config_.CRITERION,  # Decision tree split criterion ('entropy' or 'gini')
+        n_jobs=config.model_config_.N_JOBS,  # Cores used to fit the trees (-1 for all cores)
+        warm_start=config.model_config_.WARM_START,  # Keep existing trees when n_estimators is raised
     ))
 ])
\ No newline at end of file
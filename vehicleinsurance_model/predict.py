@@ -5,24 +5,104 @@ file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
 
 # Add parent directory to Python's module search path
-sys.path.append(str(root))
-from typing import Union
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import logging
+from typing import Optional, Union
 import pandas as pd
 import numpy as np
-from vehicleinsurance_model import __version__ as _version
+from vehicleinsurance_model.cache import prediction_cache
 from vehicleinsurance_model.config.core import config
-from vehicleinsurance_model.processing.data_manager import load_pipeline, pre_pipeline_preparation
-from vehicleinsurance_model.processing.validation import validate_inputs
+from vehicleinsurance_model.monitoring import inference_metrics, log_sampled
+from vehicleinsurance_model.processing.forest import ENGINES
+from vehicleinsurance_model.processing.profiling import PipelineProfiler
+from vehicleinsurance_model.processing.scoring import apply_threshold, check_threshold, positive_proba, top_k as top_k_rows
+from vehicleinsurance_model.processing.validation import validate_inputs, validate_record
+from vehicleinsurance_model.registry import model_registry
 
 
 
 
-# Load the trained model pipeline from saved file
-pipeline_file_name = f"{config.app_config_.pipeline_save_file}{_version}.pkl"
-vehicleinsurance_pipe = load_pipeline(file_name=pipeline_file_name)
+# The trained pipeline is loaded lazily by the model registry on first use (or model_registry.warmup())
+pipeline_file_name = model_registry.pipeline_file_name
 
 
-def make_prediction(*, input_data: Union[pd.DataFrame, dict]) -> dict:
+def __getattr__(name: str):
+    """Keeps vehicleinsurance_pipe and vehicleinsurance_fused_pipe importable without loading them at import time."""
+    if name == "vehicleinsurance_pipe":
+        return model_registry.get_pipeline()
+    if name == "vehicleinsurance_fused_pipe":
+        return model_registry.get_fused_pipeline()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# "sklearn" scores with the fitted RandomForestClassifier, the others with its flattened node arrays
+PREDICTION_ENGINES = ("sklearn",) + ENGINES
+
+# Latency stage of the forest, named after its step in vehicleinsurance_pipe whichever engine evaluates it
+FOREST_STAGE = "model_rf"
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in PREDICTION_ENGINES:
+        raise ValueError(f"Unknown prediction engine {engine!r}, expected one of {PREDICTION_ENGINES}")
+
+
+def _run_stage(name: str, func, X, profiler: Optional[PipelineProfiler] = None):
+    """Runs one inference stage on X: profiled when a profiler is given, otherwise timed for the latency metrics."""
+    if profiler is not None:
+        return profiler.run(name, func, X)
+    with inference_metrics.time(name):
+        return func(X)
+
+
+def _preprocess(models, validated_data: pd.DataFrame, *, fused: bool, profiler: Optional[PipelineProfiler] = None):
+    """Runs the preprocessing, fused or one named pipeline step at a time, timing each as an inference stage."""
+    if fused:
+        return _run_stage("fused_transform", models.get_fused_pipeline().transform, validated_data, profiler)
+    X = validated_data
+    for name, step in models.get_pipeline().steps[:-1]:
+        X = _run_stage(name, step.transform, X, profiler)
+    return X
+
+
+def _predict_validated(
+    validated_data: pd.DataFrame, *, fused: bool, engine: str, model_version: Optional[str] = None, profiler: Optional[PipelineProfiler] = None
+) -> np.ndarray:
+    """Preprocesses validated records (fused or step by step) and scores them with the selected engine."""
+    models = model_registry.model(model_version)
+    X = _preprocess(models, validated_data, fused=fused, profiler=profiler)
+    if engine == "sklearn":
+        score = models.get_fused_pipeline().predict_matrix if fused else models.get_pipeline().steps[-1][1].predict
+    else:
+        score = lambda X: models.get_flat_forest().predict(X, engine=engine)
+    return _run_stage(FOREST_STAGE, score, X, profiler)
+
+
+def _predict_proba_validated(
+    validated_data: pd.DataFrame, *, fused: bool, engine: str, model_version: Optional[str] = None, profiler: Optional[PipelineProfiler] = None
+) -> tuple:
+    """Class probabilities of validated records from one forest pass, with the classes they belong to."""
+    models = model_registry.model(model_version)
+    X = _preprocess(models, validated_data, fused=fused, profiler=profiler)
+    if engine == "sklearn":
+        forest = models.get_pipeline().steps[-1][1]
+        score, classes = models.get_fused_pipeline().predict_proba_matrix if fused else forest.predict_proba, forest.classes_
+    else:
+        flat_forest = models.get_flat_forest()
+        score, classes = lambda X: flat_forest.predict_proba(X, engine=engine), flat_forest.classes_
+    return _run_stage(FOREST_STAGE, score, X, profiler), classes
+
+
+def make_prediction(
+    *,
+    input_data: Union[pd.DataFrame, dict],
+    fused: bool = False,
+    engine: str = "sklearn",
+    cache: bool = False,
+    model_version: Optional[str] = None,
+    profiler: Optional[PipelineProfiler] = None,
+) -> dict:
     """
     Make a prediction using the trained model pipeline.
 
@@ -31,26 +111,140 @@ def make_prediction(*, input_data: Union[pd.DataFrame, dict]) -> dict:
     2. Preprocess data to match the expected model features.
     3. Use the trained model pipeline to generate predictions.
     4. Return predictions along with version and any errors encountered.
+
+    With fused=True the preprocessing runs as one copy-free pass into a float32 matrix
+    instead of step by step through the pandas transformers; predictions are identical.
+
+    engine selects how the forest is evaluated, again with identical predictions:
+    - "sklearn": the fitted RandomForestClassifier.
+    - "numpy": flattened node arrays traversed level by level for all trees at once;
+      much lower per-call overhead for small batches.
+    - "numba": the same arrays walked by a compiled kernel (requires numba); fastest at every batch size.
+
+    With cache=True every validated row is first looked up in the prediction cache and
+    only the rows it has not seen (for the currently loaded model) are scored.
+
+    model_version scores with another saved model version than the registry's active one
+    (e.g. a shadow candidate); such calls bypass the cache.
+
+    With a profiler (processing.profiling.PipelineProfiler), every named pipeline step and the
+    forest are run through it to record their time, memory and copies; the cache is bypassed.
     """
+    _check_engine(engine)
+    model_version = model_version or model_registry.active_version
 
     # Convert input data into a Pandas DataFrame and validate it
-    validated_data, errors = validate_inputs(input_df=pd.DataFrame(input_data))
+    with inference_metrics.time("validation"):
+        validated_data, errors = validate_inputs(input_df=pd.DataFrame(input_data))
+    inference_metrics.observe_rows(len(validated_data))
 
     # Ensure validated data is in the correct feature order before prediction
     validated_data = validated_data.reindex(columns=config.model_config_.features)
 
     # Initialize result structure
-    results = {"predictions": None, "version": _version, "errors": errors}
+    results = {"predictions": None, "version": model_version, "errors": errors}
+
+    # Proceed with prediction only if there are no validation errors
+    if not errors:
+        if profiler is not None:
+            profiler.add_rows(len(validated_data))
+        if cache and profiler is None and model_version == model_registry.active_version:
+            predictions = prediction_cache.predict(
+                validated_data, lambda rows: _predict_validated(rows, fused=fused, engine=engine, model_version=model_version),
+                model_version=model_version,
+            )
+        else:
+            predictions = _predict_validated(validated_data, fused=fused, engine=engine, model_version=model_version, profiler=profiler)
+        results = {
+            "predictions": np.floor(predictions),  # Apply flooring to ensure integer output
+            "version": model_version,
+            "errors": errors
+        }
+        log_sampled(logging.DEBUG, "Predicted %d rows with model %s", len(predictions), model_version)
+
+    return results
+
+
+def make_prediction_proba(
+    *,
+    input_data: Union[pd.DataFrame, dict],
+    fused: bool = False,
+    engine: str = "sklearn",
+    threshold: Optional[float] = None,
+    top_k: Optional[int] = None,
+    model_version: Optional[str] = None,
+) -> dict:
+    """
+    Score records with the probability of a positive response.
+
+    The forest runs once: its class probabilities give the positive-class score of every row,
+    and the labels are derived from those scores with the decision threshold in the same
+    vectorized step. A row is labelled 1 when its score exceeds the threshold (config.yml
+    DECISION_THRESHOLD by default; 0.5 gives the same labels as make_prediction).
+    With top_k, also returns the positions of the top_k highest-scoring rows, highest first.
+    fused, engine and model_version are as in make_prediction.
+    """
+    _check_engine(engine)
+    model_version = model_version or model_registry.active_version
+    threshold = config.model_config_.DECISION_THRESHOLD if threshold is None else threshold
+    check_threshold(threshold)
+
+    # Convert input data into a Pandas DataFrame and validate it
+    with inference_metrics.time("validation"):
+        validated_data, errors = validate_inputs(input_df=pd.DataFrame(input_data))
+    inference_metrics.observe_rows(len(validated_data))
+    validated_data = validated_data.reindex(columns=config.model_config_.features)
+
+    # Initialize result structure
+    results = {"probabilities": None, "predictions": None, "threshold": threshold, "version": model_version, "errors": errors}
+
+    # Proceed with scoring only if there are no validation errors
+    if not errors:
+        proba, classes = _predict_proba_validated(validated_data, fused=fused, engine=engine, model_version=model_version)
+        scores = positive_proba(proba, classes)
+        results["probabilities"] = scores
+        results["predictions"] = apply_threshold(scores, classes, threshold)
+        if top_k is not None:
+            results["top_k"] = top_k_rows(scores, top_k)
+
+    return results
+
+
+def make_prediction_record(*, record: dict, engine: str = "sklearn", model_version: Optional[str] = None) -> dict:
+    """
+    Make a prediction for a single input record (one value per feature).
+
+    Fast path for one-row calls: the record is validated and encoded straight into a
+    NumPy row vector with the fitted pipeline constants, then scored by the forest directly.
+    Returns the same result structure and predictions as make_prediction, with the same engine and model_version choices.
+    """
+    _check_engine(engine)
+    model_version = model_version or model_registry.active_version
+
+    # Validate the record without building a DataFrame
+    with inference_metrics.time("validation"):
+        validated_record, errors = validate_record(record=record)
+    inference_metrics.observe_rows(1)
+
+    # Initialize result structure
+    results = {"predictions": None, "version": model_version, "errors": errors}
 
     # Proceed with prediction only if there are no validation errors
     if not errors:
-        predictions = vehicleinsurance_pipe.predict(validated_data)
+        models = model_registry.model(model_version)
+        fused_pipe = models.get_fused_pipeline()
+        with inference_metrics.time("fused_transform"):
+            X = fused_pipe.transform_.transform_record(validated_record)
+        with inference_metrics.time(FOREST_STAGE):
+            if engine == "sklearn":
+                predictions = fused_pipe.predict_matrix(X)
+            else:
+                predictions = models.get_flat_forest().predict(X, engine=engine)
         results = {
             "predictions": np.floor(predictions),  # Apply flooring to ensure integer output
-            "version": _version,
+            "version": model_version,
             "errors": errors
         }
-        print(results)  # Debugging output
 
     return results
 
@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+import numpy as np
+from sklearn.pipeline import Pipeline
+from vehicleinsurance_model.processing.forest import FlatForest
+from vehicleinsurance_model.processing.fused import FusedPipeline, FusedTransform
+
+# Bump when the bundle layout changes so old bundles are rejected instead of misread
+BUNDLE_FORMAT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+
+
+def save_bundle(*, pipeline: Pipeline, path: Path, input_features: List[str], model_version: str) -> None:
+    """
+    Saves a fitted pipeline as a compact model bundle directory.
+    - manifest.json holds the fused transform constants (maps, scaler constants, categories).
+    - One uncompressed .npy file per forest node array (children, feature, threshold, values),
+      so the arrays can be memory-mapped on load.
+    """
+    fused = FusedPipeline.from_pipeline(pipeline, input_features=input_features)
+    forest = FlatForest.from_estimator(pipeline.steps[-1][1])
+
+    path.mkdir(parents=True, exist_ok=True)
+    for name, array in forest.arrays.items():
+        np.save(path / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+
+    manifest = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "model_version": model_version,
+        "input_features": list(input_features),
+        "transform": fused.transform_.to_dict(),
+        "arrays": sorted(forest.arrays),
+    }
+    with open(path / MANIFEST_FILE, "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+
+def load_bundle(*, path: Path, mmap_mode: Optional[str] = "r") -> FusedPipeline:
+    """
+    Loads a model bundle for inference.
+    With mmap_mode='r' the node arrays are memory-mapped read-only instead of read into memory:
+    loading is near-instant and processes on the same host share the pages through the page cache.
+    """
+    with open(path / MANIFEST_FILE) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    if manifest["format_version"] != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported model bundle format {manifest['format_version']} at {path}")
+
+    arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False) for name in manifest["arrays"]}
+    return FusedPipeline(transform=FusedTransform.from_dict(manifest["transform"]), estimator=FlatForest(arrays))
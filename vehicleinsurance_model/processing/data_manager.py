@@ -5,21 +5,35 @@ file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
 
 # Add parent directory to Python's module search path
-sys.path.append(str(root))
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
 import typing as t
-import joblib
 import pandas as pd
-from sklearn.pipeline import Pipeline
 from vehicleinsurance_model import __version__ as _version
-from vehicleinsurance_model.config.core import DATASET_DIR, TRAINED_MODEL_DIR, config
+from vehicleinsurance_model.config.core import DATASET_CACHE_DIR, DATASET_DIR, TRAINED_MODEL_DIR, config
+from vehicleinsurance_model.monitoring import logger
+
+# scikit-learn and joblib are only imported when a pipeline is saved or loaded
+if t.TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
+    from vehicleinsurance_model.processing.fused import FusedPipeline
 
 ## Pre-Pipeline Preparation
 def pre_pipeline_preparation(*, data_frame: pd.DataFrame) -> pd.DataFrame:
     """
     Prepares the dataset before running the pipeline.
-    This function prints dataset information and performs preprocessing.
+    This function logs dataset information (at DEBUG level) and performs preprocessing.
     """
-    print(data_frame.info())
+    if logger.isEnabledFor(logging.DEBUG):
+        buffer = io.StringIO()
+        data_frame.info(buf=buffer)
+        logger.debug("Dataset info:\n%s", buffer.getvalue())
 
     # Uncomment the following code to drop unnecessary fields based on config settings
     # for field in config.model_config_.unused_fields:
@@ -29,11 +43,60 @@ def pre_pipeline_preparation(*, data_frame: pd.DataFrame) -> pd.DataFrame:
     return data_frame
 
 
+def _read_csv_compact(path: Path) -> pd.DataFrame:
+    """Parses a dataset CSV straight into the compact dtypes declared in config.yml."""
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {column: dtype for column, dtype in config.model_config_.dataset_dtypes.items() if column in header}
+    return pd.read_csv(path, dtype=dtypes)
+
+
+def _cache_key(path: Path) -> str:
+    """Digest of the source file's bytes and the declared dtypes; either changing invalidates the cache."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source_file:
+        for block in iter(lambda: source_file.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(json.dumps(config.model_config_.dataset_dtypes, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+def _read_dataset(file_name: str) -> pd.DataFrame:
+    """
+    Reads a dataset file with compact dtypes (category, int8/int16, float32).
+    - The first read parses the CSV and writes a Feather copy to DATASET_CACHE_DIR.
+    - Later reads memory-map that copy instead of parsing the CSV again.
+    - The copy is keyed on a hash of the source file, so an edited dataset is re-parsed.
+    Without pyarrow (an optional dependency) the CSV is parsed every time.
+    """
+    path = Path(f"{DATASET_DIR}/{file_name}")
+    if not config.app_config_.dataset_cache:
+        return _read_csv_compact(path)
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return _read_csv_compact(path)
+
+    cache_path = DATASET_CACHE_DIR / f"{path.stem}-{_cache_key(path)}.feather"
+    if cache_path.exists():
+        return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+    dataframe = _read_csv_compact(path)
+    DATASET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale_path in DATASET_CACHE_DIR.glob(f"{path.stem}-*.feather"):
+        stale_path.unlink()
+
+    # Write to a temporary file first so concurrent readers never see a partial copy
+    temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    feather.write_feather(dataframe, temporary_path, compression="uncompressed")
+    os.replace(temporary_path, cache_path)
+    return dataframe
+
+
 def _load_raw_dataset(*, file_name: str) -> pd.DataFrame:
     """
     Loads the raw dataset from the specified file.
     """
-    dataframe = pd.read_csv(Path(f"{DATASET_DIR}/{file_name}"))
+    dataframe = _read_dataset(file_name)
     return dataframe
 
 
@@ -41,48 +104,91 @@ def load_dataset(*, file_name: str) -> pd.DataFrame:
     """
     Loads and prepares the dataset by applying pre-processing steps.
     """
-    print(f"🔎 Loading dataset file: {file_name}")
-    dataframe = pd.read_csv(Path(f"{DATASET_DIR}/{file_name}"))
+    logger.info("Loading dataset file: %s", file_name)
+    dataframe = _read_dataset(file_name)
     transformed = pre_pipeline_preparation(data_frame=dataframe)
     return transformed
 
 
 ## Model Pipeline Functions
-def save_pipeline(*, pipeline_to_persist: Pipeline) -> None:
+def model_file_names(model_version: str) -> t.Tuple[str, str]:
+    """File names of the pickled pipeline and of the model bundle saved for a model version."""
+    prefix = f"{config.app_config_.pipeline_save_file}{model_version}"
+    return f"{prefix}.pkl", f"{prefix}.bundle"
+
+
+def list_model_versions() -> t.List[str]:
+    """Model versions with a saved pipeline in TRAINED_MODEL_DIR, newest first."""
+    prefix = config.app_config_.pipeline_save_file
+    pickles = sorted(TRAINED_MODEL_DIR.glob(f"{prefix}*.pkl"), key=lambda path: path.stat().st_mtime, reverse=True)
+    return [path.stem[len(prefix):] for path in pickles]
+
+
+def save_pipeline(*, pipeline_to_persist: "Pipeline", model_version: t.Optional[str] = None) -> None:
     """
     Saves the trained pipeline to a file.
-    The saved model is versioned to ensure reproducibility.
-    Old pipelines are removed to maintain a clean state.
+    The saved model is versioned (the package version unless model_version is given).
+    Only the newest models_to_keep versions are kept, so earlier ones stay available for rollback.
+    A memory-mappable model bundle is saved next to the pickle.
     """
+    import joblib
+    from vehicleinsurance_model.processing.bundle import save_bundle
 
     # Prepare versioned save file name
-    save_file_name = f"{config.app_config_.pipeline_save_file}{_version}.pkl"
+    model_version = model_version or _version
+    save_file_name, bundle_name = model_file_names(model_version)
     save_path = TRAINED_MODEL_DIR / save_file_name
 
     # Remove outdated models before saving a new one
-    remove_old_pipelines(files_to_keep=[save_file_name])
+    remove_old_pipelines(files_to_keep=[save_file_name, bundle_name], keep_latest=config.app_config_.models_to_keep - 1)
 
     # Save the trained pipeline using joblib
     joblib.dump(pipeline_to_persist, save_path)
-    print("✅ Model/pipeline saved successfully.")
 
+    # Save the same model as node arrays and transform constants for memory-mapped loading
+    save_bundle(
+        pipeline=pipeline_to_persist,
+        path=TRAINED_MODEL_DIR / bundle_name,
+        input_features=config.model_config_.features,
+        model_version=model_version,
+    )
+    logger.info("Model/pipeline %s saved successfully.", model_version)
 
-def load_pipeline(*, file_name: str) -> Pipeline:
+
+def load_pipeline(*, file_name: str) -> "Pipeline":
     """
     Loads a persisted pipeline for inference.
     """
+    import joblib
+
     file_path = TRAINED_MODEL_DIR / file_name
     trained_model = joblib.load(filename=file_path)
     return trained_model
 
 
-def remove_old_pipelines(*, files_to_keep: t.List[str]) -> None:
+def load_pipeline_bundle(*, file_name: str) -> "FusedPipeline":
+    """
+    Loads a persisted model bundle for inference.
+    The forest node arrays are memory-mapped, so cold start is near-instant and
+    workers on the same host share their memory.
+    """
+    from vehicleinsurance_model.processing.bundle import load_bundle
+
+    return load_bundle(path=TRAINED_MODEL_DIR / file_name, mmap_mode="r")
+
+
+def remove_old_pipelines(*, files_to_keep: t.List[str], keep_latest: int = 0) -> None:
     """
     Removes old model pipelines to maintain a clean environment.
-    Ensures a one-to-one mapping between package version and model version.
+    Keeps the given files and the files of the keep_latest newest other model versions.
     """
     do_not_delete = files_to_keep + ["__init__.py"]
+    for model_version in [version for version in list_model_versions() if model_file_names(version)[0] not in files_to_keep][:max(keep_latest, 0)]:
+        do_not_delete.extend(model_file_names(model_version))
 
     for model_file in TRAINED_MODEL_DIR.iterdir():
         if model_file.name not in do_not_delete:
-            model_file.unlink()
\ No newline at end of file
+            if model_file.is_dir():
+                shutil.rmtree(model_file)  # Model bundles are directories
+            else:
+                model_file.unlink()
@@ -1,22 +1,55 @@
-from typing import List
+from typing import Dict, List, Optional
 import sys
 import pandas as pd
 import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.preprocessing import OneHotEncoder, StandardScaler, MinMaxScaler
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler, MinMaxScaler
 
-class Mapper(BaseEstimator, TransformerMixin):
+# Output modes of ColumnOneHotEncoder
+ENCODING_MODES = ("dense", "sparse", "ordinal")
+
+
+def _astype(column: pd.Series, dtype: str) -> pd.Series:
+    """Casts a column, keeping sparse columns sparse instead of densifying them."""
+    if isinstance(column.dtype, pd.SparseDtype):
+        return column.astype(pd.SparseDtype(dtype, 0))
+    return column.astype(dtype)
+
+
+class DtypePlanMixin:
+    """
+    Casts the columns a transformer produces to the compact dtypes of the declared dtype plan
+    (config.yml dtype_plan), so the frame stays small at every pipeline stage.
+    The forest evaluates its input as float32 anyway, so the casts never change predictions.
+    """
+
+    def _apply_dtype_plan(self, X: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Casts the given columns (all planned columns when None) to their planned dtype."""
+        dtypes = getattr(self, "dtypes", None)  # Pipelines pickled before the dtype plan have none
+        if not dtypes:
+            return X
+        for column in dtypes if columns is None else columns:
+            dtype = dtypes.get(column)
+            if dtype is None or column not in X.columns or X[column].dtype in (dtype, pd.SparseDtype(dtype, 0)):
+                continue
+            if dtype != "category" and np.issubdtype(np.dtype(dtype), np.integer) and X[column].isna().any():
+                dtype = "float32"  # Missing values cannot be held by an integer column
+            X[column] = _astype(X[column], dtype)
+        return X
+
+class Mapper(DtypePlanMixin, BaseEstimator, TransformerMixin):
     """
     Ordinal categorical variable mapper.
     Treats the specified column as an ordinal categorical variable and assigns numerical values accordingly.
     """
 
-    def __init__(self, variable: str, mappings: dict):
+    def __init__(self, variable: str, mappings: dict, dtypes: Optional[Dict[str, str]] = None):
         if not isinstance(variable, str):
             raise ValueError("The variable name should be a string.")
 
         self.variable = variable
         self.mappings = mappings
+        self.dtypes = dtypes
 
     def fit(self, X: pd.DataFrame, y: pd.Series = None):
         """Required for compatibility with sklearn pipelines."""
@@ -26,49 +59,53 @@ class Mapper(BaseEstimator, TransformerMixin):
         """Applies mapping transformation to the specified column."""
         X = X.copy()
         X[self.variable] = X[self.variable].map(self.mappings)
-        return X
+        return self._apply_dtype_plan(X, [self.variable])
 
 
-class ColumnStandardScalar(BaseEstimator, TransformerMixin):
+class ColumnStandardScalar(DtypePlanMixin, BaseEstimator, TransformerMixin):
     """Custom transformer to apply standard scaling to numerical features."""
 
-    def __init__(self, variable: list):
+    def __init__(self, variable: list, dtypes: Optional[Dict[str, str]] = None):
         if not isinstance(variable, list):
             raise ValueError("Column names should be provided as a list.")
 
         self.variable = variable
+        self.dtypes = dtypes
         self.scaler = StandardScaler()
 
     def fit(self, X, y=None):
         """Fits the scaler to the specified numerical columns."""
         X = X.copy()
         if self.variable:
-            self.scaler.fit(X[self.variable])
+            # Upcast compact int8/int16/float32 columns so the scaling constants are float64 as when read from CSV
+            self.scaler.fit(X[self.variable].astype(np.float64))
         return self
 
     def transform(self, X):
         """Applies standard scaling to the specified columns."""
         X = X.copy()
         if self.variable:
-            X[self.variable] = self.scaler.transform(X[self.variable])
-        return X
+            X[self.variable] = self.scaler.transform(X[self.variable].astype(np.float64))
+        return self._apply_dtype_plan(X, self.variable)
 
 
-class AnnualPremiumMinMaxScalar(BaseEstimator, TransformerMixin):
+class AnnualPremiumMinMaxScalar(DtypePlanMixin, BaseEstimator, TransformerMixin):
     """Custom transformer to apply MinMax scaling to the Annual Premium column."""
 
-    def __init__(self, variable: list):
+    def __init__(self, variable: list, dtypes: Optional[Dict[str, str]] = None):
         if not isinstance(variable, list):
             raise ValueError("AnnualPremium should be provided as a list.")
 
         self.variable = variable
+        self.dtypes = dtypes
         self.scaler = MinMaxScaler()
 
     def fit(self, X, y=None):
         """Fits the scaler to the specified numerical columns."""
         X = X.copy()
         if self.variable:
-            X_subset = X[self.variable].copy()
+            # Upcast compact float32 columns so the scaling constants are float64 as when read from CSV
+            X_subset = X[self.variable].astype(np.float64)
             self.scaler.fit(X_subset)
         return self
 
@@ -76,68 +113,119 @@ class AnnualPremiumMinMaxScalar(BaseEstimator, TransformerMixin):
         """Applies MinMax scaling to the specified columns."""
         X = X.copy()
         if self.variable:
-            X[self.variable] = self.scaler.transform(X[self.variable])
-        return X
+            X[self.variable] = self.scaler.transform(X[self.variable].astype(np.float64))
+        return self._apply_dtype_plan(X, self.variable)
 
 
-class ColumnOneHotEncoder(BaseEstimator, TransformerMixin):
-    """Custom transformer to apply one-hot encoding to categorical features."""
+class ColumnOneHotEncoder(DtypePlanMixin, BaseEstimator, TransformerMixin):
+    """
+    Custom transformer to encode categorical features, in one of three modes:
+    - 'dense': one 0/1 column per category, as a dense block.
+    - 'sparse': the same columns, built from the encoder's CSR output as pandas sparse columns,
+      so high-cardinality features never materialize a dense n x categories block.
+    - 'ordinal': each feature replaced in place by its category code, one column per feature,
+      which tree models split on just as well.
+    handle_unknown='error' rejects categories not seen in fit; 'ignore' encodes them as all
+    zeros (one-hot modes) or code -1 (ordinal mode).
+    """
 
-    def __init__(self, variable: list):
+    def __init__(self, variable: list, dtypes: Optional[Dict[str, str]] = None, mode: str = "dense", handle_unknown: str = "error"):
         if not isinstance(variable, list):
             raise ValueError("Columns should be provided in a list.")
+        if mode not in ENCODING_MODES:
+            raise ValueError(f"Unknown encoding mode {mode!r}, expected one of {ENCODING_MODES}")
+        if handle_unknown not in ("error", "ignore"):
+            raise ValueError("handle_unknown should be 'error' or 'ignore'.")
 
         self.variable = variable
-        self.encoder = OneHotEncoder(sparse_output=False)
+        self.dtypes = dtypes
+        self.mode = mode
+        self.handle_unknown = handle_unknown
+        self.encoder = self._make_encoder()
+
+    def _make_encoder(self):
+        """sklearn encoder for the configured mode; rebuilt in fit so set_params(mode=...) takes effect."""
+        if self.mode == "ordinal":
+            return OrdinalEncoder(
+                handle_unknown="use_encoded_value" if self.handle_unknown == "ignore" else "error",
+                unknown_value=-1 if self.handle_unknown == "ignore" else None,
+                dtype=np.float32,
+            )
+        return OneHotEncoder(sparse_output=self.mode == "sparse", handle_unknown=self.handle_unknown)
 
     def fit(self, X: pd.DataFrame, y: pd.Series = None):
-        """Fits the encoder to categorical columns."""
+        """Fits the encoder to categorical columns and records the names of the encoded columns."""
         X = X.copy()
         if self.variable:
+            self.encoder = self._make_encoder()
             self.encoder.fit(X[self.variable])
-            self.encoded_features_names = self.encoder.get_feature_names_out()
+            if self.mode == "ordinal":
+                self.encoded_features_names = np.asarray(self.variable, dtype=object)
+            else:
+                self.encoded_features_names = self.encoder.get_feature_names_out()
         return self
 
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """Names of the encoded columns, in output order."""
+        return np.asarray(self.encoded_features_names, dtype=object)
+
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        """Applies one-hot encoding and replaces the original categorical columns."""
+        """Encodes the categorical columns and replaces the original ones."""
         X = X.copy()
+        mode = getattr(self, "mode", "dense")  # Pipelines pickled before the encoding modes are dense
         encoded_cols = self.encoder.transform(X[self.variable])
 
-        # Append encoded features and remove original column
-        X[self.encoded_features_names] = encoded_cols
-        X.drop(self.variable, axis=1, inplace=True)
-        return X
+        if mode == "ordinal":
+            # Codes replace the categorical columns in place
+            X[self.variable] = encoded_cols
+            return self._apply_dtype_plan(X, list(self.encoded_features_names))
 
+        if mode == "sparse":
+            # Sparse columns straight from the CSR matrix
+            encoded = pd.DataFrame.sparse.from_spmatrix(encoded_cols, index=X.index, columns=self.encoded_features_names)
+        else:
+            encoded = pd.DataFrame(encoded_cols, index=X.index, columns=self.encoded_features_names)
 
-class RenameColumnsTransformer(BaseEstimator, TransformerMixin):
-    """Custom transformer to rename specific columns and ensure integer types for dummy variables."""
+        # Append encoded features in one block and remove original columns
+        X = pd.concat([X.drop(columns=self.variable), encoded], axis=1)
+        return self._apply_dtype_plan(X, list(self.encoded_features_names))
 
-    def __init__(self):
-        self.rename_map = {
-            "Vehicle_Age_var_< 1 Year": "Vehicle_Age_var_lt_1_Year",
-            "Vehicle_Age_var_> 2 Years": "Vehicle_Age_var_gt_2_Years"
-        }
-        self.int_columns = ["Vehicle_Age_var_lt_1_Year", "Vehicle_Age_var_gt_2_Years", "Vehicle_Damage_var_Yes"]
+
+class RenameColumnsTransformer(DtypePlanMixin, BaseEstimator, TransformerMixin):
+    """
+    Custom transformer to rename columns and ensure integer types for selected columns.
+    Nothing is renamed or cast by default: the encoded column names ("Vehicle_Age_< 1 Year", ...)
+    are those of the dtype plan and of the trained models.
+    """
+
+    def __init__(
+        self, rename_map: Optional[Dict[str, str]] = None, int_columns: Optional[List[str]] = None, dtypes: Optional[Dict[str, str]] = None
+    ):
+        self.rename_map = rename_map
+        self.int_columns = int_columns
+        self.dtypes = dtypes
 
     def fit(self, X, y=None):
         """Fit method (required but not used in this case)."""
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        """Renames columns and ensures integer type for selected categorical variables."""
+        """Renames columns and ensures integer type for selected columns."""
         X = X.copy()
-        X = X.rename(columns=self.rename_map)
-        for col in self.int_columns:
+        rename_map, int_columns = self.rename_map or {}, self.int_columns or []
+        X = X.rename(columns=rename_map)
+        for col in int_columns:
             if col in X.columns:
-                X[col] = X[col].astype('int')
-        return X
+                X[col] = _astype(X[col], 'int')
+        return self._apply_dtype_plan(X, list(rename_map.values()) + int_columns)
 
 
-class DropColumnsTransformer(BaseEstimator, TransformerMixin):
+class DropColumnsTransformer(DtypePlanMixin, BaseEstimator, TransformerMixin):
     """Custom transformer to drop specified columns from the dataset."""
 
-    def __init__(self, variable=None):
+    def __init__(self, variable=None, dtypes: Optional[Dict[str, str]] = None):
         self.variable = variable
+        self.dtypes = dtypes
 
     def fit(self, X, y=None):
         return self
@@ -147,4 +235,6 @@ class DropColumnsTransformer(BaseEstimator, TransformerMixin):
         X = X.copy()
         if self.variable:
             X = X.drop(columns=self.variable, errors="ignore")
-        return X
\ No newline at end of file
+
+        # Last transformer before the model: make sure every planned column has its dtype
+        return self._apply_dtype_plan(X)
\ No newline at end of file
@@ -0,0 +1,213 @@
+from collections import deque
+from typing import Any, Dict
+import numpy as np
+
+# Inference engines that can evaluate a FlatForest
+ENGINES = ("numpy", "numba")
+
+# Rows evaluated together by the NumPy engine; keeps the (trees x rows) working set in cache
+NUMPY_BLOCK_ROWS = 1024
+
+# Rows the Numba kernel walks down a tree together, so their memory lookups overlap
+NUMBA_ROW_GROUP = 8
+
+
+class FlatForest:
+    """
+    Fitted RandomForestClassifier flattened into plain NumPy node arrays.
+    All trees are concatenated into one set of arrays (children, feature, threshold, leaf
+    probabilities), so the whole forest can be memory-mapped and shared between processes
+    instead of every worker unpickling its own copy of the sklearn tree objects.
+
+    Layout, chosen so a traversal step is a couple of gathers and one addition:
+    - Each tree is renumbered breadth-first and stored contiguously, so the shallow levels
+      every row visits are packed together and the right child always follows the left one.
+    - Leaves point to themselves and always go left, so rows that reached a leaf stay there.
+    - Thresholds are float32, rounded towards -inf: for the float32 features sklearn uses,
+      x <= float32 threshold gives exactly the same decision as x <= the fitted float64 threshold.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.roots = arrays["roots"]  # Index of each tree's root node
+        self.left = arrays["left"]  # Global index of the left child (the right child is left + 1), itself at leaves
+        self.feature = arrays["feature"]  # Feature tested at each node
+        self.threshold = arrays["threshold"]  # Split threshold as float32, rounded down; +inf at leaves
+        self.missing_right = arrays["missing_right"]  # Whether NaN goes to the right child
+        self.leaf_proba = arrays["leaf_proba"]  # Class probabilities of each node
+        self.classes_ = arrays["classes"]
+        self.max_depth = int(arrays["max_depth"].item())
+
+    @classmethod
+    def from_estimator(cls, estimator: Any) -> "FlatForest":
+        """Flattens the trees of a fitted single-output RandomForestClassifier."""
+        if estimator.n_outputs_ != 1:
+            raise ValueError("Only single-output forests are supported")
+
+        roots, left, feature, threshold, missing_right, leaf_proba = [], [], [], [], [], []
+        offset = 0
+        for tree in estimator.estimators_:
+            tree_ = tree.tree_
+            order = _breadth_first_order(tree_.children_left, tree_.children_right)
+            new_index = np.empty_like(order)
+            new_index[order] = np.arange(len(order))
+
+            # Renumber the tree breadth-first and shift it by its offset in the concatenated arrays
+            children_left = tree_.children_left[order]
+            is_leaf = children_left == -1
+            roots.append(offset)
+            left.append(np.where(is_leaf, np.arange(len(order)), new_index[children_left]) + offset)
+            feature.append(np.where(is_leaf, 0, tree_.feature[order]))
+            threshold.append(np.where(is_leaf, np.inf, _round_down_to_float32(tree_.threshold[order])))
+            missing_right.append(~is_leaf & ~tree_.missing_go_to_left[order].astype(bool))
+            leaf_proba.append(tree_.value[order, 0, :estimator.n_classes_])
+            offset += tree_.node_count
+
+        arrays = {
+            "roots": np.asarray(roots, dtype=np.int32),
+            "left": np.concatenate(left).astype(np.int32),
+            "feature": np.concatenate(feature).astype(np.int32),
+            "threshold": np.concatenate(threshold).astype(np.float32),
+            "missing_right": np.concatenate(missing_right),
+            "leaf_proba": np.ascontiguousarray(np.concatenate(leaf_proba), dtype=np.float64),
+            "classes": np.asarray(estimator.classes_),
+            "max_depth": np.asarray(max(tree.tree_.max_depth for tree in estimator.estimators_)),
+        }
+        return cls(arrays)
+
+    @property
+    def n_estimators(self) -> int:
+        return len(self.roots)
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Returns the leaf reached in every tree by every row, shape (n_trees, n_rows)."""
+        X = _as_float32_matrix(X)
+        leaves = np.empty((self.n_estimators, X.shape[0]), dtype=np.int32)
+        for start in range(0, X.shape[0], NUMPY_BLOCK_ROWS):
+            leaves[:, start:start + NUMPY_BLOCK_ROWS] = self._apply_block(X[start:start + NUMPY_BLOCK_ROWS])
+        return leaves
+
+    def _apply_block(self, X: np.ndarray) -> np.ndarray:
+        """
+        Level-by-level traversal of all trees at once.
+        Every step moves each (tree, row) pair one level down with vectorized gathers.
+        """
+        n_rows, n_features = X.shape
+        values_flat = X.ravel()
+        has_missing = bool(np.isnan(values_flat).any())
+
+        # One entry per (tree, row) pair, tree-major; row_base locates the row in the flattened X
+        node = np.repeat(self.roots, n_rows)
+        row_base = np.tile(np.arange(n_rows, dtype=np.int32) * n_features, self.n_estimators)
+
+        # Buffers reused at every level instead of allocating new arrays per operation
+        index = np.empty_like(node)
+        values = np.empty(node.shape, dtype=np.float32)
+        threshold = np.empty_like(values)
+        go_right = np.empty(node.shape, dtype=bool)
+
+        for _ in range(self.max_depth):
+            np.take(self.feature, node, out=index)
+            index += row_base
+            np.take(values_flat, index, out=values)
+            np.take(self.threshold, node, out=threshold)
+
+            # Same decision rule as sklearn's tree: NaN follows the missing-value direction, otherwise x <= threshold
+            np.greater(values, threshold, out=go_right)
+            if has_missing:
+                go_right |= np.isnan(values) & self.missing_right[node]
+            np.take(self.left, node, out=node)
+            node += go_right
+
+        return node.reshape(self.n_estimators, n_rows)
+
+    def predict_proba(self, X: np.ndarray, engine: str = "numpy") -> np.ndarray:
+        """
+        Class probabilities, accumulated tree by tree in the same order as
+        RandomForestClassifier.predict_proba so the results are identical.
+        engine selects vectorized NumPy traversal or the Numba-compiled kernel (needs numba).
+        """
+        if engine == "numba":
+            X = _as_float32_matrix(X)
+            proba = np.zeros((X.shape[0], self.leaf_proba.shape[1]), dtype=np.float64)
+            _numba_kernel()(
+                X, self.roots, self.left, self.feature, self.threshold, self.missing_right, self.leaf_proba,
+                self.max_depth, NUMBA_ROW_GROUP, proba,
+            )
+        elif engine == "numpy":
+            leaves = self.apply(X)
+            proba = np.zeros((leaves.shape[1], self.leaf_proba.shape[1]), dtype=np.float64)
+            for t in range(self.n_estimators):
+                proba += self.leaf_proba[leaves[t]]
+        else:
+            raise ValueError(f"Unknown inference engine {engine!r}, expected one of {ENGINES}")
+
+        proba /= self.n_estimators
+        return proba
+
+    def predict(self, X: np.ndarray, engine: str = "numpy") -> np.ndarray:
+        """Class labels, exactly as RandomForestClassifier.predict returns them."""
+        return self.classes_.take(np.argmax(self.predict_proba(X, engine=engine), axis=1), axis=0)
+
+
+def _breadth_first_order(children_left: np.ndarray, children_right: np.ndarray) -> np.ndarray:
+    """Node indices of a sklearn tree in breadth-first order, with each right child right after its left sibling."""
+    order, queue = [], deque([0])
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        if children_left[node] != -1:
+            queue.append(children_left[node])
+            queue.append(children_right[node])
+    return np.asarray(order, dtype=np.intp)
+
+
+def _round_down_to_float32(threshold: np.ndarray) -> np.ndarray:
+    """Largest float32 not greater than each float64 threshold."""
+    rounded = threshold.astype(np.float32)
+    too_large = rounded > threshold
+    rounded[too_large] = np.nextafter(rounded[too_large], np.float32(-np.inf))
+    return rounded
+
+
+def _as_float32_matrix(X: Any) -> np.ndarray:
+    """Model matrix as C-contiguous float32, the dtype sklearn's trees compare in."""
+    return np.ascontiguousarray(X, dtype=np.float32)
+
+
+def _accumulate_proba(X, roots, left, feature, threshold, missing_right, leaf_proba, max_depth, row_group, proba):
+    """
+    Tree-at-a-time traversal compiled by Numba.
+    Each tree is walked by groups of rows in lockstep, a fixed max_depth steps down (leaves loop
+    onto themselves), and the leaf probabilities are added to every row in tree order.
+    """
+    nodes = np.empty(row_group, dtype=np.int32)
+    n_rows = X.shape[0]
+    for t in range(roots.shape[0]):
+        for start in range(0, n_rows, row_group):
+            size = min(row_group, n_rows - start)
+            nodes[:size] = roots[t]
+            for _ in range(max_depth):
+                for j in range(size):
+                    node = nodes[j]
+                    value = X[start + j, feature[node]]
+                    go_right = (value > threshold[node]) | ((value != value) & missing_right[node])  # value != value: NaN
+                    nodes[j] = left[node] + go_right
+            for j in range(size):
+                for c in range(leaf_proba.shape[1]):
+                    proba[start + j, c] += leaf_proba[nodes[j], c]
+
+
+_compiled_kernel = None
+
+
+def _numba_kernel():
+    """Compiles the traversal kernel with Numba on first use; numba is an optional dependency."""
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        try:
+            import numba
+        except ImportError as error:
+            raise ImportError("The numba inference engine requires numba: pip install numba") from error
+        _compiled_kernel = numba.njit(nogil=True, cache=True)(_accumulate_proba)
+    return _compiled_kernel
@@ -0,0 +1,361 @@
+from typing import Any, Dict, List, Mapping, Optional, Union
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from vehicleinsurance_model.processing.forest import FlatForest
+from vehicleinsurance_model.processing.features import (
+    Mapper,
+    ColumnStandardScalar,
+    AnnualPremiumMinMaxScalar,
+    ColumnOneHotEncoder,
+    RenameColumnsTransformer,
+    DropColumnsTransformer,
+)
+
+
+class FusedColumn:
+    """
+    Recipe for one output column of the fused transform.
+    Records which raw input column it is read from and which fitted constants are applied to it.
+    """
+
+    def __init__(self, source: str, kind: str = "passthrough", params: Optional[Dict[str, Any]] = None):
+        self.source = source  # Raw input column the values are read from
+        self.kind = kind  # One of 'passthrough', 'map', 'standard', 'minmax', 'onehot', 'ordinal'
+        self.params = params or {}  # Fitted constants (mappings, means, scales, categories, ...)
+        self.as_int = False  # Truncate to integer, as RenameColumnsTransformer does with astype('int')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-Python form of the recipe for the on-disk model bundle."""
+        params = {
+            key: {str(k): _to_python(v) for k, v in value.items()} if isinstance(value, dict) else _to_python(value)
+            for key, value in self.params.items()
+        }
+        return {"source": self.source, "kind": self.kind, "params": params, "as_int": self.as_int}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FusedColumn":
+        column = cls(data["source"], data["kind"], data["params"])
+        column.as_int = data["as_int"]
+        return column
+
+
+def _to_python(value: Any) -> Any:
+    """Converts NumPy scalars and arrays to the equivalent Python values (float64 round-trips exactly)."""
+    if isinstance(value, (list, np.ndarray)):
+        return [_to_python(v) for v in value]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _is_missing_category(category: Any) -> bool:
+    """Checks whether a fitted one-hot category stands for missing values."""
+    return isinstance(category, float) and np.isnan(category)
+
+
+class FusedTransform:
+    """
+    Single-pass replacement for the preprocessing steps of a fitted vehicleinsurance pipeline.
+    Holds only the fitted constants and writes every model feature straight into one
+    preallocated float32 matrix, without the intermediate DataFrame copies of the step-by-step path.
+    """
+
+    def __init__(self, columns: List[FusedColumn], feature_names: List[str]):
+        self.columns = columns
+        self.feature_names = feature_names  # Output column order expected by the model
+
+        # Group the categories of the encoded columns by source so every source is encoded once
+        self.category_sources: Dict[str, List[Any]] = {}
+        self.ignore_unknown = set()  # Sources whose unseen categories encode as all zeros / -1 instead of raising
+        for column in columns:
+            if column.kind == "onehot":
+                self.category_sources.setdefault(column.source, []).append(column.params["category"])
+            elif column.kind == "ordinal":
+                self.category_sources[column.source] = list(column.params["categories"])
+            if column.kind in ("onehot", "ordinal") and column.params.get("handle_unknown") == "ignore":
+                self.ignore_unknown.add(column.source)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-Python form of the transform for the on-disk model bundle."""
+        return {"columns": [column.to_dict() for column in self.columns], "feature_names": list(self.feature_names)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FusedTransform":
+        return cls(columns=[FusedColumn.from_dict(column) for column in data["columns"]], feature_names=data["feature_names"])
+
+    def _encode_categories(self, X: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Looks up every encoded source column once and returns its category codes (-1 for unseen).
+        Raises the same error as OneHotEncoder(handle_unknown='error') on unseen categories,
+        unless the source was encoded with handle_unknown='ignore'.
+        """
+        codes = {}
+        for source, categories in self.category_sources.items():
+            values = np.asarray(X[source], dtype=object)
+            known = [c for c in categories if not _is_missing_category(c)]
+            source_codes = pd.Categorical(values, categories=known).codes.astype(np.int64)
+
+            # OneHotEncoder sorts a fitted missing-value category last
+            if len(known) < len(categories):
+                source_codes[pd.isna(values)] = len(known)
+
+            if source not in self.ignore_unknown and (source_codes < 0).any():
+                unknown = pd.unique(values[source_codes < 0])
+                raise ValueError(f"Found unknown categories {list(unknown)} in column {source!r} during transform")
+            codes[source] = source_codes
+        return codes
+
+    def transform(self, X: Union[pd.DataFrame, Mapping[str, Any]], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Applies all fitted preprocessing constants in a single pass.
+        Accepts a DataFrame or any mapping of column name to array-like and returns a
+        float32 matrix whose values match the step-by-step pipeline bit-for-bit.
+        """
+        codes = self._encode_categories(X)
+        n_rows = len(X[self.columns[0].source]) if self.columns else len(X)
+
+        # Preallocate the output once; each feature is written into its own column
+        if out is None:
+            out = np.empty((n_rows, len(self.columns)), dtype=np.float32)
+
+        for j, column in enumerate(self.columns):
+            if column.kind == "onehot":
+                # Compare the precomputed category codes instead of the raw strings (always 0/1, so as_int is a no-op)
+                out[:, j] = codes[column.source] == self.category_sources[column.source].index(column.params["category"])
+                continue
+            if column.kind == "ordinal":
+                # The code itself, with a fitted missing-value category encoded as NaN like OrdinalEncoder
+                result = codes[column.source].astype(np.float64)
+                if any(_is_missing_category(c) for c in column.params["categories"]):
+                    result[codes[column.source] == len(column.params["categories"]) - 1] = np.nan
+                out[:, j] = result
+                continue
+
+            values = np.asarray(X[column.source])
+            if column.kind == "passthrough":
+                result = values
+            elif column.kind == "map":
+                # Series.map semantics: unmapped values become NaN
+                result = np.full(n_rows, np.nan)
+                for key, mapped in column.params["mappings"].items():
+                    result[values == key] = mapped
+            elif column.kind == "standard":
+                # Same operations, dtype and order as StandardScaler.transform on the float64-upcast column
+                result = np.array(values, dtype=np.float64)
+                result -= column.params["mean"]
+                result /= column.params["scale"]
+            elif column.kind == "minmax":
+                # Same operations, dtype and order as MinMaxScaler.transform on the float64-upcast column
+                result = np.array(values, dtype=np.float64)
+                result *= column.params["scale"]
+                result += column.params["min"]
+            else:
+                raise ValueError(f"Unknown fused column kind: {column.kind!r}")
+
+            if column.as_int:
+                result = np.asarray(result).astype("int")
+            out[:, j] = result
+
+        return out
+
+
+    def transform_record(self, record: Mapping[str, Any]) -> np.ndarray:
+        """
+        Encodes a single raw record into a (1, n_features) float32 row vector.
+        Uses plain scalar arithmetic on the fitted constants, avoiding all per-call array and
+        DataFrame overhead while producing the same values as transform().
+        """
+        row = np.empty((1, len(self.columns)), dtype=np.float32)
+
+        for j, column in enumerate(self.columns):
+            value = record[column.source]
+            if value is None:
+                value = np.nan  # Missing values behave like NaN in the DataFrame path
+
+            if column.kind == "passthrough":
+                result = value
+            elif column.kind == "map":
+                result = column.params["mappings"].get(value, np.nan)
+            elif column.kind == "standard":
+                result = (float(value) - column.params["mean"]) / column.params["scale"]
+            elif column.kind == "minmax":
+                result = float(value) * column.params["scale"] + column.params["min"]
+            elif column.kind in ("onehot", "ordinal"):
+                categories = self.category_sources[column.source]
+                missing = isinstance(value, float) and np.isnan(value)
+                if missing and any(_is_missing_category(c) for c in categories):
+                    code = len(categories) - 1  # The missing-value category is sorted last
+                elif missing or value not in categories:
+                    if column.source not in self.ignore_unknown:
+                        raise ValueError(f"Found unknown categories [{value!r}] in column {column.source!r} during transform")
+                    code = -1
+                else:
+                    code = categories.index(value)
+                if column.kind == "onehot":
+                    result = code == categories.index(column.params["category"])
+                else:
+                    result = np.nan if code >= 0 and _is_missing_category(categories[code]) else code
+            else:
+                raise ValueError(f"Unknown fused column kind: {column.kind!r}")
+
+            if column.as_int:
+                result = int(result)
+            row[0, j] = result
+
+        return row
+
+
+def _fuse_step(step: Any, frame: Dict[str, FusedColumn]) -> Dict[str, FusedColumn]:
+    """
+    Replays one fitted transformer on the column recipes instead of on the data.
+    Returns the recipes of the columns the transformer would output, in output order.
+    """
+    if isinstance(step, Mapper):
+        column = frame[step.variable]
+        if column.kind != "passthrough":
+            raise ValueError(f"Cannot fuse Mapper on already transformed column {step.variable!r}")
+        frame[step.variable] = FusedColumn(column.source, "map", {"mappings": dict(step.mappings)})
+
+    elif isinstance(step, (ColumnStandardScalar, AnnualPremiumMinMaxScalar)):
+        for i, name in enumerate(step.variable):
+            column = frame[name]
+            if column.kind != "passthrough":
+                raise ValueError(f"Cannot fuse scaling on already transformed column {name!r}")
+            if isinstance(step, ColumnStandardScalar):
+                scaler = step.scaler
+                params = {
+                    "mean": scaler.mean_[i] if scaler.with_mean else 0.0,
+                    "scale": scaler.scale_[i] if scaler.with_std else 1.0,
+                }
+                frame[name] = FusedColumn(column.source, "standard", params)
+            else:
+                if step.scaler.clip:
+                    raise ValueError("Cannot fuse a clipping MinMaxScaler")
+                params = {"scale": step.scaler.scale_[i], "min": step.scaler.min_[i]}
+                frame[name] = FusedColumn(column.source, "minmax", params)
+
+    elif isinstance(step, ColumnOneHotEncoder):
+        if not step.variable:
+            return frame
+        mode = getattr(step, "mode", "dense")
+        handle_unknown = getattr(step, "handle_unknown", "error")
+        if mode != "ordinal" and step.encoder.drop is not None:
+            raise ValueError("Cannot fuse a OneHotEncoder that drops categories")
+        names = iter(step.encoded_features_names)
+        encoded = {}
+        for name, categories in zip(step.variable, step.encoder.categories_):
+            column = frame[name]
+            if column.kind != "passthrough":
+                raise ValueError(f"Cannot fuse categorical encoding on already transformed column {name!r}")
+            if mode == "ordinal":
+                frame[name] = FusedColumn(column.source, "ordinal", {"categories": list(categories), "handle_unknown": handle_unknown})
+                continue
+            # Dense and sparse one-hot columns hold the same values
+            for category in categories:
+                encoded[next(names)] = FusedColumn(column.source, "onehot", {"category": category, "handle_unknown": handle_unknown})
+
+        # Encoded columns are appended, then the original categorical columns are dropped
+        if mode != "ordinal":
+            frame = {name: column for name, column in frame.items() if name not in step.variable}
+            frame.update(encoded)
+
+    elif isinstance(step, RenameColumnsTransformer):
+        rename_map = step.rename_map or {}
+        frame = {rename_map.get(name, name): column for name, column in frame.items()}
+        for name in step.int_columns or []:
+            if name in frame:
+                frame[name].as_int = True
+
+    elif isinstance(step, DropColumnsTransformer):
+        if step.variable:
+            dropped = [step.variable] if isinstance(step.variable, str) else list(step.variable)
+            frame = {name: column for name, column in frame.items() if name not in dropped}
+
+    else:
+        raise ValueError(f"Cannot fuse pipeline step of type {type(step).__name__}")
+
+    return frame
+
+
+def fuse_transform(pipeline: Pipeline, input_features: List[str]) -> FusedTransform:
+    """
+    Compiles the fitted preprocessing steps of a pipeline (all steps but the final estimator)
+    into a single FusedTransform reading the given raw input columns.
+    """
+    frame = {name: FusedColumn(name) for name in input_features}
+
+    for _, step in pipeline.steps[:-1]:
+        frame = _fuse_step(step, frame)
+
+    # The final estimator records the column order it was fitted on
+    estimator = pipeline.steps[-1][1]
+    feature_names = list(frame)
+    if hasattr(estimator, "feature_names_in_") and list(estimator.feature_names_in_) != feature_names:
+        raise ValueError("Fused columns do not match the features the model was fitted on")
+
+    return FusedTransform(columns=list(frame.values()), feature_names=feature_names)
+
+
+def forest_predict_proba(estimator: Any, X: np.ndarray) -> np.ndarray:
+    """
+    Class probabilities of a fitted forest for an already preprocessed float32 matrix.
+    Accumulates the per-tree probabilities in the same order as RandomForestClassifier.predict_proba
+    (with n_jobs=1), but skips its input re-validation and feature-name checks and reads the
+    leaf values from each tree's low-level tree_ directly, which dominates single-row latency.
+    """
+    if estimator.n_outputs_ != 1:
+        raise ValueError("Only single-output forests are supported")
+
+    X = np.asarray(X, dtype=np.float32)
+    proba = np.zeros((X.shape[0], estimator.n_classes_), dtype=np.float64)
+    for tree in estimator.estimators_:
+        proba += tree.tree_.predict(X)[:, :estimator.n_classes_]
+    proba /= len(estimator.estimators_)
+    return proba
+
+
+class FusedPipeline:
+    """
+    Compiled inference mode of a fitted vehicleinsurance pipeline.
+    Runs the fused single-pass transform and hands the float32 matrix directly to the forest,
+    which is either the fitted RandomForestClassifier or its FlatForest node arrays.
+    """
+
+    def __init__(self, transform: FusedTransform, estimator: Any):
+        self.transform_ = transform
+        self.estimator = estimator
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Pipeline, input_features: List[str]) -> "FusedPipeline":
+        """Builds the fused inference mode from a fitted pipeline."""
+        return cls(transform=fuse_transform(pipeline, input_features), estimator=pipeline.steps[-1][1])
+
+    @property
+    def feature_names(self) -> List[str]:
+        return self.transform_.feature_names
+
+    def transform(self, X: Union[pd.DataFrame, Mapping[str, Any]]) -> np.ndarray:
+        """Preprocesses raw input into the float32 model matrix."""
+        return self.transform_.transform(X)
+
+    def predict_proba(self, X: Union[pd.DataFrame, Mapping[str, Any]]) -> np.ndarray:
+        """Returns class probabilities for raw input."""
+        return self.predict_proba_matrix(self.transform(X))
+
+    def predict_proba_matrix(self, X: np.ndarray) -> np.ndarray:
+        """Returns class probabilities for an already transformed float32 model matrix."""
+        if isinstance(self.estimator, FlatForest):
+            return self.estimator.predict_proba(X)
+        return forest_predict_proba(self.estimator, X)
+
+    def predict(self, X: Union[pd.DataFrame, Mapping[str, Any]]) -> np.ndarray:
+        """Returns class labels for raw input, exactly as the step-by-step pipeline would."""
+        return self.predict_matrix(self.transform(X))
+
+    def predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        """Returns class labels for an already transformed float32 model matrix."""
+        proba = self.predict_proba_matrix(X)
+        return self.estimator.classes_.take(np.argmax(proba, axis=1), axis=0)
+
+    def predict_record(self, record: Mapping[str, Any]) -> np.ndarray:
+        """Returns the class label of a single raw record as a one-element array."""
+        return self.predict_matrix(self.transform_.transform_record(record))
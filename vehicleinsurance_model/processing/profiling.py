@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size of the process, from psutil when installed, else /proc (Linux); None when unknown."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """High-water mark of the process's resident set size; None where the resource module is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Bytes on macOS, kilobytes on Linux
+
+
+def data_bytes(data: Any) -> Optional[int]:
+    """Memory held by a step's input or output: DataFrame and Series (deep), NumPy and sparse arrays; None otherwise."""
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True, index=False).sum())
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(deep=True, index=False))
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if hasattr(data, "data") and hasattr(data, "indices"):  # scipy.sparse matrices
+        return data.data.nbytes + data.indices.nbytes + data.indptr.nbytes
+    return None
+
+
+def _buffers(data: Any) -> List[np.ndarray]:
+    """The NumPy buffers behind a step's input or output, one per DataFrame column."""
+    if isinstance(data, pd.DataFrame):
+        return [column.array.to_numpy() if isinstance(column.dtype, np.dtype) else np.empty(0) for _, column in data.items()]
+    if isinstance(data, np.ndarray):
+        return [data]
+    return []
+
+
+def copied_output(X_in: Any, X_out: Any) -> tuple:
+    """
+    Output buffers that do not share memory with any input buffer, i.e. data the step copied or
+    computed rather than passed through. Returns (number of such buffers, their bytes).
+    Extension-typed columns (categorical, sparse) are not inspected.
+    """
+    inputs = [buffer for buffer in _buffers(X_in) if buffer.size]
+    copies = copied_bytes = 0
+    for buffer in _buffers(X_out):
+        if buffer.size and not any(np.shares_memory(buffer, source) for source in inputs):
+            copies += 1
+            copied_bytes += buffer.nbytes
+    return copies, copied_bytes
+
+
+class PipelineProfiler:
+    """
+    Profiles the named steps of a pipeline run: make_prediction, run_training or batch scoring.
+
+    Every step is run through run(), which records for it:
+    - wall time;
+    - traced memory (tracemalloc, which NumPy and pandas report their buffers to): the peak above
+      the step's start and the increment still held when it returns;
+    - process RSS before and after the step, and how much it raised the process's peak RSS;
+    - bytes of its input and output and the output buffers it copied rather than passed through.
+    Steps run several times (one call per chunk) are aggregated: times, bytes and copies add up,
+    peaks are the largest seen. report() prints a table, to_dict()/save() give JSON for diff_profiles.
+    """
+
+    def __init__(self, label: Optional[str] = None):
+        self.label = label  # E.g. the model version, written to the JSON report
+        self.steps: Dict[str, dict] = {}
+        self.rows = 0
+
+    def add_rows(self, n_rows: int) -> None:
+        """Counts the records passed through the pipeline, for the per-row figures."""
+        self.rows += n_rows
+
+    def run(self, name: str, func: Callable[[Any], Any], X: Any) -> Any:
+        """Calls func(X) as the named step and records its profile. Returns func's result."""
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before, peak_rss_before = _rss_bytes(), _peak_rss_bytes()
+
+        start = time.perf_counter()
+        try:
+            result = func(X)
+        finally:
+            seconds = time.perf_counter() - start
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+        rss_after, peak_rss_after = _rss_bytes(), _peak_rss_bytes()
+
+        copies, copied_bytes = copied_output(X, result)
+        self._record(name, {
+            "calls": 1,
+            "seconds": seconds,
+            "peak_mb": (traced_peak - traced_before) / 2**20,
+            "incremental_mb": (traced_after - traced_before) / 2**20,
+            "rss_mb": None if rss_after is None else rss_after / 2**20,
+            "rss_delta_mb": None if rss_after is None or rss_before is None else (rss_after - rss_before) / 2**20,
+            "peak_rss_increase_mb": None if peak_rss_after is None else (peak_rss_after - peak_rss_before) / 2**20,
+            "bytes_in": data_bytes(X),
+            "bytes_out": data_bytes(result),
+            "copies": copies,
+            "copied_bytes": copied_bytes,
+        })
+        return result
+
+    def _record(self, name: str, profile: dict) -> None:
+        step = self.steps.get(name)
+        if step is None:
+            self.steps[name] = profile
+            return
+        for key in ("calls", "seconds", "incremental_mb", "rss_delta_mb", "peak_rss_increase_mb", "bytes_in", "bytes_out", "copies", "copied_bytes"):
+            step[key] = None if step[key] is None or profile[key] is None else step[key] + profile[key]
+        step["peak_mb"] = max(step["peak_mb"], profile["peak_mb"])
+        step["rss_mb"] = profile["rss_mb"] if step["rss_mb"] is None else max(step["rss_mb"], profile["rss_mb"] or 0)
+
+    def to_dict(self) -> dict:
+        return {"label": self.label, "rows": self.rows, "steps": [{"step": name, **profile} for name, profile in self.steps.items()]}
+
+    def save(self, path) -> None:
+        """Writes the profile as JSON."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def report(self) -> str:
+        """Table of the steps in the order they first ran."""
+        return format_profile(self.to_dict())
+
+
+def _mb(value: Optional[float], scale: float = 1.0) -> str:
+    return "" if value is None else f"{value / scale:.1f}"
+
+
+def format_profile(profile: dict) -> str:
+    """Table of a profile (PipelineProfiler.to_dict() or its saved JSON)."""
+    header = f"{'step':<28}{'calls':>6}{'seconds':>10}{'peak MB':>10}{'held MB':>10}{'RSS MB':>10}{'+RSS MB':>10}{'in MB':>10}{'out MB':>10}{'copies':>8}{'copied MB':>11}"
+    lines = [f"{profile['label'] or 'pipeline'}: {profile['rows']} rows", header]
+    for step in profile["steps"]:
+        lines.append(
+            f"{step['step']:<28}{step['calls']:>6}{step['seconds']:>10.3f}{step['peak_mb']:>10.1f}{step['incremental_mb']:>10.1f}"
+            f"{_mb(step['rss_mb']):>10}{_mb(step['peak_rss_increase_mb']):>10}{_mb(step['bytes_in'], 2**20):>10}"
+            f"{_mb(step['bytes_out'], 2**20):>10}{step['copies']:>8}{step['copied_bytes'] / 2**20:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def diff_profiles(baseline: dict, current: dict) -> str:
+    """
+    Step-by-step comparison of two saved profiles, e.g. of two model versions on the same input.
+    Shows wall time, traced peak memory and output bytes of each step in both, with the change.
+    """
+    before = {step["step"]: step for step in baseline["steps"]}
+    lines = [
+        f"{baseline['label'] or 'baseline'} ({baseline['rows']} rows) -> {current['label'] or 'current'} ({current['rows']} rows)",
+        f"{'step':<28}{'seconds':>18}{'peak MB':>18}{'out MB':>18}",
+    ]
+    for step in current["steps"]:
+        old = before.get(step["step"])
+        if old is None:
+            lines.append(f"{step['step']:<28}{'(new step)':>18}")
+            continue
+        cells = [
+            f"{old['seconds']:.3f}>{step['seconds']:.3f}",
+            f"{old['peak_mb']:.1f}>{step['peak_mb']:.1f}",
+            f"{_mb(old['bytes_out'], 2**20)}>{_mb(step['bytes_out'], 2**20)}",
+        ]
+        lines.append(f"{step['step']:<28}" + "".join(f"{cell:>18}" for cell in cells))
+    for name in before.keys() - {step["step"] for step in current["steps"]}:
+        lines.append(f"{name:<28}{'(removed step)':>18}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Show a saved pipeline profile, or compare two of them step by step.")
+    parser.add_argument("profiles", nargs="+", help="One profile JSON file to show, or a baseline and a current one to compare")
+    args = parser.parse_args(argv)
+    profiles = [json.loads(Path(path).read_text()) for path in args.profiles[:2]]
+    print(format_profile(profiles[0]) if len(profiles) == 1 else diff_profiles(*profiles))
+
+
+if __name__ == "__main__":
+    main()
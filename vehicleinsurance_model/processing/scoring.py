@@ -0,0 +1,62 @@
+from typing import Optional
+import numpy as np
+
+
+def positive_proba(proba: np.ndarray, classes: np.ndarray, positive_class=1) -> np.ndarray:
+    """Probability of the positive class (Response=1) for every row of a predict_proba matrix."""
+    return proba[:, list(classes).index(positive_class)]
+
+
+def apply_threshold(positive: np.ndarray, classes: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Class labels for a binary model from the positive-class probabilities, in one vectorized step.
+    A row is labelled positive when its probability exceeds the threshold, so threshold=0.5 gives
+    exactly the labels of predict (which breaks a 0.5 tie towards the first class).
+    """
+    check_threshold(threshold)
+    return classes.take((positive > threshold).astype(np.intp))
+
+
+def check_threshold(threshold: float) -> None:
+    if not 0.0 <= threshold <= 1.0:
+        raise ValueError(f"Decision threshold must be between 0 and 1, got {threshold}")
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k highest scores, highest first.
+    np.argpartition selects them in linear time; only those k are then sorted,
+    instead of sorting a full copy of the scores.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        selected = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+
+class TopK:
+    """
+    Running top-k of scores seen chunk by chunk, e.g. the highest-propensity customers of a file.
+    Holds at most k candidates plus the current chunk's best k, never the full score column.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.scores = np.empty(0, dtype=np.float64)
+        self.ids: Optional[np.ndarray] = None
+
+    def update(self, scores: np.ndarray, ids: np.ndarray) -> None:
+        """Merges the best k of a chunk into the current candidates."""
+        best = top_k(scores, self.k)
+        scores = np.concatenate([self.scores, scores[best]])
+        ids = ids[best] if self.ids is None else np.concatenate([self.ids, ids[best]])
+        keep = top_k(scores, self.k)
+        self.scores, self.ids = scores[keep], ids[keep]
+
+    def result(self) -> tuple:
+        """The ids and scores of the k best rows seen, highest first."""
+        ids = np.empty(0) if self.ids is None else self.ids
+        return ids, self.scores
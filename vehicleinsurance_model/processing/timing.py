@@ -0,0 +1,57 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class StageTimer:
+    """
+    Records the wall time and peak traced memory of consecutive stages of a run.
+    Peak memory is measured with tracemalloc, which NumPy and pandas report their buffers to,
+    so it reflects the arrays allocated by each stage; pass track_memory=False to skip it.
+    """
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.stages: List[Dict] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as one stage."""
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak_mb = (tracemalloc.get_traced_memory()[1] - baseline) / 2**20 if self.track_memory else None
+            if started_tracing:
+                tracemalloc.stop()
+            self.stages.append({"stage": name, "seconds": seconds, "peak_mb": peak_mb, "nested": False})
+
+    def add(self, name: str, seconds: float, peak_mb: Optional[float] = None, nested: bool = False) -> None:
+        """
+        Records a stage that was measured elsewhere.
+        Nested stages break down the previous stage and are not counted again in the total.
+        """
+        self.stages.append({"stage": name, "seconds": seconds, "peak_mb": peak_mb, "nested": nested})
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stage["seconds"] for stage in self.stages if not stage["nested"])
+
+    def report(self) -> str:
+        """Table of the stages with their wall time and peak memory above the stage's start."""
+        lines = [f"{'stage':<40}{'seconds':>10}{'peak MB':>10}"]
+        for stage in self.stages:
+            name = f"  {stage['stage']}" if stage["nested"] else stage["stage"]
+            peak_mb = "" if stage["peak_mb"] is None else f"{stage['peak_mb']:.1f}"
+            lines.append(f"{name:<40}{stage['seconds']:>10.2f}{peak_mb:>10}")
+        lines.append(f"{'total':<40}{self.total_seconds:>10.2f}")
+        return "\n".join(lines)
@@ -5,21 +5,52 @@ file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
 
 # Add parent directory to Python's module search path
-sys.path.append(str(root))
-from typing import List, Optional, Tuple, Union
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import json
+import numbers
+import re
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union, get_args, get_origin
 from datetime import datetime
 import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ValidationError
+from pydantic.version import version_short
 from vehicleinsurance_model.config.core import config
 from vehicleinsurance_model.processing.data_manager import pre_pipeline_preparation
 
+# Strings pydantic accepts as integers in lax mode once stripped, e.g. "28", "28.0" or "1_000" (not "28." or "٣")
+_INT_STRING = re.compile(r"[+-]?\d+(?:_\d+)*(?:\.0+)?", re.ASCII)
+
+# Integers the model's int64 columns can hold
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Strings pydantic accepts as floats once stripped and without underscores, e.g. "1.5e3", "-inf" or "NaN"
+_FLOAT_STRING = re.compile(r"[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|nan|inf|infinity)", re.IGNORECASE | re.ASCII)
+_MISPLACED_UNDERSCORE = re.compile(r"^_|_$|__")
+
+# Error messages used by pydantic for the checks below
+_MESSAGES = {
+    "int_parsing": "Input should be a valid integer, unable to parse string as an integer",
+    "int_from_float": "Input should be a valid integer, got a number with a fractional part",
+    "int_type": "Input should be a valid integer",
+    "int_parsing_size": "Unable to parse input string as an integer, exceeded maximum size",
+    "finite_number": "Input should be a finite number",
+    "float_parsing": "Input should be a valid number, unable to parse string as a number",
+    "float_type": "Input should be a valid number",
+    "string_type": "Input should be a valid string",
+    "literal_error": "Input should be {expected}",
+}
+
+
 def validate_inputs(*, input_df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[dict]]:
     """
     Validates model inputs by checking for unprocessable values.
     - Applies preprocessing steps before validation.
-    - Uses Pydantic to enforce proper data formats.
-    - Returns cleaned data and errors if any exist.
+    - Checks every column of DataInputSchema at once with vectorized pandas/NumPy operations:
+      types, nullability, integer coercion and category membership.
+    - Returns cleaned data (numeric columns coerced from strings) and errors if any exist,
+      in the same JSON format as the Pydantic models produce.
     """
 
     # Apply preprocessing steps
@@ -27,33 +58,194 @@ def validate_inputs(*, input_df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[d
 
     # Select features from the configuration for validation
     validated_data = pre_processed[config.model_config_.features].copy()
+
+    # Collect (row, field position, error) so errors can be ordered row by row like Pydantic does
+    found = []
+    for position, (name, (kind, allowed)) in enumerate(_schema_fields().items()):
+        if name in validated_data.columns:
+            for row, error in _validate_column(validated_data[name], name, kind, allowed):
+                found.append((row, position, error))
+
+    if found:
+        found.sort(key=lambda item: (item[0], item[1]))
+        errors = json.dumps([error for _, _, error in found], separators=(",", ":"))
+        return validated_data, errors
+
+    # Numeric fields received as text (object columns) are converted once validated;
+    # every string here parses, and "nan" only converts when coercing
+    for name, (kind, _) in _schema_fields().items():
+        if kind in (int, float) and name in validated_data.columns and validated_data[name].dtype == object:
+            column = validated_data[name]
+            is_string = column.map(lambda value: isinstance(value, _TEXT_TYPES)).to_numpy(dtype=bool)
+            if kind is float:
+                text = _float_strings(column)
+            else:
+                # Through Python ints, so integers beyond 2**53 are not rounded by the string parser
+                text = _text(column[is_string]).map(lambda value: int(value.split(".")[0]))
+            validated_data[name] = pd.to_numeric(column.where(~is_string, text), errors="coerce")
+
+    return validated_data, None
+
+
+def _schema_fields() -> Dict[str, Tuple[Any, Optional[list]]]:
+    """
+    Reads DataInputSchema into {field: (kind, allowed values)}.
+    kind is int, float or str; allowed lists the permitted values of Literal fields.
+    """
+    fields = {}
+    for name, field in DataInputSchema.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        if get_origin(annotation) is Literal:
+            fields[name] = (str, list(get_args(annotation)))
+        else:
+            fields[name] = (annotation, None)
+    return fields
+
+
+# Values pydantic parses as text in int and float fields
+_TEXT_TYPES = (str, bytes, bytearray)
+
+
+def _decoded(value: Any) -> Any:
+    """Bytes as the UTF-8 text pydantic reads them as (and shows in its errors)."""
+    return bytes(value).decode("utf-8", "replace") if isinstance(value, (bytes, bytearray)) else value
+
+
+def _text(strings: pd.Series) -> pd.Series:
+    """Strings and bytes as stripped text."""
+    return strings.map(_decoded).astype(str).str.strip()
+
+
+def _float_strings(strings: pd.Series) -> pd.Series:
+    """
+    Text as pydantic parses it into a float: stripped, with the underscores between characters removed.
+    Text with leading, trailing or doubled underscores becomes "", which does not parse.
+    """
+    text = _text(strings)
+    return text.where(~text.str.contains(_MISPLACED_UNDERSCORE), "").str.replace("_", "", regex=False)
+
+
+def _error(error_type: str, row: int, name: str, value: Any, ctx: Optional[dict] = None) -> dict:
+    """Builds one error entry in the same shape as Pydantic's ValidationError.json()."""
+    error = {
+        "type": error_type,
+        "loc": ["inputs", row, name],
+        "msg": _MESSAGES[error_type].format(**(ctx or {})),
+        "input": value.item() if isinstance(value, np.generic) else _decoded(value),
+    }
+    if ctx:
+        error["ctx"] = ctx
+    error["url"] = f"https://errors.pydantic.dev/{version_short()}/v/{error_type}"
+    return error
+
+
+def _validate_column(column: pd.Series, name: str, kind: Any, allowed: Optional[list]) -> List[Tuple[int, dict]]:
+    """
+    Validates one column with vector operations and returns (row, error) for every failing cell.
+    Missing values (None/NaN) are accepted since every schema field is Optional.
+    """
+    present = ~column.isna().to_numpy()
+    values = column.to_numpy()
+    checks = {}  # error type -> mask of failing rows
+
+    # Split present values into numbers and strings; only mixed object columns need a per-value look
+    if column.dtype != object:
+        is_number = present & pd.api.types.is_numeric_dtype(column.dtype)
+        is_string = present & ~is_number
+    else:
+        inferred = pd.api.types.infer_dtype(column, skipna=True)
+        if inferred in ("string", "bytes", "empty"):
+            is_string, is_number = present, np.zeros(len(column), dtype=bool)
+        elif inferred in ("integer", "floating", "mixed-integer-float", "boolean", "decimal"):
+            is_number, is_string = present, np.zeros(len(column), dtype=bool)
+        else:
+            types = column.map(type)
+            is_number = present & types.map(lambda t: issubclass(t, numbers.Number)).to_numpy(dtype=bool)
+            is_string = present & types.map(lambda t: issubclass(t, _TEXT_TYPES)).to_numpy(dtype=bool)
+    is_other = present & ~is_number & ~is_string
+
+    if allowed is not None:
+        checks["literal_error"] = present & ~column.isin(allowed).to_numpy()
+
+    elif kind is str:
+        checks["string_type"] = is_number | is_other
+
+    elif kind is int:
+        if is_number.any():
+            numeric = column.where(is_number).astype(float).to_numpy()
+            finite = np.isfinite(numeric)
+            checks["finite_number"] = is_number & ~finite
+            checks["int_from_float"] = is_number & finite & (numeric != np.floor(np.where(finite, numeric, 0)))
+            checks["int_parsing_size"] = is_number & finite & (np.abs(np.where(finite, numeric, 0)) >= 2.0 ** 63)
+        if is_string.any():
+            text = _text(column.where(is_string, "0"))
+            matches = is_string & text.str.fullmatch(_INT_STRING).to_numpy(dtype=bool)
+            checks["int_parsing"] = is_string & ~matches
+            # Pydantic itself accepts longer integer strings, but the model's columns are int64
+            in_range = np.array([
+                _INT64_MIN <= int(value.split(".")[0]) <= _INT64_MAX if match else True for value, match in zip(text, matches)
+            ], dtype=bool)
+            checks["int_parsing_size"] = checks.get("int_parsing_size", False) | (matches & ~in_range)
+        checks["int_type"] = is_other
+
+    elif kind is float:
+        if is_string.any():
+            # Matched like pydantic does, so "nan", "inf" or "1_000" are accepted in either input shape
+            parsable = _float_strings(column.where(is_string, "0")).str.fullmatch(_FLOAT_STRING).to_numpy(dtype=bool)
+            checks["float_parsing"] = is_string & ~parsable
+        checks["float_type"] = is_other
+
+    failing = []
+    for error_type, mask in checks.items():
+        ctx = None
+        if error_type == "literal_error":
+            quoted = [repr(value) for value in allowed]
+            ctx = {"expected": " or ".join([", ".join(quoted[:-1]), quoted[-1]]) if len(quoted) > 1 else quoted[0]}
+        for row in np.flatnonzero(mask):
+            failing.append((int(row), _error(error_type, int(row), name, values[row], ctx)))
+    return failing
+
+
+def validate_record(*, record: dict) -> Tuple[dict, Optional[dict]]:
+    """
+    Validates a single input record without building a DataFrame.
+    - Keeps only the configured features, in feature order.
+    - Treats NaN as missing, like validate_inputs does.
+    - Returns errors in the same JSON format as validate_inputs.
+    """
+
+    validated_record = {}
+    for name in config.model_config_.features:
+        if name in record:
+            value = record[name]
+            validated_record[name] = None if isinstance(value, float) and np.isnan(value) else value
     errors = None
 
     try:
-        # Replace NaN values with None before validation
-        MultipleDataInputs(
-            inputs=validated_data.replace({np.nan: None}).to_dict(orient="records")
-        )
+        MultipleDataInputs(inputs=[validated_record])
     except ValidationError as error:
         errors = error.json()  # Capture validation errors
 
-    return validated_data, errors
+    return validated_record, errors
 
 
 class DataInputSchema(BaseModel):
     """
     Schema for validating individual input records.
     Defines expected types for each feature used in the model.
+    Categorical features only accept the categories the model knows.
     """
 
     id: Optional[int]
-    Gender: Optional[str]
+    Gender: Optional[Literal[tuple(config.model_config_.Gender_mappings)]]
     Age: Optional[int]
     Driving_License: Optional[int]
     Region_Code: Optional[int]
-    Vehicle_Age: Optional[str]
+    Vehicle_Age: Optional[Literal[tuple(config.model_config_.Vehicle_Age_categories)]]
     Previously_Insured: Optional[int]
-    Vehicle_Damage: Optional[str]
+    Vehicle_Damage: Optional[Literal[tuple(config.model_config_.Vehicle_Damage_categories)]]
     Annual_Premium: Optional[float]
     Policy_Sales_Channel: Optional[float]
     Vintage: Optional[int]
@@ -0,0 +1,210 @@
+import random
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from vehicleinsurance_model import __version__ as _version
+from vehicleinsurance_model.config.core import TRAINED_MODEL_DIR, config
+
+
+class ModelVersion:
+    """
+    Thread-safe, lazily loaded holder of one trained model version and its derived inference forms.
+    Nothing is read from disk, and scikit-learn is not even imported, until a model is first
+    requested or warmup() is called; concurrent first requests load it only once.
+    """
+
+    def __init__(self, version: str):
+        from vehicleinsurance_model.processing.data_manager import model_file_names
+
+        self.version = version
+        self.pipeline_file_name, self.bundle_file_name = model_file_names(version)  # In TRAINED_MODEL_DIR
+        self._lock = threading.RLock()
+        self._models: Dict[str, Any] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the pickled pipeline has been loaded."""
+        return "pipeline" in self._models
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Returns a cached model, creating it under the lock on first use."""
+        model = self._models.get(name)
+        if model is None:
+            with self._lock:
+                model = self._models.get(name)
+                if model is None:
+                    model = factory()
+                    self._models[name] = model
+        return model
+
+    def get_pipeline(self):
+        """The fitted vehicleinsurance_pipe loaded from its pickle."""
+        from vehicleinsurance_model.processing.data_manager import load_pipeline
+
+        return self._get("pipeline", lambda: load_pipeline(file_name=self.pipeline_file_name))
+
+    def get_fused_pipeline(self):
+        """The fused single-pass inference mode compiled from the loaded pipeline."""
+        from vehicleinsurance_model.processing.fused import FusedPipeline
+
+        return self._get(
+            "fused",
+            lambda: FusedPipeline.from_pipeline(self.get_pipeline(), input_features=config.model_config_.features),
+        )
+
+    def get_flat_forest(self):
+        """
+        The forest as flat node arrays.
+        Memory-mapped from the saved model bundle when there is one, otherwise flattened from the pipeline.
+        """
+        return self._get("flat_forest", self._load_flat_forest)
+
+    def _load_flat_forest(self):
+        from vehicleinsurance_model.processing.data_manager import load_pipeline_bundle
+        from vehicleinsurance_model.processing.forest import FlatForest
+
+        if (TRAINED_MODEL_DIR / self.bundle_file_name).is_dir():
+            return load_pipeline_bundle(file_name=self.bundle_file_name).estimator
+        return FlatForest.from_estimator(self.get_pipeline().steps[-1][1])
+
+    def warmup(self) -> None:
+        """Loads every inference form up front."""
+        self.get_pipeline()
+        self.get_fused_pipeline()
+        self.get_flat_forest()
+
+
+class ModelRegistry:
+    """
+    Versioned registry of the trained models in TRAINED_MODEL_DIR.
+
+    - One version is active and serves every request that does not name a version.
+    - activate() loads and warms another version first, then switches to it in a single
+      assignment, so requests in flight finish on the model they started with and no
+      request ever waits for a load.
+    - A candidate version can receive a percentage of the traffic for shadow scoring:
+      route_shadow() tells the caller when to score a request with it as well.
+    - Models of versions that are neither active, candidate nor the previous active
+      one (kept for a quick rollback) are dropped from memory after a switch.
+    """
+
+    def __init__(self, *, version: str):
+        self.active_version = version
+        self.previous_version: Optional[str] = None
+        self.candidate_version: Optional[str] = None
+        self.shadow_percent = 0.0
+        self.generation = 0  # Incremented every time the active model changes
+        self._lock = threading.RLock()
+        self._versions: Dict[str, ModelVersion] = {}
+
+    def model(self, version: Optional[str] = None) -> ModelVersion:
+        """The (lazily loaded) models of a version, the active one by default."""
+        version = version or self.active_version
+        model = self._versions.get(version)
+        if model is None:
+            with self._lock:
+                model = self._versions.setdefault(version, ModelVersion(version))
+        return model
+
+    @property
+    def pipeline_file_name(self) -> str:
+        return self.model().pipeline_file_name
+
+    @property
+    def bundle_file_name(self) -> str:
+        return self.model().bundle_file_name
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the active pipeline has been loaded."""
+        return self.active_version in self._versions and self._versions[self.active_version].loaded
+
+    def get_pipeline(self, version: Optional[str] = None):
+        """The fitted vehicleinsurance_pipe of a version, the active one by default."""
+        return self.model(version).get_pipeline()
+
+    def get_fused_pipeline(self, version: Optional[str] = None):
+        """The fused single-pass inference mode of a version, the active one by default."""
+        return self.model(version).get_fused_pipeline()
+
+    def get_flat_forest(self, version: Optional[str] = None):
+        """The flat node arrays of a version's forest, the active one by default."""
+        return self.model(version).get_flat_forest()
+
+    def warmup(self, version: Optional[str] = None) -> None:
+        """Loads every inference form of a version up front, e.g. at service startup."""
+        self.model(version).warmup()
+
+    def available_versions(self) -> List[str]:
+        """Versions saved in TRAINED_MODEL_DIR, newest first."""
+        from vehicleinsurance_model.processing.data_manager import list_model_versions
+
+        return list_model_versions()
+
+    def _check_available(self, version: str) -> None:
+        if version not in self.available_versions():
+            raise ValueError(f"Model version {version!r} is not saved in {TRAINED_MODEL_DIR}")
+
+    def activate(self, version: str) -> None:
+        """
+        Makes a saved version the active one.
+        The version is loaded and warmed before the switch, outside the registry lock,
+        so requests keep being served by the current model meanwhile.
+        """
+        self._check_available(version)
+        self.warmup(version)
+        with self._lock:
+            if version != self.active_version:
+                self.previous_version, self.active_version = self.active_version, version
+                self.generation += 1
+            if self.candidate_version == version:
+                self.candidate_version, self.shadow_percent = None, 0.0
+            self._evict()
+
+    def set_candidate(self, version: Optional[str], percent: float = 0.0) -> None:
+        """
+        Sends percent of the traffic to a candidate version for shadow scoring (None stops it).
+        The candidate is warmed before any traffic is routed to it.
+        """
+        if not 0.0 <= percent <= 100.0:
+            raise ValueError(f"Shadow traffic percentage must be between 0 and 100, got {percent}")
+        if version is not None:
+            self._check_available(version)
+            self.warmup(version)
+        with self._lock:
+            self.candidate_version = version
+            self.shadow_percent = percent if version is not None else 0.0
+            self._evict()
+
+    def route_shadow(self) -> Optional[str]:
+        """The candidate version when this request should also be shadow scored, else None."""
+        candidate, percent = self.candidate_version, self.shadow_percent
+        if candidate is not None and random.random() * 100 < percent:
+            return candidate
+        return None
+
+    def _evict(self) -> None:
+        """Drops the models of versions no longer needed. Called with the lock held."""
+        keep = {self.active_version, self.previous_version, self.candidate_version}
+        for version in [version for version in self._versions if version not in keep]:
+            del self._versions[version]
+
+    def status(self) -> dict:
+        """Active, previous and candidate versions, the shadow percentage and the versions on disk."""
+        return {
+            "active": self.active_version,
+            "previous": self.previous_version,
+            "candidate": self.candidate_version,
+            "shadow_percent": self.shadow_percent,
+            "loaded": sorted(version for version, model in self._versions.items() if model.loaded),
+            "available": self.available_versions(),
+        }
+
+    def clear(self) -> None:
+        """Drops all loaded models; the next request loads them again from disk."""
+        with self._lock:
+            self._versions.clear()
+            self.generation += 1
+
+
+# Registry of the trained models, serving the version matching the installed package by default
+model_registry = ModelRegistry(version=_version)
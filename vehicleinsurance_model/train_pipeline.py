@@ -5,53 +5,187 @@ file = Path(__file__).resolve()
 parent, root = file.parent, file.parents[1]
 
 # Add parent directory to Python's module search path
-sys.path.append(str(root))
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import argparse
+import hashlib
+import inspect
+import logging
+import time
+from typing import List, Optional, Tuple
 import pandas as pd
+from joblib import Memory
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_score
 
-from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model import __version__ as _version
+from vehicleinsurance_model.config.core import TRAINING_CACHE_DIR, config
+from vehicleinsurance_model.monitoring import logger
 from vehicleinsurance_model.pipeline import vehicleinsurance_pipe
 from vehicleinsurance_model.processing.data_manager import load_dataset, save_pipeline
+from vehicleinsurance_model.processing.profiling import PipelineProfiler
+from vehicleinsurance_model.processing.timing import StageTimer
 
 
+def data_fingerprint(X: pd.DataFrame, y: pd.Series) -> str:
+    """Digest of the training data's values and index, far cheaper to compute than joblib's pickle-based hash."""
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, X.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(X).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(y).to_numpy().tobytes())
+    return digest.hexdigest()
 
 
-def run_training() -> None:
+def transformers_code_key(steps: List[Tuple[str, object]]) -> str:
+    """
+    Digest of the code the transformers run: the source files defining their classes
+    (e.g. processing/features.py) and the package version.
+    """
+    digest = hashlib.sha256(_version.encode())
+    for source_file in sorted({inspect.getsourcefile(type(transformer)) for _, transformer in steps}):
+        digest.update(Path(source_file).read_bytes())
+    return digest.hexdigest()
+
+
+def fit_preprocessing(
+    steps: List[Tuple[str, object]],
+    X: pd.DataFrame,
+    y: pd.Series,
+    data_key: str = None,
+    code_key: str = None,
+    profiler: Optional[PipelineProfiler] = None,
+) -> Tuple[list, pd.DataFrame, list]:
+    """
+    Fits the preprocessing transformers one after the other.
+    Returns the fitted steps, the transformed training data and the fit time of each step.
+    data_key identifies X and y and code_key the transformers' code for the on-disk cache;
+    a profiler records every step's fit_transform.
+    """
+    fitted_steps, step_seconds = [], []
+    for name, transformer in steps:
+        start = time.perf_counter()
+        transformer = clone(transformer)
+        if profiler is not None:
+            X = profiler.run(name, lambda X: transformer.fit_transform(X, y), X)
+        else:
+            X = transformer.fit_transform(X, y)
+        fitted_steps.append((name, transformer))
+        step_seconds.append((name, time.perf_counter() - start))
+    return fitted_steps, X, step_seconds
+
+
+# Preprocessing output cached on disk, keyed on the transformers' parameters and code and the training
+# data fingerprint (X and y themselves are not hashed), so reruns that only change the forest's
+# hyperparameters skip it, and a change to the transformers refits them
+preprocessing_memory = Memory(location=TRAINING_CACHE_DIR, verbose=0)
+cached_fit_preprocessing = preprocessing_memory.cache(fit_preprocessing, ignore=["X", "y", "profiler"])
+
+
+def fit_forest(forest, X: pd.DataFrame, y: pd.Series, timer: StageTimer):
+    """
+    Fits the forest, growing it in steps of WARM_START_STEP trees when warm_start is enabled.
+    The trees' seeds are drawn in the same order either way, so the result is identical.
+    Returns the fitted forest.
+    """
+    if not forest.warm_start:
+        with timer.stage("fit model_rf"):
+            return forest.fit(X, y)
+
+    n_estimators, step = forest.n_estimators, config.model_config_.WARM_START_STEP
+    for n_trees in range(step, n_estimators + step, step):
+        forest.set_params(n_estimators=min(n_trees, n_estimators))
+        with timer.stage(f"fit model_rf ({forest.n_estimators} trees)"):
+            forest.fit(X, y)
+    return forest
+
+
+def run_training(
+    *,
+    use_cache: bool = None,
+    track_memory: bool = True,
+    model_version: Optional[str] = None,
+    data: Optional[pd.DataFrame] = None,
+    profiler: Optional[PipelineProfiler] = None,
+) -> StageTimer:
     """
     Function to train the model.
-    - Loads dataset.
+    - Loads dataset (or uses data, a DataFrame with the features and the target, e.g. synthetic records).
     - Splits data into training and testing sets.
-    - Fits the training data to the pipeline.
+    - Fits the preprocessing transformers, reusing cached output when enabled.
+    - Fits the forest on N_JOBS cores, optionally growing it with warm_start.
     - Evaluates model performance on test data.
-    - Saves the trained model pipeline for future use.
+    - Saves the trained model pipeline for future use, as model_version (default: the package version).
+    Prints and returns the wall time and peak memory of every stage.
+    With a profiler (processing.profiling.PipelineProfiler), the fit of every named pipeline step
+    is profiled instead; the preprocessing cache is then bypassed so every step really runs, and
+    the stage timer does not trace memory itself.
     """
+    use_cache = (config.app_config_.training_cache if use_cache is None else use_cache) and profiler is None
+    timer = StageTimer(track_memory=track_memory and profiler is None)
+    pipeline = clone(vehicleinsurance_pipe)  # Fresh unfitted copy, so every run starts from the configured steps
 
     # Step 1: Load the training dataset
-    data = load_dataset(file_name=config.app_config_.training_data_file)
+    with timer.stage("load"):
+        if data is None:
+            data = load_dataset(file_name=config.app_config_.training_data_file)
 
     # Step 2: Split data into training and test sets
-    X_train, X_test, y_train, y_test = train_test_split(
-        data[config.model_config_.features],  # Predictor variables
-        data[config.model_config_.target],  # Target variable
-        test_size=config.model_config_.TEST_SIZE,  # Test set proportion
-        random_state=config.model_config_.RANDOM_STATE,  # Random seed for reproducibility
-    )
+    with timer.stage("split"):
+        X_train, X_test, y_train, y_test = train_test_split(
+            data[config.model_config_.features],  # Predictor variables
+            data[config.model_config_.target].astype("int64"),  # Target variable, as int64 so the labels predicted keep their dtype
+            test_size=config.model_config_.TEST_SIZE,  # Test set proportion
+            random_state=config.model_config_.RANDOM_STATE,  # Random seed for reproducibility
+        )
 
-    # Step 3: Fit the pipeline with training data
-    vehicleinsurance_pipe.fit(X_train, y_train)
+    # Step 3: Fit the preprocessing transformers
+    preprocessing_steps = pipeline.steps[:-1]
+    data_key = data_fingerprint(X_train, y_train) if use_cache else None
+    code_key = transformers_code_key(preprocessing_steps) if use_cache else None
+    if use_cache and cached_fit_preprocessing.check_call_in_cache(preprocessing_steps, X_train, y_train, data_key, code_key):
+        with timer.stage("preprocessing (cached)"):
+            fitted_steps, Xt_train, _ = cached_fit_preprocessing(preprocessing_steps, X_train, y_train, data_key, code_key)
+    else:
+        fit = cached_fit_preprocessing if use_cache else fit_preprocessing
+        with timer.stage("preprocessing"):
+            fitted_steps, Xt_train, step_seconds = fit(preprocessing_steps, X_train, y_train, data_key, code_key, profiler=profiler)
+        for name, seconds in step_seconds:
+            timer.add(f"fit {name}", seconds, nested=True)
+    pipeline.steps[:-1] = fitted_steps
 
-    # Step 4: Generate predictions on test data
-    y_pred = vehicleinsurance_pipe.predict(X_test)
+    # Step 4: Fit the forest on the preprocessed training data
+    if profiler is not None:
+        profiler.add_rows(len(X_train))
+        forest = profiler.run("model_rf", lambda X: fit_forest(pipeline.steps[-1][1], X, y_train, timer), Xt_train)
+    else:
+        forest = fit_forest(pipeline.steps[-1][1], Xt_train, y_train, timer)
 
-    # Step 5: Evaluate model performance
-    print("Accuracy score:", round(accuracy_score(y_test, y_pred), 2))  # Overall classification accuracy
-    print("Precision score:", precision_score(y_test, y_pred))  # Precision for positive predictions
+    # Step 5: Generate predictions on test data and evaluate model performance
+    with timer.stage("evaluate"):
+        y_pred = pipeline.predict(X_test)
+    logger.info("Accuracy score: %s", round(accuracy_score(y_test, y_pred), 2))  # Overall classification accuracy
+    logger.info("Precision score: %s", precision_score(y_test, y_pred))  # Precision for positive predictions
 
     # Step 6: Save the trained model pipeline
-    save_pipeline(pipeline_to_persist=vehicleinsurance_pipe)
+    # Inference runs single-threaded per call; callers parallelise across requests or shards
+    forest.set_params(n_jobs=None)
+    with timer.stage("save"):
+        save_pipeline(pipeline_to_persist=pipeline, model_version=model_version)
+
+    logger.info("Training stages:\n%s", timer.report())
+    return timer
 
 
 # Run the training function when script is executed directly
 if __name__ == "__main__":
-    run_training()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Train the model and save it to TRAINED_MODEL_DIR.")
+    parser.add_argument("--model-version", default=None, help="Version to save the model as (default: the package version)")
+    parser.add_argument("--profile", default=None, help="Profile the fit of every pipeline step and write the report to this JSON file")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    profiler = PipelineProfiler(label=args.model_version or _version) if args.profile else None
+    run_training(model_version=args.model_version, profiler=profiler)
+    if profiler is not None:
+        profiler.save(args.profile)
+        logger.info("Pipeline profile written to %s:\n%s", args.profile, profiler.report())
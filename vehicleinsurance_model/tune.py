@@ -0,0 +1,190 @@
+import sys
+from pathlib import Path
+# Dynamically resolve file paths for module imports
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+
+# Add parent directory to Python's module search path
+if str(root) not in sys.path:
+    sys.path.append(str(root))
+import argparse
+import logging
+import math
+import time
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, precision_score
+from sklearn.model_selection import ParameterSampler, StratifiedKFold, train_test_split
+
+from vehicleinsurance_model.config.core import config
+from vehicleinsurance_model.monitoring import logger
+from vehicleinsurance_model.pipeline import vehicleinsurance_pipe
+from vehicleinsurance_model.processing.data_manager import load_dataset
+from vehicleinsurance_model.train_pipeline import fit_preprocessing
+
+# config.yml algorithm parameters and the RandomForestClassifier arguments they set
+PARAMETER_NAMES = {
+    "N_ESTIMATORS": "n_estimators",
+    "MAX_DEPTH": "max_depth",
+    "MIN_SAMPLES_SPLIT": "min_samples_split",
+    "MIN_SAMPLES_LEAF": "min_samples_leaf",
+    "CRITERION": "criterion",
+}
+
+
+def sample_candidates(n_candidates: int, random_state: int) -> List[dict]:
+    """Draws up to n_candidates distinct parameter combinations from config.yml's search_space."""
+    search_space = config.model_config_.search_space.model_dump()
+    n_combinations = math.prod(len(values) for values in search_space.values())
+    sampler = ParameterSampler(search_space, n_iter=min(n_candidates, n_combinations), random_state=random_state)
+    return [{name: params[name] for name in PARAMETER_NAMES} for params in sampler]
+
+
+def prepare_folds(X: pd.DataFrame, y: pd.Series, n_folds: int, random_state: int) -> list:
+    """
+    Splits the training data into cross-validation folds and preprocesses each fold once.
+    The transformers are fitted on the fold's training part only; every candidate then
+    reuses the resulting float32 matrices instead of re-running the preprocessing.
+    """
+    folds = []
+    splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state)
+    for train_index, valid_index in splitter.split(X, y):
+        fitted_steps, Xt_train, _ = fit_preprocessing(vehicleinsurance_pipe.steps[:-1], X.iloc[train_index], y.iloc[train_index])
+        Xt_valid = X.iloc[valid_index]
+        for _, step in fitted_steps:
+            Xt_valid = step.transform(Xt_valid)
+        folds.append((
+            np.asarray(Xt_train, dtype=np.float32), y.iloc[train_index].to_numpy(),
+            np.asarray(Xt_valid, dtype=np.float32), y.iloc[valid_index].to_numpy(),
+        ))
+    return folds
+
+
+def evaluate_candidate(params: dict, fold: tuple, n_rows: int) -> dict:
+    """
+    Fits one candidate on the first n_rows training rows of one fold and scores
+    it on the fold's validation part, timing how long prediction takes per row.
+    """
+    X_train, y_train, X_valid, y_valid = fold
+    forest = clone(vehicleinsurance_pipe.steps[-1][1]).set_params(
+        **{PARAMETER_NAMES[name]: value for name, value in params.items()}, n_jobs=1, warm_start=False
+    )
+
+    start = time.perf_counter()
+    forest.fit(X_train[:n_rows], y_train[:n_rows])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = forest.predict(X_valid)
+    latency_us = (time.perf_counter() - start) / len(X_valid) * 1e6
+
+    return {
+        "accuracy": accuracy_score(y_valid, y_pred),
+        "precision": precision_score(y_valid, y_pred, zero_division=0),
+        "fit_seconds": fit_seconds,
+        "latency_us_per_row": latency_us,
+    }
+
+
+def run_candidates(candidates: List[dict], folds: list, n_jobs: int, n_rows: int) -> pd.DataFrame:
+    """
+    Cross-validates every candidate, one (candidate, fold) task per worker process.
+    Returns one row per candidate with its parameters and fold-averaged metrics.
+    """
+    scores = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(evaluate_candidate)(params, fold, n_rows) for params in candidates for fold in folds
+    )
+    results = pd.DataFrame(scores)
+    results["candidate"] = np.repeat(np.arange(len(candidates)), len(folds))
+    results = results.groupby("candidate").mean()
+    return pd.concat([pd.DataFrame(candidates), results.reset_index(drop=True)], axis=1)
+
+
+def tune(
+    *,
+    strategy: str = "random",
+    n_candidates: Optional[int] = None,
+    n_folds: Optional[int] = None,
+    n_jobs: int = -1,
+    random_state: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Cross-validated hyperparameter search over config.yml's search_space.
+
+    - strategy="random": every sampled candidate is cross-validated on the full training folds.
+    - strategy="halving": successive halving; all candidates start on a small share of the
+      training rows, and after each round only the best 1/TUNE_HALVING_FACTOR continue
+      with TUNE_HALVING_FACTOR times more rows, until the last round uses them all.
+    Candidates are ranked by TUNE_SCORING and logged with their accuracy, precision and
+    prediction latency per row. Returns the results of every round.
+    """
+    model_config = config.model_config_
+    n_candidates = n_candidates or model_config.TUNE_N_CANDIDATES
+    n_folds = n_folds or model_config.TUNE_CV_FOLDS
+    random_state = model_config.RANDOM_STATE if random_state is None else random_state
+    if strategy not in ("random", "halving"):
+        raise ValueError(f"Unknown search strategy {strategy!r}, expected 'random' or 'halving'")
+
+    # Tune on the training split only, so the test split stays untouched for run_training
+    data = load_dataset(file_name=config.app_config_.training_data_file)
+    X_train, _, y_train, _ = train_test_split(
+        data[model_config.features],
+        data[model_config.target],
+        test_size=model_config.TEST_SIZE,
+        random_state=model_config.RANDOM_STATE,
+    )
+    folds = prepare_folds(X_train, y_train, n_folds, random_state)
+    candidates = sample_candidates(n_candidates, random_state)
+
+    # Successive halving grows the training rows by the halving factor each round, up to the full folds
+    factor = model_config.TUNE_HALVING_FACTOR
+    n_rounds = 1 if strategy == "random" else math.ceil(math.log(len(candidates), factor)) + 1
+    fold_rows = len(folds[0][0])
+
+    all_results = []
+    for round_index in range(n_rounds):
+        n_rows = fold_rows // factor ** (n_rounds - 1 - round_index)
+        results = run_candidates(candidates, folds, n_jobs=n_jobs, n_rows=n_rows)
+        results = results.sort_values(model_config.TUNE_SCORING, ascending=False).reset_index(drop=True)
+        results.insert(0, "round", round_index)
+        results.insert(1, "n_rows", n_rows)
+        all_results.append(results)
+
+        logger.info("Round %d/%d: %d candidates on %d rows per fold", round_index + 1, n_rounds, len(candidates), n_rows)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", results.drop(columns=["round", "n_rows"]).to_string(index=False, float_format=lambda value: f"{value:.4f}"))
+
+        # Successive halving keeps the best 1/factor candidates for the next round
+        if strategy == "halving":
+            survivors = results.head(math.ceil(len(candidates) / factor))
+            candidates = survivors[list(PARAMETER_NAMES)].to_dict(orient="records")
+
+    best = all_results[-1].iloc[0]
+    logger.info(
+        "Best candidate by %s: %s", model_config.TUNE_SCORING, ", ".join(f"{name}={best[name]}" for name in PARAMETER_NAMES)
+    )
+
+    return pd.concat(all_results, ignore_index=True)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cross-validated hyperparameter search over config.yml's search_space.")
+    parser.add_argument("--strategy", choices=["random", "halving"], default="random", help="Search strategy")
+    parser.add_argument("--n-candidates", type=int, default=None, help="Candidates to sample (default TUNE_N_CANDIDATES)")
+    parser.add_argument("--folds", type=int, default=None, help="Cross-validation folds (default TUNE_CV_FOLDS)")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Worker processes (-1 for all cores)")
+    parser.add_argument("--output", default=None, help="Optional CSV file to write all results to")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    results = tune(strategy=args.strategy, n_candidates=args.n_candidates, n_folds=args.folds, n_jobs=args.n_jobs)
+    if args.output:
+        results.to_csv(args.output, index=False)
+
+
+# Run the search when script is executed directly
+if __name__ == "__main__":
+    main()